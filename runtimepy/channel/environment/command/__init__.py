@@ -25,6 +25,7 @@ from runtimepy.channel.environment.command.processor import (
     CommandHook,
     EnvironmentMap,
 )
+from runtimepy.channel.history import DEFAULT_CAPACITY, HistoryRecorder
 from runtimepy.channel.registry import ParsedEvent
 from runtimepy.mapping import DEFAULT_PATTERN
 
@@ -55,6 +56,9 @@ class GlobalEnvironment(UserDict[str, ChannelCommandProcessor], LoggerMixin):
         LoggerMixin.__init__(self)
         self.root: Optional[Path] = root
 
+        # In-memory channel history (by environment name).
+        self.history: dict[str, HistoryRecorder] = {}
+
     @staticmethod
     def from_root(root: Path) -> "GlobalEnvironment":
         """Load a global environment from a directory."""
@@ -217,9 +221,46 @@ class GlobalEnvironment(UserDict[str, ChannelCommandProcessor], LoggerMixin):
 
         self.write_meta(metadata)
 
+    def record_history(
+        self,
+        env: str,
+        pattern: str = DEFAULT_PATTERN,
+        exact: bool = False,
+        capacity: int = DEFAULT_CAPACITY,
+    ) -> list[str]:
+        """
+        Begin recording in-memory history for an environment's channels.
+        Returns a list of all channels recorded.
+        """
+
+        recorder = self.history.get(env)
+        if recorder is None:
+            recorder = HistoryRecorder(capacity)
+            self.history[env] = recorder
+            self[env].env.channels.consume()
+
+        names = []
+        for name, chan in self[env].env.channels.search(pattern, exact=exact):
+            recorder.track(name, chan.raw, capacity=capacity)
+            names.append(name)
+
+        return names
+
+    def stop_history(self, env: str = None) -> None:
+        """Stop recording history for an environment (or all environments)."""
+
+        for name in list(self.history if env is None else [env]):
+            recorder = self.history.pop(name, None)
+            if recorder is not None:
+                recorder.untrack()
+                if name in self:
+                    self[name].env.channels.consume(-1)
+
     def clear(self) -> None:
         """Log environments that get cleared when clearing."""
 
+        self.stop_history()
+
         envs = list(self)
         if envs:
             super().clear()
@@ -0,0 +1,195 @@
+"""
+A module implementing channel environments published through shared memory.
+
+Segments contain a header followed by a (little-endian) primitive-array
+buffer of every channel in the environment:
+
+    4s magic | u32 array size | u64 sequence | u64 timestamp (ns) | array
+
+The sequence number is odd while a write is in progress, readers retry until
+they copy the array with the same (even) sequence number before and after.
+"""
+
+# built-in
+from multiprocessing.shared_memory import SharedMemory
+import struct
+from typing import Any, NamedTuple, Optional
+
+# third-party
+from vcorelib.math import default_time_ns
+
+# internal
+from runtimepy.channel.environment import ChannelEnvironment
+from runtimepy.primitives import AnyPrimitive, create
+from runtimepy.primitives.array import PrimitiveArray
+from runtimepy.primitives.byte_order import ByteOrder
+
+SHARED_MAGIC = b"RPSE"
+HEADER = struct.Struct("<4sIQQ")
+SEQUENCE = struct.Struct("<Q")
+SEQUENCE_OFFSET = 8
+
+# The number of attempts made to read a consistent snapshot.
+READ_ATTEMPTS = 1000
+
+
+class SharedEnvironmentLayout(NamedTuple):
+    """Information needed to attach to a shared environment."""
+
+    segment: str
+    size: int
+
+    # (name, primitive kind) for each channel, in array order.
+    channels: list[tuple[str, str]]
+
+    def asdict(self) -> dict[str, Any]:
+        """Get this layout as a dictionary (e.g. for messages)."""
+        return {
+            "segment": self.segment,
+            "size": self.size,
+            "channels": self.channels,
+        }
+
+    @staticmethod
+    def create(data: dict[str, Any]) -> "SharedEnvironmentLayout":
+        """Create a layout from a dictionary."""
+
+        return SharedEnvironmentLayout(
+            str(data["segment"]),
+            int(data["size"]),
+            [(str(name), str(kind)) for name, kind in data["channels"]],
+        )
+
+
+class SharedEnvironmentWriter:
+    """A class for publishing a channel environment to shared memory."""
+
+    def __init__(self, env: ChannelEnvironment, name: str = None) -> None:
+        """Initialize this instance."""
+
+        # Bit-fields are published through their underlying primitives (as
+        # channels), so only regular channels are included.
+        names = [x for x in env.names if env.get(x) is not None]
+
+        self.array = env.array(names, byte_order=ByteOrder.LITTLE_ENDIAN).array
+
+        self.memory = SharedMemory(
+            name=name, create=True, size=HEADER.size + self.array.size
+        )
+        self.sequence = 0
+
+        self.layout = SharedEnvironmentLayout(
+            self.memory.name,
+            self.array.size,
+            [(x, str(env[x][0].raw.kind)) for x in names],
+        )
+
+        buf = self.memory.buf
+        assert buf is not None
+        HEADER.pack_into(buf, 0, SHARED_MAGIC, self.array.size, 0, 0)
+        self.publish()
+
+    def publish(self, timestamp_ns: int = None) -> None:
+        """Write the environment's current values to shared memory."""
+
+        if timestamp_ns is None:
+            timestamp_ns = default_time_ns()
+
+        buf = self.memory.buf
+        assert buf is not None
+
+        self.sequence += 1
+        SEQUENCE.pack_into(buf, SEQUENCE_OFFSET, self.sequence)
+
+        buf[HEADER.size : HEADER.size + self.array.size] = bytes(self.array)
+
+        self.sequence += 1
+        HEADER.pack_into(
+            buf, 0, SHARED_MAGIC, self.array.size, self.sequence, timestamp_ns
+        )
+
+    def close(self) -> None:
+        """Release (and remove) the shared-memory segment."""
+
+        self.memory.close()
+        self.memory.unlink()
+
+
+class SharedEnvironmentReader:
+    """A class for reading a channel environment from shared memory."""
+
+    def __init__(self, layout: SharedEnvironmentLayout) -> None:
+        """Initialize this instance."""
+
+        self.layout = layout
+        # Segments are owned (and removed) by writers.
+        self.memory = SharedMemory(name=layout.segment)
+
+        self.primitives: dict[str, AnyPrimitive] = {
+            name: create(kind) for name, kind in layout.channels
+        }
+        self.array = PrimitiveArray(
+            *self.primitives.values(), byte_order=ByteOrder.LITTLE_ENDIAN
+        )
+        assert self.array.size == layout.size, (self.array.size, layout.size)
+
+        buf = self.memory.buf
+        assert buf is not None
+        magic, size, _, _ = HEADER.unpack_from(buf)
+        assert magic == SHARED_MAGIC and size == layout.size, (magic, size)
+
+        self.sequence = 0
+        self.timestamp_ns = 0
+
+    def snapshot(self) -> Optional[bytes]:
+        """Copy a consistent snapshot of the array buffer."""
+
+        buf = self.memory.buf
+        assert buf is not None
+
+        for _ in range(READ_ATTEMPTS):
+            _, _, before, timestamp_ns = HEADER.unpack_from(buf)
+            if before % 2 == 0:
+                data = bytes(buf[HEADER.size : HEADER.size + self.layout.size])
+                if SEQUENCE.unpack_from(buf, SEQUENCE_OFFSET)[0] == before:
+                    self.sequence = before
+                    self.timestamp_ns = timestamp_ns
+                    return data
+
+        return None
+
+    def read(self) -> bool:
+        """
+        Update primitives from shared memory. Returns False if a consistent
+        snapshot couldn't be read or nothing was published since the last
+        read.
+        """
+
+        last = self.sequence
+        data = self.snapshot()
+        if data is None or self.sequence == last:
+            return False
+
+        self.array.update(data, timestamp_ns=self.timestamp_ns)
+        return True
+
+    def __getitem__(self, name: str) -> int | float | bool:
+        """Get the most recently read value of a channel."""
+        return self.primitives[name].value
+
+    def values(self) -> dict[str, int | float | bool]:
+        """Get the most recently read values of all channels."""
+        return {name: prim.value for name, prim in self.primitives.items()}
+
+    def environment(self) -> ChannelEnvironment:
+        """Create a channel environment backed by this reader's primitives."""
+
+        env = ChannelEnvironment()
+        for name, prim in self.primitives.items():
+            env.channel(name, prim)
+        env.finalize()
+        return env
+
+    def close(self) -> None:
+        """Detach from the shared-memory segment."""
+        self.memory.close()
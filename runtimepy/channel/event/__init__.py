@@ -89,10 +89,12 @@ class PrimitiveEvent:
             self.prev_ns = curr_ns
             self.header["timestamp"] = curr_ns
 
-            # Write header then value.
+            # Write header then value (as a single write, so that readers of
+            # unbuffered streams never observe a partial event).
             array = self.header
-            written += array.to_stream(stream)
-            written += raw.to_stream(stream, byte_order=array.byte_order)
+            data = bytes(array) + raw.binary(byte_order=array.byte_order)
+            stream.write(data)
+            written += len(data)
             if flush:
                 stream.flush()
 
@@ -0,0 +1,220 @@
+"""
+A module implementing bounded, in-memory channel-value history.
+"""
+
+# built-in
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import suppress
+import sys
+from typing import Any, Iterable, NamedTuple, Optional
+
+# internal
+from runtimepy.primitives import AnyPrimitive
+from runtimepy.primitives.types.base import PrimitiveType
+
+DEFAULT_CAPACITY = 4096
+
+# Array type codes for struct formats that 'array' doesn't support.
+ARRAY_CODES = {"?": "B", "e": "f"}
+
+# Timestamps are signed, 64-bit nanosecond counts.
+TIMESTAMP_CODE = "q"
+TIMESTAMP_DTYPE = "<i8"
+
+
+def array_code(kind: PrimitiveType[Any]) -> str:
+    """Get an array type code for storing values of a primitive type."""
+    return ARRAY_CODES.get(kind.format, kind.format)
+
+
+def code_dtype(code: str, boolean: bool = False) -> str:
+    """
+    Get a (little-endian, numpy-compatible) data-type string for an array
+    type code.
+    """
+
+    if boolean:
+        letter = "b"
+    elif code in "fd":
+        letter = "f"
+    else:
+        letter = "i" if code.islower() else "u"
+
+    return f"<{letter}{array(code).itemsize}"
+
+
+def array_dtype(kind: PrimitiveType[Any]) -> str:
+    """Get a data-type string for values of a primitive type."""
+    return code_dtype(array_code(kind), boolean=kind.is_boolean)
+
+
+# Array type codes (by data-type string).
+DTYPE_CODES = {code_dtype(code): code for code in "bBhHiIqQfd"}
+DTYPE_CODES[code_dtype("B", boolean=True)] = "B"
+
+
+def little_endian(data: array[Any]) -> bytes:
+    """Get the contents of an array as little-endian bytes."""
+
+    if sys.byteorder != "little":  # pragma: nocover
+        data = array(data.typecode, data)
+        data.byteswap()
+
+    return data.tobytes()
+
+
+class HistorySelection(NamedTuple):
+    """Channel history within a time range."""
+
+    name: str
+    kind: PrimitiveType[Any]
+    timestamps: array[int]
+    values: array[Any]
+
+    @property
+    def dtype(self) -> str:
+        """The data type of this selection's values."""
+        return array_dtype(self.kind)
+
+    def __len__(self) -> int:
+        """Get the number of points in this selection."""
+        return len(self.timestamps)
+
+
+class ChannelHistory:
+    """A ring buffer of a primitive's values and update times."""
+
+    def __init__(
+        self, primitive: AnyPrimitive, capacity: int = DEFAULT_CAPACITY
+    ) -> None:
+        """Initialize this instance."""
+
+        assert capacity > 0, capacity
+
+        self.primitive = primitive
+        self.capacity = capacity
+
+        self.timestamps = array(TIMESTAMP_CODE, [0]) * capacity
+        self.values: array[Any] = (
+            array(array_code(primitive.kind), [0]) * capacity
+        )
+
+        # The next index to write and the number of valid points.
+        self.head = 0
+        self.count = 0
+
+        self.callback: Optional[int] = None
+
+    def __len__(self) -> int:
+        """Get the number of recorded points."""
+        return self.count
+
+    def record(self, value: int | float | bool, timestamp_ns: int) -> None:
+        """Record a point."""
+
+        head = self.head
+        self.timestamps[head] = timestamp_ns
+        self.values[head] = value
+
+        self.head = (head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def poll(self) -> None:
+        """Record the primitive's current value."""
+        self.record(self.primitive.value, self.primitive.last_updated_ns)
+
+    def start(self) -> None:
+        """Begin recording primitive updates."""
+
+        if self.callback is None:
+            self.poll()
+            self.callback = self.primitive.register_callback(
+                lambda _, __: self.poll()
+            )
+
+    def stop(self) -> None:
+        """Stop recording primitive updates."""
+
+        if self.callback is not None:
+            self.primitive.remove_callback(self.callback)
+            self.callback = None
+
+    def ordered(self) -> tuple[array[int], array[Any]]:
+        """Get copies of recorded timestamps and values (oldest first)."""
+
+        if self.count < self.capacity:
+            return self.timestamps[: self.count], self.values[: self.count]
+
+        head = self.head
+        return (
+            self.timestamps[head:] + self.timestamps[:head],
+            self.values[head:] + self.values[:head],
+        )
+
+    def select(
+        self, name: str, start_ns: int = None, end_ns: int = None
+    ) -> HistorySelection:
+        """Get recorded points within a (closed) time range."""
+
+        timestamps, values = self.ordered()
+
+        begin = 0 if start_ns is None else bisect_left(timestamps, start_ns)
+        end = (
+            len(timestamps)
+            if end_ns is None
+            else bisect_right(timestamps, end_ns, lo=begin)
+        )
+
+        return HistorySelection(
+            name,
+            self.primitive.kind,
+            timestamps[begin:end],
+            values[begin:end],
+        )
+
+
+class HistoryRecorder:
+    """A class for recording the history of multiple channels."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Initialize this instance."""
+
+        self.capacity = capacity
+        self.channels: dict[str, ChannelHistory] = {}
+
+    def track(
+        self, name: str, primitive: AnyPrimitive, capacity: int = None
+    ) -> ChannelHistory:
+        """Begin recording a primitive's history (if necessary)."""
+
+        history = self.channels.get(name)
+        if history is None or history.primitive is not primitive:
+            if history is not None:
+                history.stop()
+
+            history = ChannelHistory(primitive, capacity or self.capacity)
+            self.channels[name] = history
+
+        history.start()
+        return history
+
+    def untrack(self, names: Iterable[str] = None) -> None:
+        """Stop recording (and discard) specific channels (or all channels)."""
+
+        for name in list(self.channels if names is None else names):
+            with suppress(KeyError):
+                self.channels.pop(name).stop()
+
+    def select(
+        self,
+        names: Iterable[str] = None,
+        start_ns: int = None,
+        end_ns: int = None,
+    ) -> list[HistorySelection]:
+        """Get recorded points for channels within a time range."""
+
+        return [
+            self.channels[name].select(name, start_ns=start_ns, end_ns=end_ns)
+            for name in (self.channels if names is None else names)
+        ]
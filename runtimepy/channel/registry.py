@@ -70,6 +70,7 @@ class ChannelRegistry(_Registry[_Channel[_Any]]):
     event_header: Protocol
     event_fifo: ByteFifo
     header_ready: bool
+    consumers: int
 
     @property
     def kind(self) -> type[_Channel[_Any]]:
@@ -84,6 +85,14 @@ class ChannelRegistry(_Registry[_Channel[_Any]]):
         self.header_ready = False
         self.event_fifo = ByteFifo()
 
+        # The number of downstream consumers of these channels' values (event
+        # streams, recorders, shown UI tabs and transmit framers).
+        self.consumers = 0
+
+    def consume(self, count: int = 1) -> None:
+        """Update the number of downstream consumers of these channels."""
+        self.consumers = max(self.consumers + count, 0)
+
     def channel(
         self,
         name: str,
@@ -160,4 +169,8 @@ class ChannelRegistry(_Registry[_Channel[_Any]]):
                 )
                 names.append(name)
 
+            if names:
+                self.consume()
+                stack.callback(self.consume, -1)
+
             yield names
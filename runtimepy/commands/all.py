@@ -17,6 +17,7 @@ from vcorelib.args import CommandRegister as _CommandRegister
 
 # internal
 from runtimepy.commands.arbiter import add_arbiter_cmd
+from runtimepy.commands.benchmark import add_benchmark_cmd
 from runtimepy.commands.mtu import add_mtu_cmd
 from runtimepy.commands.server import add_server_cmd
 from runtimepy.commands.task import add_task_cmd
@@ -33,6 +34,11 @@ def commands() -> _List[_Tuple[str, str, _CommandRegister]]:
             "run a connection-arbiter application from a config",
             add_arbiter_cmd,
         ),
+        (
+            "benchmark",
+            "benchmark event loops and message encoding",
+            add_benchmark_cmd,
+        ),
         (
             "mtu",
             "probe for MTU size to some endpoint",
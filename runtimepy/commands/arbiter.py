@@ -12,8 +12,13 @@ from vcorelib.args import CommandFunction as _CommandFunction
 from vcorelib.asyncio import run_handle_stop as _run_handle_stop
 
 # internal
-from runtimepy.commands.common import arbiter_args, curses_wrap_if
+from runtimepy.commands.common import (
+    arbiter_args,
+    curses_wrap_if,
+    loop_tuning,
+)
 from runtimepy.net.arbiter import ConnectionArbiter
+from runtimepy.net.arbiter.tuning import LoopTuning
 from runtimepy.tui.channels import CursesWindow as _CursesWindow
 
 
@@ -30,6 +35,9 @@ async def entry(
 
     await arbiter.load_configs(args.configs, wait_for_stop=args.wait_for_stop)
 
+    # Command-line settings take precedence.
+    arbiter.tuning = arbiter.tuning.update(**loop_tuning(args))
+
     return await arbiter.app()
 
 
@@ -41,9 +49,18 @@ def app(args: _Namespace) -> int:
     if args.init_only:
         stop_sig.set()
 
+    # The event loop is created before configuration data is loaded, so
+    # the implementation can only be selected on the command line.
+    eloop = None
+    if args.loop:
+        eloop = LoopTuning.create(
+            {"implementation": args.loop}
+        ).new_event_loop()
+
     return _run_handle_stop(
         stop_sig,
         entry(stop_sig, args, window=args.window),
+        eloop=eloop,
         enable_uvloop=not getattr(args, "no_uvloop", False),
     )
 
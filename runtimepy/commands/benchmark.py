@@ -0,0 +1,331 @@
+"""
+An entry-point for the 'benchmark' command.
+"""
+
+# built-in
+from argparse import ArgumentParser as _ArgumentParser
+from argparse import Namespace as _Namespace
+import asyncio
+from logging import getLogger as _getLogger
+from time import perf_counter
+from typing import Any
+
+# third-party
+from vcorelib.args import CommandFunction as _CommandFunction
+
+# internal
+from runtimepy.commands.common import loop_tuning, loop_tuning_args
+from runtimepy.message.backend import (
+    BINARY_BACKENDS,
+    JSON_BACKENDS,
+    JsonBackend,
+    binary_backend,
+    json_backend,
+)
+from runtimepy.net.arbiter.tuning import LoopImplementation, LoopTuning
+from runtimepy.net.manager import ConnectionManager
+from runtimepy.net.server.websocket.state import TabStates
+from runtimepy.net.tcp.connection import NullTcpConnection
+from runtimepy.task.basic.schedule import DeadlineScheduler
+
+LOG = _getLogger(__name__)
+
+SUITES = ["loop", "json", "tabs"]
+
+# A representative UI-frame message.
+SAMPLE_MESSAGE = {
+    "ui": {
+        "time": 1234.5,
+        "env": {
+            "points": {
+                f"channel{idx}": [[float(x), x * 1000] for x in range(10)]
+                for idx in range(10)
+            },
+        },
+    },
+    "__id__": 5,
+}
+
+
+def implementations(args: _Namespace) -> list[LoopImplementation]:
+    """Get the event-loop implementations to benchmark."""
+
+    if args.loop:
+        return [LoopImplementation(args.loop)]
+
+    result = [LoopImplementation.ASYNCIO]
+    try:
+        # pylint: disable=import-outside-toplevel,unused-import
+        import uvloop  # noqa
+
+        result.append(LoopImplementation.UVLOOP)
+    except ImportError:  # pragma: nocover
+        pass
+
+    return result
+
+
+async def benchmark_connection_churn(
+    count: int = 10000, concurrency: int = 100, host: str = "127.0.0.1"
+) -> float:
+    """
+    Measure the rate (in connections per second) at which a connection
+    manager supervises loopback connections being opened and closed.
+    """
+
+    manager = ConnectionManager()
+    stop_sig = asyncio.Event()
+    accepted = 0
+
+    def callback(conn: NullTcpConnection) -> None:
+        """Enqueue a new connection."""
+
+        nonlocal accepted
+        accepted += 1
+        manager.queue.put_nowait(conn)
+
+    async with NullTcpConnection.serve(callback, host=host, port=0) as server:
+        port = server.sockets[0].getsockname()[1]
+        managing = asyncio.create_task(manager.manage(stop_sig))
+
+        start = perf_counter()
+
+        for idx in range(0, count, concurrency):
+            clients = await asyncio.gather(
+                *(
+                    asyncio.open_connection(host, port)
+                    for _ in range(min(concurrency, count - idx))
+                )
+            )
+            for _, writer in clients:
+                writer.close()
+
+        # Wait for every server-side connection to be accepted and dropped.
+        while accepted < count or manager.num_connections:
+            await asyncio.sleep(0.001)
+
+        elapsed = perf_counter() - start
+
+        stop_sig.set()
+        await managing
+
+    return count / max(elapsed, 1e-9)
+
+
+async def _benchmark_loop_tuning(
+    tuning: LoopTuning, iterations: int, period_s: float, connections: int
+) -> dict[str, float]:
+    """Measure task jitter and connection throughput."""
+
+    tuning.initialized()
+
+    scheduler = DeadlineScheduler()
+    scheduler.start()
+
+    total_s = 0.0
+    for _ in range(iterations):
+        await scheduler.wait(period_s)
+        total_s += scheduler.metrics.jitter_s.value
+
+    return {
+        "jitter_s": total_s / max(iterations, 1),
+        "max_jitter_s": scheduler.metrics.max_jitter_s.value,
+        "skipped": float(scheduler.metrics.skipped.value),
+        "connections_per_s": (
+            await benchmark_connection_churn(count=connections)
+            if connections > 0
+            else 0.0
+        ),
+    }
+
+
+def benchmark_loop_tuning(
+    tuning: LoopTuning,
+    iterations: int = 1000,
+    period_s: float = 0.001,
+    connections: int = 1000,
+) -> dict[str, float]:
+    """
+    Measure periodic-task jitter and connection throughput for event-loop
+    settings (on a new event loop).
+    """
+
+    loop = tuning.new_event_loop()
+
+    try:
+        tuning.apply(loop)
+        return loop.run_until_complete(
+            _benchmark_loop_tuning(tuning, iterations, period_s, connections)
+        )
+    finally:
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+        tuning.restore()
+
+
+def benchmark_json_backend(
+    backend: JsonBackend, message: Any, count: int = 10000
+) -> tuple[float, float]:
+    """
+    Measure the encode and decode rates (in messages per second) of a JSON
+    backend for a given message.
+    """
+
+    dumps_fn = backend.dumps
+    loads_fn = backend.loads
+    encoded = dumps_fn(message)
+
+    start = perf_counter()
+    for _ in range(count):
+        dumps_fn(message)
+    encode_time = perf_counter() - start
+
+    start = perf_counter()
+    for _ in range(count):
+        loads_fn(encoded)
+    decode_time = perf_counter() - start
+
+    return count / max(encode_time, 1e-9), count / max(decode_time, 1e-9)
+
+
+def benchmark_json(args: _Namespace) -> None:
+    """Report message encode and decode rates for each backend."""
+
+    backends = [json_backend(x) for x in JSON_BACKENDS] + [
+        binary_backend(x) for x in BINARY_BACKENDS
+    ]
+    for backend in backends:
+        encode_rate, decode_rate = benchmark_json_backend(
+            backend, SAMPLE_MESSAGE, count=args.iterations
+        )
+        LOG.info(
+            "%s: %.1f encodes/s, %.1f decodes/s.",
+            backend.name,
+            encode_rate,
+            decode_rate,
+        )
+
+
+def benchmark_tab_frames(
+    tabs: int = 500, shown: int = 5, count: int = 1000
+) -> float:
+    """
+    Measure the rate (in frames per second) at which frames are handled for
+    a connection with many tabs (only some of which are shown).
+    """
+
+    states = TabStates()
+    for idx in range(tabs):
+        name = f"env{idx}"
+        states[name].shown = idx < shown
+        states.update(name)
+
+    active = list(states.active.values())
+
+    start = perf_counter()
+    for frame in range(count):
+        for state in active:
+            state.add_point("channel", (frame, frame))
+        states.frame(float(frame))
+    elapsed = perf_counter() - start
+
+    return count / max(elapsed, 1e-9)
+
+
+def benchmark_tabs(args: _Namespace) -> None:
+    """Report UI frame-handling rates for connections with many tabs."""
+
+    for tabs in sorted({min(10, args.tabs), args.tabs}):
+        LOG.info(
+            "%d tabs (5 shown): %.1f frames/s.",
+            tabs,
+            benchmark_tab_frames(tabs=tabs, count=args.iterations),
+        )
+
+
+def benchmark_loop(args: _Namespace) -> None:
+    """Report task jitter and connection throughput for event loops."""
+
+    overrides = loop_tuning(args)
+    overrides.pop("implementation", None)
+
+    for implementation in implementations(args):
+        baseline = LoopTuning(implementation=implementation)
+        variants = [("default", baseline)]
+        if overrides:
+            variants.append(("tuned", baseline.update(**overrides)))
+
+        for label, tuning in variants:
+            result = benchmark_loop_tuning(
+                tuning,
+                iterations=args.iterations,
+                period_s=args.period_s,
+                connections=args.connections,
+            )
+            LOG.info(
+                "%s (%s): jitter %.1f us (max %.1f us, %d skipped), "
+                "%.1f connections/s.",
+                implementation,
+                label,
+                result["jitter_s"] * 1e6,
+                result["max_jitter_s"] * 1e6,
+                result["skipped"],
+                result["connections_per_s"],
+            )
+
+
+def benchmark_cmd(args: _Namespace) -> int:
+    """Execute the benchmark command."""
+
+    for suite in args.suite or SUITES:
+        if suite == "loop":
+            benchmark_loop(args)
+        elif suite == "json":
+            benchmark_json(args)
+        elif suite == "tabs":
+            benchmark_tabs(args)
+
+    return 0
+
+
+def add_benchmark_cmd(parser: _ArgumentParser) -> _CommandFunction:
+    """Add benchmark-command arguments to its parser."""
+
+    loop_tuning_args(parser)
+
+    parser.add_argument(
+        "-s",
+        "--suite",
+        action="append",
+        choices=SUITES,
+        help="benchmarks to run (default: all)",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=1000,
+        help=(
+            "iterations to measure jitter (or message and frame rates) over "
+            "(default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "--period-s",
+        type=float,
+        default=0.001,
+        help="period of measured iterations (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--connections",
+        type=int,
+        default=1000,
+        help="loopback connections to open and close (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--tabs",
+        type=int,
+        default=500,
+        help="tabs per connection for frame rates (default: %(default)s)",
+    )
+
+    return benchmark_cmd
@@ -15,6 +15,7 @@ from vcorelib.paths.context import tempfile
 
 # internal
 from runtimepy import DEFAULT_EXT, PKG_NAME
+from runtimepy.net.arbiter.tuning import LoopImplementation
 
 _curses = {}  # type: ignore
 with suppress(ModuleNotFoundError):
@@ -45,6 +46,59 @@ def arbiter_flags(parser: _ArgumentParser) -> None:
         action="store_true",
         help="don't run a connection-metrics poller task",
     )
+    loop_tuning_args(parser)
+
+
+def loop_tuning_args(parser: _ArgumentParser) -> None:
+    """Add event-loop tuning arguments."""
+
+    parser.add_argument(
+        "--loop",
+        choices=[str(x) for x in LoopImplementation],
+        help="event-loop implementation to use",
+    )
+    parser.add_argument(
+        "--loop-debug",
+        action="store_true",
+        default=None,
+        help="run the event loop in debug mode",
+    )
+    parser.add_argument(
+        "--slow-callback-s",
+        type=float,
+        help="duration of callbacks considered slow (in debug mode)",
+    )
+    parser.add_argument(
+        "--executor-workers",
+        type=int,
+        help="maximum number of workers for the default executor",
+    )
+    parser.add_argument(
+        "--gc-freeze",
+        action="store_true",
+        default=None,
+        help="freeze objects created during initialization",
+    )
+    parser.add_argument(
+        "--gc-thresholds",
+        type=int,
+        nargs="+",
+        help="garbage-collector thresholds",
+    )
+
+
+def loop_tuning(args: _Namespace) -> dict[str, Any]:
+    """Get event-loop settings specified on the command line."""
+
+    data = {
+        "implementation": getattr(args, "loop", None),
+        "debug": getattr(args, "loop_debug", None),
+        "slow_callback_s": getattr(args, "slow_callback_s", None),
+        "executor_workers": getattr(args, "executor_workers", None),
+        "gc_freeze": getattr(args, "gc_freeze", None),
+        "gc_thresholds": getattr(args, "gc_thresholds", None),
+    }
+    return {key: val for key, val in data.items() if val is not None}
 
 
 def curses_wrap_if(method: _CommandFunction, args: _Namespace) -> int:
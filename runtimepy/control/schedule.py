@@ -0,0 +1,119 @@
+"""
+A module implementing a struct-polling scheduler.
+"""
+
+# built-in
+from typing import cast
+
+# third-party
+from vcorelib.math import metrics_time_ns
+
+# internal
+from runtimepy.metrics.profile import attribute
+from runtimepy.net.arbiter import AppInfo
+from runtimepy.net.arbiter.info import RuntimeStruct
+from runtimepy.net.arbiter.task import ArbiterTask, TaskFactory
+from runtimepy.primitives import Uint32
+
+
+def is_consumed(struct: RuntimeStruct) -> bool:
+    """
+    Determine if anything downstream consumes a struct's values: a transmit
+    framer, a UI tab that's shown or a recorder (history or event stream).
+    Consumers are counted as they start and stop.
+    """
+    return struct.env.channels.consumers > 0
+
+
+class StructGroup:
+    """Structs polled at the same rate."""
+
+    def __init__(self, ticks: int) -> None:
+        """Initialize this instance."""
+
+        # Task iterations per poll.
+        self.ticks = ticks
+        self.structs: list[RuntimeStruct] = []
+
+        # Structs that are polled whether or not anything consumes them.
+        self.always: set[RuntimeStruct] = set()
+
+
+class StructSchedulerTask(ArbiterTask):
+    """
+    A task that polls structs at (per-struct) configured rates. Structs
+    sharing a rate are polled together and structs that nothing consumes
+    aren't polled.
+    """
+
+    groups: list[StructGroup]
+    iterations: int
+
+    polls: Uint32
+    skipped: Uint32
+
+    def _init_state(self) -> None:
+        """Add channels to this instance's channel environment."""
+
+        self.polls = Uint32(time_source=metrics_time_ns)
+        self.env.channel(
+            "polls", self.polls, description="Struct polls performed."
+        )
+        self.skipped = Uint32(time_source=metrics_time_ns)
+        self.env.channel(
+            "skipped",
+            self.skipped,
+            description="Struct polls skipped (nothing consumed the struct).",
+        )
+
+    async def init(self, app: AppInfo) -> None:
+        """Initialize this task with application information."""
+
+        await super().init(app)
+
+        period_s = self.period_s.value
+        groups: dict[int, StructGroup] = {}
+
+        # Structs opt in by configuring a polling period.
+        for struct in app.search_structs(RuntimeStruct):
+            poll_period_s = struct.config.get("poll_period_s")
+            if poll_period_s is None:
+                continue
+
+            ticks = max(round(cast(float, poll_period_s) / period_s), 1)
+            group = groups.setdefault(ticks, StructGroup(ticks))
+            group.structs.append(struct)
+            if struct.config.get("poll_always", False):
+                group.always.add(struct)
+
+        self.groups = list(groups.values())
+        self.iterations = 0
+
+        for group in self.groups:
+            self.logger.info(
+                "Polling %s every %d iteration(s).",
+                ", ".join(x.name for x in group.structs),
+                group.ticks,
+            )
+
+    async def dispatch(self) -> bool:
+        """Dispatch an iteration of this task."""
+
+        for group in self.groups:
+            if self.iterations % group.ticks == 0:
+                for struct in group.structs:
+                    if struct in group.always or is_consumed(struct):
+                        with attribute(struct):
+                            struct.poll()
+                        self.polls.increment()
+                    else:
+                        self.skipped.increment()
+
+        self.iterations += 1
+        return True
+
+
+class StructScheduler(TaskFactory[StructSchedulerTask]):
+    """A task factory for struct-polling scheduler tasks."""
+
+    kind = StructSchedulerTask
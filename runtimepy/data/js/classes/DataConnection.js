@@ -1,3 +1,76 @@
+/*
+ * Value-array constructors for binary channel-point messages (indexed by
+ * value type, see 'runtimepy.net.server.websocket.points').
+ */
+const pointValueTypes = [
+  Int8Array, Uint8Array, Int16Array, Uint16Array, Int32Array, Uint32Array,
+  BigInt64Array, BigUint64Array, Float32Array, Float64Array, Uint8Array
+];
+
+const pointsMagic = 0x50;
+
 class DataConnection extends JsonConnection {
-  handle_payload(buffer) { console.log(buffer); }
+  constructor(name, websocket_url) {
+    super(name, websocket_url);
+
+    /* Channel [tab, name] pairs by identifier. */
+    this.channels = {};
+
+    /* Called with tab name and {channel : [values, timestamps]} objects. */
+    this.pointHandler = null;
+  }
+
+  handle_payload(buffer) {
+    if (new Uint8Array(buffer, 0, 1)[0] == pointsMagic) {
+      this.handlePoints(buffer);
+    } else {
+      super.handle_payload(buffer);
+    }
+  }
+
+  handle_json(data) {
+    /* Handle channel definitions. */
+    if ("channels" in data) {
+      Object.assign(this.channels, data["channels"]);
+      delete data["channels"];
+    }
+    super.handle_json(data);
+  }
+
+  handlePoints(buffer) {
+    /* Arrays are 8-byte aligned, so they can be used without copying. */
+    let view = new DataView(buffer);
+    let count = view.getUint16(2, true);
+    let offset = 8 + (count * 8);
+
+    let byTab = {};
+
+    for (let i = 0; i < count; i++) {
+      let base = 8 + (i * 8);
+      let ident = view.getUint16(base, true);
+      let valueType = pointValueTypes[view.getUint8(base + 2)];
+      let length = view.getUint32(base + 4, true);
+
+      let timestamps = new BigInt64Array(buffer, offset, length);
+      offset += length * 8;
+
+      let values = new valueType(buffer, offset, length);
+      offset += length * valueType.BYTES_PER_ELEMENT;
+      offset += (8 - (offset % 8)) % 8;
+
+      let channel = this.channels[ident];
+      if (channel) {
+        if (!(channel[0] in byTab)) {
+          byTab[channel[0]] = {};
+        }
+        byTab[channel[0]][channel[1]] = [ values, timestamps ];
+      }
+    }
+
+    if (this.pointHandler) {
+      for (let tab in byTab) {
+        this.pointHandler(tab, byTab[tab]);
+      }
+    }
+  }
 }
@@ -4,6 +4,17 @@ const encoder = new TextEncoder();
 
 const forward_keys = [ "__id__", "loopback" ];
 
+/*
+ * JSON messages are always objects (optionally preceded by whitespace),
+ * anything else is MessagePack (see 'is_json' in 'runtimepy.message').
+ */
+const json_start_bytes = new Set([ 0x7b, 0x20, 0x09, 0x0d, 0x0a ]);
+
+function is_json_payload(buffer) {
+  return buffer.byteLength == 0 ||
+         json_start_bytes.has(new Uint8Array(buffer, 0, 1)[0]);
+}
+
 class JsonConnection {
   constructor(name, websocket_url) {
     this.name = name;
@@ -24,6 +35,18 @@ class JsonConnection {
 
     /* Individual message handlers. */
     this.message_handlers = {};
+
+    /* Outgoing message encoding (negotiated via 'meta' messages). */
+    this.msgpack = new MessagePack();
+    this.encoding = "json";
+  }
+
+  meta() {
+    return {
+      "kind" : this.constructor.name,
+      "handlers" : Object.keys(this.message_handlers),
+      "encodings" : [ "msgpack", "json" ]
+    };
   }
 
   /*
@@ -31,7 +54,11 @@ class JsonConnection {
    * connection.
    */
   handle_payload(buffer) {
-    this.handle_json(JSON.parse(decoder.decode(buffer)));
+    if (is_json_payload(buffer)) {
+      this.handle_json(JSON.parse(decoder.decode(buffer)));
+    } else {
+      this.handle_json(this.msgpack.decode(buffer));
+    }
   }
 
   handle_json(data) {
@@ -45,6 +72,16 @@ class JsonConnection {
       }
     }
 
+    /* Exchange metadata and select an encoding for outgoing messages. */
+    if ("meta" in data) {
+      let encodings = data["meta"]["encodings"] || [];
+      if (encodings.includes("msgpack")) {
+        this.encoding = "msgpack";
+      }
+      response["meta"] = this.meta();
+      delete data["meta"];
+    }
+
     for (const key in data) {
       if (key in this.message_handlers) {
         this.message_handlers[key](data[key]);
@@ -64,7 +101,12 @@ class JsonConnection {
   /* Need a method to send a JSON object. */
   send_json(data) {
     /* Convert object to bytes. */
-    let message = encoder.encode(JSON.stringify(data));
+    let message;
+    if (this.encoding == "msgpack") {
+      message = this.msgpack.encode(data);
+    } else {
+      message = encoder.encode(JSON.stringify(data));
+    }
 
     /* Create buffer for sending and set size. */
     let buffer = new ArrayBuffer(message.byteLength + 4);
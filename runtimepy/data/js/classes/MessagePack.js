@@ -0,0 +1,263 @@
+/*
+ * A minimal MessagePack encoder and decoder (no extension types) for the
+ * message schema used by JSON connections.
+ */
+class MessagePack {
+  constructor(initialSize = 1024) {
+    this.buffer = new ArrayBuffer(initialSize);
+    this.view = new DataView(this.buffer);
+    this.bytes = new Uint8Array(this.buffer);
+    this.offset = 0;
+  }
+
+  /* Encoding. */
+
+  encode(data) {
+    this.offset = 0;
+    this.pack(data);
+    return this.bytes.slice(0, this.offset);
+  }
+
+  ensure(size) {
+    let needed = this.offset + size;
+    if (needed > this.buffer.byteLength) {
+      let capacity = this.buffer.byteLength * 2;
+      while (capacity < needed) {
+        capacity *= 2;
+      }
+
+      let bytes = new Uint8Array(capacity);
+      bytes.set(this.bytes.subarray(0, this.offset));
+      this.buffer = bytes.buffer;
+      this.view = new DataView(this.buffer);
+      this.bytes = bytes;
+    }
+  }
+
+  writeU8(val) {
+    this.ensure(1);
+    this.view.setUint8(this.offset, val);
+    this.offset += 1;
+  }
+
+  writeHeader(prefix, val, size) {
+    this.ensure(1 + size);
+    this.view.setUint8(this.offset, prefix);
+    if (size == 1) {
+      this.view.setUint8(this.offset + 1, val);
+    } else if (size == 2) {
+      this.view.setUint16(this.offset + 1, val);
+    } else {
+      this.view.setUint32(this.offset + 1, val);
+    }
+    this.offset += 1 + size;
+  }
+
+  packLength(length, fixPrefix, fixMax, prefixes, allow8 = true) {
+    if (length <= fixMax) {
+      this.writeU8(fixPrefix | length);
+    } else if (allow8 && length <= 0xff) {
+      this.writeHeader(prefixes[0], length, 1);
+    } else if (length <= 0xffff) {
+      this.writeHeader(prefixes[1], length, 2);
+    } else {
+      this.writeHeader(prefixes[2], length, 4);
+    }
+  }
+
+  packNumber(data) {
+    if (Number.isSafeInteger(data)) {
+      if (data >= 0) {
+        if (data < 0x80) {
+          this.writeU8(data);
+        } else if (data <= 0xffffffff) {
+          this.writeHeader(0xce, data, 4);
+        } else {
+          this.packBigInt(BigInt(data));
+        }
+      } else if (data >= -32) {
+        this.writeU8(data & 0xff);
+      } else if (data >= -0x80000000) {
+        this.ensure(5);
+        this.view.setUint8(this.offset, 0xd2);
+        this.view.setInt32(this.offset + 1, data);
+        this.offset += 5;
+      } else {
+        this.packBigInt(BigInt(data));
+      }
+    } else {
+      this.ensure(9);
+      this.view.setUint8(this.offset, 0xcb);
+      this.view.setFloat64(this.offset + 1, data);
+      this.offset += 9;
+    }
+  }
+
+  packBigInt(data) {
+    this.ensure(9);
+    if (data >= 0n) {
+      this.view.setUint8(this.offset, 0xcf);
+      this.view.setBigUint64(this.offset + 1, data);
+    } else {
+      this.view.setUint8(this.offset, 0xd3);
+      this.view.setBigInt64(this.offset + 1, data);
+    }
+    this.offset += 9;
+  }
+
+  pack(data) {
+    if (data === null || data === undefined) {
+      this.writeU8(0xc0);
+    } else if (data === false) {
+      this.writeU8(0xc2);
+    } else if (data === true) {
+      this.writeU8(0xc3);
+    } else if (typeof data === "number") {
+      this.packNumber(data);
+    } else if (typeof data === "bigint") {
+      this.packBigInt(data);
+    } else if (typeof data === "string") {
+      let encoded = encoder.encode(data);
+      this.packLength(encoded.length, 0xa0, 31, [ 0xd9, 0xda, 0xdb ]);
+      this.ensure(encoded.length);
+      this.bytes.set(encoded, this.offset);
+      this.offset += encoded.length;
+    } else if (data instanceof Uint8Array) {
+      this.packLength(data.length, 0, -1, [ 0xc4, 0xc5, 0xc6 ]);
+      this.ensure(data.length);
+      this.bytes.set(data, this.offset);
+      this.offset += data.length;
+    } else if (Array.isArray(data) || ArrayBuffer.isView(data)) {
+      this.packLength(data.length, 0x90, 15, [ 0, 0xdc, 0xdd ], false);
+      for (const item of data) {
+        this.pack(item);
+      }
+    } else {
+      let keys = Object.keys(data);
+      this.packLength(keys.length, 0x80, 15, [ 0, 0xde, 0xdf ], false);
+      for (const key of keys) {
+        this.pack(key);
+        this.pack(data[key]);
+      }
+    }
+  }
+
+  /* Decoding. */
+
+  decode(buffer) {
+    this.decodeView = new DataView(buffer);
+    this.decodeBytes = new Uint8Array(buffer);
+    this.decodeOffset = 0;
+    return this.unpack();
+  }
+
+  read(method, size) {
+    let result = this.decodeView[method](this.decodeOffset);
+    this.decodeOffset += size;
+    return result;
+  }
+
+  readString(length) {
+    let start = this.decodeOffset;
+    this.decodeOffset += length;
+    return decoder.decode(
+        this.decodeBytes.subarray(start, this.decodeOffset));
+  }
+
+  readBinary(length) {
+    let start = this.decodeOffset;
+    this.decodeOffset += length;
+    return this.decodeBytes.slice(start, this.decodeOffset);
+  }
+
+  readArray(length) {
+    let result = new Array(length);
+    for (let i = 0; i < length; i++) {
+      result[i] = this.unpack();
+    }
+    return result;
+  }
+
+  readMap(length) {
+    let result = {};
+    for (let i = 0; i < length; i++) {
+      let key = this.unpack();
+      result[key] = this.unpack();
+    }
+    return result;
+  }
+
+  /* Timestamps (nanoseconds) exceed safe integers, treat them as JSON does. */
+  readBigInt(method) { return Number(this.read(method, 8)); }
+
+  unpack() {
+    let prefix = this.read("getUint8", 1);
+
+    if (prefix < 0x80) {
+      return prefix;
+    }
+    if (prefix >= 0xe0) {
+      return prefix - 0x100;
+    }
+    if (prefix <= 0x8f) {
+      return this.readMap(prefix & 0xf);
+    }
+    if (prefix <= 0x9f) {
+      return this.readArray(prefix & 0xf);
+    }
+    if (prefix <= 0xbf) {
+      return this.readString(prefix & 0x1f);
+    }
+
+    switch (prefix) {
+    case 0xc0:
+      return null;
+    case 0xc2:
+      return false;
+    case 0xc3:
+      return true;
+    case 0xc4:
+      return this.readBinary(this.read("getUint8", 1));
+    case 0xc5:
+      return this.readBinary(this.read("getUint16", 2));
+    case 0xc6:
+      return this.readBinary(this.read("getUint32", 4));
+    case 0xca:
+      return this.read("getFloat32", 4);
+    case 0xcb:
+      return this.read("getFloat64", 8);
+    case 0xcc:
+      return this.read("getUint8", 1);
+    case 0xcd:
+      return this.read("getUint16", 2);
+    case 0xce:
+      return this.read("getUint32", 4);
+    case 0xcf:
+      return this.readBigInt("getBigUint64");
+    case 0xd0:
+      return this.read("getInt8", 1);
+    case 0xd1:
+      return this.read("getInt16", 2);
+    case 0xd2:
+      return this.read("getInt32", 4);
+    case 0xd3:
+      return this.readBigInt("getBigInt64");
+    case 0xd9:
+      return this.readString(this.read("getUint8", 1));
+    case 0xda:
+      return this.readString(this.read("getUint16", 2));
+    case 0xdb:
+      return this.readString(this.read("getUint32", 4));
+    case 0xdc:
+      return this.readArray(this.read("getUint16", 2));
+    case 0xdd:
+      return this.readArray(this.read("getUint32", 4));
+    case 0xde:
+      return this.readMap(this.read("getUint16", 2));
+    case 0xdf:
+      return this.readMap(this.read("getUint32", 4));
+    }
+
+    throw new Error(`Unsupported MessagePack prefix 0x${prefix.toString(16)}.`);
+  }
+}
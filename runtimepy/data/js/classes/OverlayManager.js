@@ -61,7 +61,8 @@ class OverlayManager {
 
       /* Show amount of time captured. */
       if (this.minTimestamp != null && this.maxTimestamp) {
-        let nanos = nanosString(this.maxTimestamp - this.minTimestamp);
+        let nanos =
+            nanosString(Number(this.maxTimestamp - this.minTimestamp));
         this.writeLn(nanos[0] + nanos[1] + "s (x-axis     )");
       }
 
@@ -110,7 +110,7 @@ class PlotDrawer {
     }
   }
 
-  handlePoints(points) {
+  ingest(points, handler) {
     /* Handle ingesting new point data. */
     for (const key in points) {
       if (key in this.states && this.states[key]) {
@@ -119,7 +119,7 @@ class PlotDrawer {
           this.channels[key] = new PointManager(this.overlay.bufferDepth);
         }
         if (key in this.lines) {
-          let result = this.channels[key].handlePoints(points[key]);
+          let result = handler(this.channels[key], points[key]);
 
           /* Update timestamp tracking. */
           this.oldestTimestamps[key] = result[0];
@@ -133,6 +133,15 @@ class PlotDrawer {
     this.drawLines();
   }
 
+  handlePoints(points) {
+    this.ingest(points, (manager, data) => manager.handlePoints(data));
+  }
+
+  handlePointArrays(arrays) {
+    this.ingest(arrays,
+                (manager, data) => manager.handleArrays(data[0], data[1]));
+  }
+
   setColor(key, rgb) {
     this.rgbaColors[key] =
         new WebglPlotBundle.ColorRGBA(rgb.r / 255, rgb.g / 255, rgb.b / 255, 1);
@@ -17,7 +17,13 @@ function hexToRgb(hex) {
 }
 
 class PlotManager {
-  constructor() {
+  constructor(sendServer) {
+    /* Used to send tab messages to the server. */
+    this.sendServer = sendServer;
+
+    /* Server-side point decimation method ("minmax", "lttb" or "stride"). */
+    this.decimation = "minmax";
+
     this.plots = {};
     this.overlays = {};
 
@@ -48,6 +54,12 @@ class PlotManager {
     }
   }
 
+  handlePointArrays(name, arrays) {
+    if (name in this.drawers) {
+      this.drawers[name].handlePointArrays(arrays);
+    }
+  }
+
   render(time) {
     if (this.shown in this.plots) {
       this.drawPlot(this.shown, time);
@@ -58,6 +70,25 @@ class PlotManager {
     if (name in this.drawers) {
       this.drawers[name].updateSize();
     }
+    this.negotiate(name);
+  }
+
+  negotiate(name) {
+    /*
+     * Tell the server how many points (per channel) are useful each frame,
+     * based on plot width and point-buffer depth.
+     */
+    if (this.sendServer && name in this.plots) {
+      let msg = {
+        "kind" : "plot.decimation",
+        "width" : this.plots[name].width,
+        "method" : this.decimation
+      };
+      if (name in this.drawers) {
+        msg["depth"] = this.drawers[name].overlay.bufferDepth;
+      }
+      this.sendServer(name, msg);
+    }
   }
 
   channelColors(name) {
@@ -154,6 +185,11 @@ class PlotManager {
     /* Handle forwarding events. */
     if ("message" in data && name in this.drawers) {
       this.drawers[name].handleMessage(data["message"]);
+
+      /* Point-buffer depth may have changed. */
+      if ("deltaY" in data["message"]) {
+        this.negotiate(name);
+      }
     }
   }
 
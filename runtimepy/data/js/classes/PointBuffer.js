@@ -1,155 +1,142 @@
+/*
+ * Copy 'count' elements from a ring buffer (starting at 'start') into the
+ * front of another array.
+ */
+function copyRing(dst, src, start, count) {
+  let first = Math.min(count, src.length - start);
+  dst.set(src.subarray(start, start + first));
+  if (first < count) {
+    dst.set(src.subarray(0, count - first), first);
+  }
+}
+
 class PointBuffer {
   constructor(capacity) {
-    /* Only used by initial capacity update. */
-    this.values = [];
-    this.timestamps = [];
+    /* Values and (nanosecond) timestamps are stored in ring buffers. */
+    this.capacity = 0;
+    this.values = new Float64Array(0);
+    this.timestamps = new BigInt64Array(0);
 
-    this.elements = 0;
+    this.reset();
     this.updateCapacity(capacity);
   }
 
   reset() {
+    /* Index of the oldest point and the number of points stored. */
     this.head = 0;
-    this.tail = 0;
     this.elements = 0;
     this.oldestTimestamp = null;
     this.newestTimestamp = null;
   }
 
   updateCapacity(capacity) {
-    /* Copy existing values. */
-    let points = [];
-
-    let count = Math.min(this.elements, capacity, this.capacity);
-    if (count > 0) {
-      let startIdx = this.head;
+    capacity = Math.max(2, Math.round(capacity));
 
-      /* If the buffer is getting smaller, advance the buffer index forward. */
-      if (count < this.elements) {
-        startIdx += this.elements - count;
-        startIdx = startIdx % this.capacity;
-      }
+    let values = new Float64Array(capacity);
+    let timestamps = new BigInt64Array(capacity);
 
-      for (let i = 0; i < count - 1; i++) {
-        let idx = (startIdx + i) % this.capacity;
-        points.push([ this.values[idx], this.timestamps[idx] ]);
-      }
+    /* Keep the newest points that fit. */
+    let count = Math.min(this.elements, capacity);
+    if (count > 0) {
+      let start = (this.head + this.elements - count) % this.capacity;
+      copyRing(values, this.values, start, count);
+      copyRing(timestamps, this.timestamps, start, count);
     }
 
-    /* Reset state and re-ingest points. */
-    this.reset();
     this.capacity = capacity;
-    this.values = new Array(this.capacity);
-    this.timestamps = new Array(this.capacity);
-
-    this.ingest(points);
+    this.values = values;
+    this.timestamps = timestamps;
+    this.head = 0;
+    this.elements = count;
+    this.updateBounds();
   }
 
-  ingest(points) {
-    for (let point of points) {
-      /* Store point. */
-      this.values[this.tail] = point[0];
-      this.timestamps[this.tail] = point[1];
-
-      /* Advance tail. */
-      this.tail = this.incrIndex(this.tail);
-
-      /* Keep track of capacity utilization. */
-      this.elements = Math.min(this.elements + 1, this.capacity);
+  tailIdx() { return (this.head + this.elements) % this.capacity; }
 
-      /* Ensure head advances if necessary. */
-      if (this.head == this.tail) {
-        this.head = this.incrIndex(this.head);
-      }
-    }
+  newestIdx() { return (this.head + this.elements - 1) % this.capacity; }
 
+  updateBounds() {
     /* Update tracking of oldest and newest point timestamps. */
-    this.oldestTimestamp = this.timestamps[this.head];
-    this.newestTimestamp = this.timestamps[this.newestIdx()];
+    if (this.elements > 0) {
+      this.oldestTimestamp = this.timestamps[this.head];
+      this.newestTimestamp = this.timestamps[this.newestIdx()];
+    } else {
+      this.oldestTimestamp = null;
+      this.newestTimestamp = null;
+    }
   }
 
-  normalizeTimestamps(newestIdx, oldestIdx, oldestTimestamp, newestTimestamp) {
-    /*
-     * Determine slope+offset so each timestamp can be mapped to (-1,1)
-     * domain.
-     */
+  advance(count) {
+    /* Account for 'count' points written at the tail. */
+    let total = this.elements + count;
+    if (total > this.capacity) {
+      this.head = (this.head + total - this.capacity) % this.capacity;
+      total = this.capacity;
+    }
+    this.elements = total;
+  }
 
-    let slope = 2 / (newestTimestamp - oldestTimestamp);
-    let times = [];
+  ingest(points) {
+    /* Ingest [value, timestamp] pairs (e.g. from JSON messages). */
+    for (let point of points) {
+      let tail = this.tailIdx();
+      this.values[tail] = Number(point[0]);
+      this.timestamps[tail] = BigInt(Math.round(point[1]));
+      this.advance(1);
+    }
 
-    if (slope > 0) {
-      /* Build array of plot-able timestamp X values. */
-      let idx = oldestIdx;
+    this.updateBounds();
+  }
 
-      while (idx != newestIdx) {
-        times.push(((this.timestamps[idx] - oldestTimestamp) * slope) - 1);
-        idx = this.incrIndex(idx);
+  ingestArrays(values, timestamps) {
+    /* Bulk-ingest typed arrays (e.g. from binary point messages). */
+    let count = values.length;
+
+    /* Only the newest points can be kept. */
+    let offset = Math.max(0, count - this.capacity);
+    count -= offset;
+
+    let isBigInt =
+        values instanceof BigInt64Array || values instanceof BigUint64Array;
+
+    let tail = this.tailIdx();
+    let written = 0;
+    while (written < count) {
+      let idx = (tail + written) % this.capacity;
+      let chunk = Math.min(count - written, this.capacity - idx);
+      let start = offset + written;
+
+      this.timestamps.set(timestamps.subarray(start, start + chunk), idx);
+      if (isBigInt) {
+        for (let i = 0; i < chunk; i++) {
+          this.values[idx + i] = Number(values[start + i]);
+        }
+      } else {
+        this.values.set(values.subarray(start, start + chunk), idx);
       }
-      times.push(((this.timestamps[idx] - oldestTimestamp) * slope) - 1);
 
-    } else {
-      /* need to root-cause this off-by-one issue */
-      // console.log(`${newestIdx}, ${oldestIdx}, ${this.elements}`);
-      // console.log(slope);
-
-      let idx = oldestIdx;
-      while (idx != newestIdx) {
-        times.push(oldestTimestamp)
-        idx = this.incrIndex(idx);
-      }
+      written += chunk;
     }
 
-    return times;
+    this.advance(count);
+    this.updateBounds();
   }
 
-  normalizeValues(newestIdx, oldestIdx) {
-    let maxVal = null;
-    let minVal = null;
-
-    /* First pass: find current min and max values. */
-    let idx = oldestIdx;
-    let curr;
-    while (idx != newestIdx) {
-      curr = this.values[idx];
+  valueBounds(start, count) {
+    let minVal = Infinity;
+    let maxVal = -Infinity;
 
-      if (maxVal == null || curr > maxVal) {
-        maxVal = curr;
+    for (let i = 0; i < count; i++) {
+      let val = this.values[(start + i) % this.capacity];
+      if (val < minVal) {
+        minVal = val;
       }
-      if (minVal == null || curr < minVal) {
-        minVal = curr;
+      if (val > maxVal) {
+        maxVal = val;
       }
-
-      idx = this.incrIndex(idx);
-    }
-    if (maxVal == null || curr > maxVal) {
-      maxVal = curr;
-    }
-    if (minVal == null || curr < minVal) {
-      minVal = curr;
-    }
-
-    let slope = 2 / (maxVal - minVal);
-
-    /* Second pass: populate normalized data. */
-    let values = [];
-    idx = oldestIdx;
-    while (idx != newestIdx) {
-      values.push(((this.values[idx] - minVal) * slope) - 1);
-      idx = this.incrIndex(idx);
     }
-    values.push(((this.values[idx] - minVal) * slope) - 1);
-
-    return values;
-  }
-
-  incrIndex(val) { return (val + 1) % this.capacity; }
 
-  newestIdx() {
-    let result = this.tail - 1;
-    if (result < 0) {
-      result = this.capacity - 1;
-    }
-    return result;
+    return [ minVal, maxVal ];
   }
 
   draw(line, oldestTimestamp, newestTimestamp) {
@@ -158,36 +145,53 @@ class PointBuffer {
       return;
     }
 
-    /* Find indices for oldest and newest points. */
-    let oldestIdx = this.head;
+    /* Draw the newest points that fit on the line. */
+    let count = Math.min(this.elements, line.numPoints);
+    let start = (this.head + this.elements - count) % this.capacity;
 
-    /* Build arrays of plot-able (normalized) timestamps and values. */
-    let newestIdx = this.newestIdx();
-
-    let times = this.normalizeTimestamps(newestIdx, oldestIdx, oldestTimestamp,
-                                         newestTimestamp);
-    let values = this.normalizeValues(newestIdx, oldestIdx);
-
-    /* Set points. */
-    let idx = oldestIdx;
-    let lineIdx = 0;
-    while (idx != newestIdx && lineIdx < line.numPoints) {
-      line.setX(lineIdx, times[lineIdx]);
-      line.setY(lineIdx, values[lineIdx]);
-      idx = this.incrIndex(idx);
-      lineIdx++;
+    /*
+     * Determine slopes and offsets so each timestamp and value can be mapped
+     * to the (-1, 1) domain. Timestamps are made relative (as BigInt) before
+     * conversion so that nanosecond precision isn't lost.
+     */
+    let span = Number(newestTimestamp - oldestTimestamp);
+    let xSlope = span > 0 ? 2 / span : 0;
+
+    let [minVal, maxVal] = this.valueBounds(start, count);
+    let ySlope = maxVal > minVal ? 2 / (maxVal - minVal) : 0;
+
+    /* Write directly into the line's vertex data when possible. */
+    let xy = line.xy instanceof Float32Array ? line.xy : null;
+
+    let x = 0;
+    let y = 0;
+    for (let i = 0; i < count; i++) {
+      let idx = (start + i) % this.capacity;
+      x = xSlope ? (Number(this.timestamps[idx] - oldestTimestamp) * xSlope) - 1
+                 : 1;
+      y = ySlope ? ((this.values[idx] - minVal) * ySlope) - 1 : 0;
+
+      if (xy) {
+        xy[2 * i] = x;
+        xy[(2 * i) + 1] = y;
+      } else {
+        line.setX(i, x);
+        line.setY(i, y);
+      }
     }
 
     /*
      * Write the last point forward until the line is fully plotted. This has
      * to be done, otherwise there will be lines connecting to (0, 0).
      */
-    let lastX = times[lineIdx];
-    let lastY = values[lineIdx];
-    while (lineIdx < line.numPoints) {
-      line.setX(lineIdx, lastX);
-      line.setY(lineIdx, lastY);
-      lineIdx++;
+    for (let i = count; i < line.numPoints; i++) {
+      if (xy) {
+        xy[2 * i] = x;
+        xy[(2 * i) + 1] = y;
+      } else {
+        line.setX(i, x);
+        line.setY(i, y);
+      }
     }
   }
 }
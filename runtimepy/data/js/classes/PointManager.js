@@ -13,4 +13,9 @@ class PointManager {
     this.buffer.ingest(points);
     return [ this.buffer.oldestTimestamp, this.buffer.newestTimestamp ];
   }
+
+  handleArrays(values, timestamps) {
+    this.buffer.ingestArrays(values, timestamps);
+    return [ this.buffer.oldestTimestamp, this.buffer.newestTimestamp ];
+  }
 }
@@ -376,6 +376,14 @@ class TabInterface {
       }
     }
 
+    /* Handle latest values (for channels with points streamed separately). */
+    if ("values" in data) {
+      for (let key in data["values"]) {
+        this.channelsPending[key] = data["values"][key];
+        this.channelTimestamps[key] = this.time;
+      }
+    }
+
     /* Handle actions. */
     if ("actions" in data) {
       for (let action of data["actions"]) {
@@ -11,7 +11,9 @@ function create_connections(config) {
   return conns;
 }
 
-const plots = new PlotManager();
+const plots = new PlotManager((name, event) => {
+  conns["json"].send_json({"ui" : {"name" : name, "event" : event}});
+});
 
 /* Used to control messaging rate with server. */
 let minTxPeriod = 0.0;
@@ -40,6 +42,14 @@ async function start(config) {
     await conns[key].connected;
   }
 
+  /* Pair the data connection with the JSON connection (on the server). */
+  let token = Array.from(crypto.getRandomValues(new Uint8Array(16)),
+                         (x) => x.toString(16).padStart(2, "0"))
+                  .join("");
+  conns["data"].pointHandler = plots.handlePointArrays.bind(plots);
+  conns["data"].send_json({"token" : token});
+  conns["json"].send_json({"ui" : {"data_stream" : token}});
+
   onmessage = async (event) => {
     /* Handle messages meant for this thread. */
     if ("event" in event.data && "worker" in event.data["event"]) {
@@ -58,8 +68,17 @@ async function start(config) {
     }
   };
 
+  /* Frame round-trip time (reported to the server with the next frame). */
+  let frameRtt = null;
+
   /* Add message handler to forward UI messages to the main thread. */
   conns["json"].message_handlers["ui"] = (data) => {
+    /* Measure frame round-trip time (the server uses it for pacing). */
+    if ("frame" in data) {
+      frameRtt = performance.now() - data["frame"];
+      delete data["frame"];
+    }
+
     /* Handle plot points. */
     for (const key in data) {
       const msg = data[key];
@@ -82,7 +101,12 @@ async function start(config) {
 
     /* Keep the server synchronized with frames. */
     if (messageTxTime + minTxPeriod <= time) {
-      conns["json"].send_json({"ui" : {"time" : time}});
+      let frame = {"time" : time};
+      if (frameRtt !== null) {
+        frame["rtt"] = frameRtt;
+        frameRtt = null;
+      }
+      conns["json"].send_json({"ui" : frame});
       messageTxTime = time;
     }
 
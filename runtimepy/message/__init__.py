@@ -4,49 +4,72 @@ A module implementing a message-stream processing interface.
 
 # built-in
 from io import BytesIO as _BytesIO
-from json import JSONEncoder, dumps, loads
+from struct import Struct as _Struct
 from typing import Any
 from typing import Iterator as _Iterator
 
-# third-party
-from vcorelib.io import ByteFifo
-
 # internal
+from runtimepy.message.backend import (
+    BINARY_BACKENDS,
+    JsonBackend,
+    JsonData,
+    StrFallbackJSONEncoder,
+    binary_backend,
+    is_json,
+    json_backend,
+)
 from runtimepy.primitives import Uint32, UnsignedInt
 from runtimepy.primitives.byte_order import DEFAULT_BYTE_ORDER, ByteOrder
 
-JsonMessage = dict[str, Any]
-
-
-class StrFallbackJSONEncoder(JSONEncoder):
-    """Custom JSON encoder."""
+__all__ = [
+    "JsonMessage",
+    "JsonBackend",
+    "StrFallbackJSONEncoder",
+    "json_backend",
+    "MessageProcessor",
+]
 
-    def default(self, o):
-        """Use a string conversion if necessary."""
-
-        try:
-            return super().default(o)
-        except TypeError:
-            return str(o)
+JsonMessage = dict[str, Any]
 
 
 class MessageProcessor:
-    """A class for parsing size-delimited messages."""
+    """
+    A class for parsing size-delimited messages. Incoming data is accumulated
+    in a single buffer with read and write cursors (compacted lazily, only
+    when more space is needed) and payloads are yielded as memoryview slices
+    of that buffer.
+    """
 
     message_length_kind: type[UnsignedInt] = Uint32
+    initial_capacity = 1024
 
-    def __init__(self, byte_order: ByteOrder = DEFAULT_BYTE_ORDER) -> None:
+    def __init__(
+        self,
+        byte_order: ByteOrder = DEFAULT_BYTE_ORDER,
+        json: JsonBackend = None,
+    ) -> None:
         """Initialize this instance."""
 
         self.byte_order = byte_order
+        self.json = json if json is not None else json_backend()
+
+        # The backend used for outgoing messages (see 'negotiate').
+        self.backend = self.json
 
         # Header parsing.
-        self.buffer = ByteFifo()
-        self.reading_header = True
-        self.message_length_in = self.message_length_kind()
-        self.prefix_size = self.message_length_in.size
+        self.prefix = _Struct(
+            byte_order.fmt + self.message_length_kind.kind.format
+        )
+        self.prefix_size = self.prefix.size
 
-        self.message_length_out = self.message_length_kind()
+        self.buffer = bytearray(self.initial_capacity)
+        self.read_index = 0
+        self.write_index = 0
+
+    @property
+    def size(self) -> int:
+        """The number of buffered bytes not yet consumed."""
+        return self.write_index - self.read_index
 
     def encode(self, stream: _BytesIO, data: bytes | str) -> None:
         """Encode a message to a stream."""
@@ -54,48 +77,133 @@ class MessageProcessor:
         if isinstance(data, str):
             data = data.encode()
 
-        self.message_length_out.value = len(data)
-        self.message_length_out.to_stream(stream, byte_order=self.byte_order)
+        stream.write(self.prefix.pack(len(data)))
         stream.write(data)
 
     def encode_json(self, stream: _BytesIO, data: JsonMessage) -> None:
         """Encode a message as JSON."""
 
-        self.encode(
-            stream,
-            dumps(data, cls=StrFallbackJSONEncoder, separators=(",", ":")),
-        )
+        self.encode(stream, self.json.dumps(data))
+
+    def encode_message(self, stream: _BytesIO, data: JsonMessage) -> None:
+        """Encode a message with the currently selected encoding."""
+        self.encode(stream, self.backend.dumps(data))
+
+    @property
+    def encodings(self) -> list[str]:
+        """Message encodings that this instance can decode."""
+        return list(BINARY_BACKENDS) + ["json"]
+
+    def negotiate(self, remote_encodings: list[str]) -> str:
+        """
+        Select an encoding for outgoing messages, given the encodings a remote
+        endpoint is able to decode.
+        """
+
+        self.backend = self.json
+
+        for encoding in BINARY_BACKENDS:
+            if encoding in remote_encodings:
+                self.backend = binary_backend(encoding)
+                break
+
+        return "json" if self.backend is self.json else self.backend.name
+
+    def decode(self, data: JsonData) -> JsonMessage:
+        """Decode a JSON or binary-encoded message."""
+
+        if is_json(data):
+            return self.json.loads(data)  # type: ignore
+
+        return self.binary.loads(data)  # type: ignore
+
+    @property
+    def binary(self) -> JsonBackend:
+        """
+        The backend used to decode binary messages (the negotiated encoding,
+        if binary, otherwise the most preferred registered one). Falls back
+        to the JSON backend (which rejects binary payloads) if no binary
+        backends are available.
+        """
+
+        if self.backend is not self.json:
+            return self.backend
+
+        return next((binary_backend(x) for x in BINARY_BACKENDS), self.json)
+
+    @property
+    def decode_errors(self) -> tuple[type[Exception], ...]:
+        """Errors that decoding messages can raise."""
+
+        result = self.json.decode_errors
+        for encoding in BINARY_BACKENDS:
+            result += binary_backend(encoding).decode_errors
+        return result
 
     def messages(self, data: bytes) -> _Iterator[JsonMessage]:
         """Iterate over incoming messages."""
 
         for message in self.process(data):
-            yield loads(message.decode())
-
-    def process(self, data: bytes) -> _Iterator[bytes]:
-        """Process an incoming message."""
-
-        self.buffer.ingest(data)
-
-        can_continue = True
-        while can_continue:
-            # Read the message size.
-            if self.reading_header:
-                size = self.buffer.pop(self.prefix_size)
-                if size is not None:
-                    assert len(size) == self.prefix_size
-                    self.message_length_in.update(
-                        size, byte_order=self.byte_order
-                    )
-                    self.reading_header = False
-                else:
-                    can_continue = False
-
-            # Read the message payload.
-            else:
-                message = self.buffer.pop(self.message_length_in.value)
-                if message is not None:
-                    yield message
-                    self.reading_header = True
-                else:
-                    can_continue = False
+            yield self.decode(message)
+
+    def _ingest(self, data: bytes) -> None:
+        """Add data to the buffer, compacting or growing it if necessary."""
+
+        size = len(data)
+        if not size:
+            return
+
+        # Rewind cursors if everything buffered has been consumed.
+        if self.read_index == self.write_index:
+            self.read_index = 0
+            self.write_index = 0
+
+        end = self.write_index + size
+
+        # Move unread data into a new buffer (leaving any previously yielded
+        # views intact) only when the tail of the current one is too small.
+        if end > len(self.buffer):
+            pending = self.size
+            capacity = len(self.buffer)
+            while capacity < pending + size:
+                capacity *= 2
+
+            new_buffer = bytearray(capacity)
+            new_buffer[:pending] = self.buffer[
+                self.read_index : self.write_index
+            ]
+            self.buffer = new_buffer
+            self.read_index = 0
+            self.write_index = pending
+            end = pending + size
+
+        self.buffer[self.write_index : end] = data
+        self.write_index = end
+
+    def process(self, data: bytes) -> _Iterator[memoryview]:
+        """
+        Process incoming data. Yielded payloads are views into an internal
+        buffer and are only valid until the next call to this method.
+        """
+
+        self._ingest(data)
+
+        buffer = self.buffer
+        view = memoryview(buffer)
+        prefix_size = self.prefix_size
+        unpack_from = self.prefix.unpack_from
+
+        try:
+            while self.write_index - self.read_index >= prefix_size:
+                (length,) = unpack_from(buffer, self.read_index)
+                start = self.read_index + prefix_size
+                end = start + length
+
+                # Wait for the rest of the payload.
+                if end > self.write_index:
+                    break
+
+                self.read_index = end
+                yield view[start:end]
+        finally:
+            view.release()
@@ -0,0 +1,253 @@
+"""
+A module implementing pluggable message encoding and decoding backends.
+
+Backends produce the same payloads for JSON-native data (and strings for
+objects that can't otherwise be encoded), except for:
+
+    data           | json         | orjson     | msgspec
+    NaN / Infinity | NaN/Infinity | null       | null
+    plain Enum     | str(member)  | value      | value
+    bytes          | str(bytes)   | str(bytes) | base64 string
+
+Messages meant for browsers shouldn't rely on any of these ('NaN' isn't
+valid JSON for 'JSON.parse').
+"""
+
+# built-in
+from json import JSONDecodeError, JSONEncoder, dumps, loads
+from typing import Any, Optional, Union
+
+# third-party
+try:
+    import orjson
+except ImportError:  # pragma: nocover
+    orjson = None  # type: ignore
+
+try:
+    import msgspec
+except ImportError:  # pragma: nocover
+    msgspec = None  # type: ignore
+
+try:
+    import msgpack
+except ImportError:  # pragma: nocover
+    msgpack = None
+
+JsonData = Union[bytes, bytearray, memoryview, str]
+
+
+class StrFallbackJSONEncoder(JSONEncoder):
+    """Custom JSON encoder."""
+
+    def default(self, o):
+        """Use a string conversion if necessary."""
+
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+class JsonBackend:
+    """A base class for JSON encoding and decoding backends."""
+
+    name = "json"
+    decode_errors: tuple[type[Exception], ...] = (
+        JSONDecodeError,
+        UnicodeDecodeError,
+    )
+
+    def dumps(self, data: Any) -> bytes:
+        """
+        Encode data as compact JSON. Objects that can't otherwise be encoded
+        are converted to strings.
+        """
+
+        return dumps(
+            data, cls=StrFallbackJSONEncoder, separators=(",", ":")
+        ).encode()
+
+    def loads(self, data: JsonData) -> Any:
+        """Decode JSON data."""
+
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return loads(data)
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    A JSON backend implemented with 'orjson' (non-finite floats encode as
+    null and enums by value, see the module docstring).
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+
+        # pylint: disable=no-member
+        assert orjson is not None, "'orjson' isn't installed!"
+        self.decode_errors = (orjson.JSONDecodeError,)
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        self._encode_error = orjson.JSONEncodeError
+        self._option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+
+    def dumps(self, data: Any) -> bytes:
+        """Encode data as compact JSON."""
+
+        try:
+            return self._dumps(data, default=str, option=self._option)
+
+        # Fall back to the standard library for anything 'orjson' rejects
+        # outright (e.g. integers wider than 64 bits).
+        except self._encode_error:
+            return super().dumps(data)
+
+    def loads(self, data: JsonData) -> Any:
+        """Decode JSON data."""
+        return self._loads(data)
+
+
+class MsgspecBackend(JsonBackend):
+    """
+    A JSON backend implemented with 'msgspec' (non-finite floats encode as
+    null, enums by value and bytes as base64, see the module docstring).
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+
+        assert msgspec is not None, "'msgspec' isn't installed!"
+        self.decode_errors = (msgspec.DecodeError,)
+        self._encoder = msgspec.json.Encoder(enc_hook=str)
+        self._decoder = msgspec.json.Decoder()
+        self._encode_error = msgspec.EncodeError
+
+    def dumps(self, data: Any) -> bytes:
+        """Encode data as compact JSON."""
+
+        try:
+            return self._encoder.encode(data)
+        except (self._encode_error, OverflowError):
+            return super().dumps(data)
+
+    def loads(self, data: JsonData) -> Any:
+        """Decode JSON data."""
+        return self._decoder.decode(data)
+
+
+def msgpack_default(data: Any) -> str:
+    """Convert un-encodable objects to strings (except integers)."""
+
+    if isinstance(data, int):
+        raise OverflowError(f"Can't encode integer {data}!")
+    return str(data)
+
+
+class MsgpackBackend(JsonBackend):
+    """
+    A binary (MessagePack) backend for the same message schema. Messages
+    that can't be represented (e.g. integers wider than 64 bits) are encoded
+    as JSON instead, receivers distinguish the two by the first byte of a
+    payload (see 'is_json').
+    """
+
+    name = "msgpack"
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+
+        assert msgpack is not None, "'msgpack' isn't installed!"
+        self.decode_errors = (ValueError, msgpack.UnpackException)
+        self._packer = msgpack.Packer(default=msgpack_default)
+        self._unpackb = msgpack.unpackb
+
+    def dumps(self, data: Any) -> bytes:
+        """Encode data as MessagePack."""
+
+        try:
+            return self._packer.pack(data)  # type: ignore
+        except (OverflowError, ValueError, TypeError):
+            self._packer.reset()
+            return super().dumps(data)
+
+    def loads(self, data: JsonData) -> Any:
+        """Decode MessagePack (or JSON) data."""
+
+        if is_json(data):
+            return super().loads(data)
+
+        return self._unpackb(data, strict_map_key=False)
+
+
+# JSON messages are always objects (optionally preceded by whitespace).
+JSON_START = frozenset(b"{ \t\r\n")
+
+
+def is_json(data: JsonData) -> bool:
+    """Determine if a message payload is JSON (as opposed to binary)."""
+
+    if isinstance(data, str):
+        return True
+    return not data or data[0] in JSON_START
+
+
+JSON_BACKENDS: dict[str, type[JsonBackend]] = {JsonBackend.name: JsonBackend}
+if msgspec is not None:
+    JSON_BACKENDS[MsgspecBackend.name] = MsgspecBackend
+if orjson is not None:
+    JSON_BACKENDS[OrjsonBackend.name] = OrjsonBackend
+
+# Listed in order of preference.
+PREFERRED_JSON_BACKENDS = [
+    OrjsonBackend.name,
+    MsgspecBackend.name,
+    JsonBackend.name,
+]
+
+# Binary encodings that can carry JSON messages, in order of preference.
+BINARY_BACKENDS: dict[str, type[JsonBackend]] = {}
+if msgpack is not None:
+    BINARY_BACKENDS[MsgpackBackend.name] = MsgpackBackend
+
+_BACKENDS: dict[str, JsonBackend] = {}
+
+
+def json_backend(name: Optional[str] = None) -> JsonBackend:
+    """
+    Get a JSON backend by name, or the most preferred one available if no
+    name is provided.
+    """
+
+    if name is None:
+        name = next(x for x in PREFERRED_JSON_BACKENDS if x in JSON_BACKENDS)
+
+    if name not in _BACKENDS:
+        assert name in JSON_BACKENDS, (
+            f"JSON backend '{name}' not available "
+            f"(options: {', '.join(JSON_BACKENDS)})!"
+        )
+        _BACKENDS[name] = JSON_BACKENDS[name]()
+
+    return _BACKENDS[name]
+
+
+def binary_backend(name: str) -> JsonBackend:
+    """Get a binary message backend by name."""
+
+    if name not in _BACKENDS:
+        assert name in BINARY_BACKENDS, (
+            f"Binary backend '{name}' not available "
+            f"(options: {', '.join(BINARY_BACKENDS)})!"
+        )
+        _BACKENDS[name] = BINARY_BACKENDS[name]()
+
+    return _BACKENDS[name]
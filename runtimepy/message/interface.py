@@ -68,6 +68,7 @@ class JsonMessageInterface:
             "package": PKG_NAME,
             "version": VERSION,
             "kind": type(self).__name__,
+            "encodings": self.processor.encodings,
         }
 
         self.curr_id = Identifier()
@@ -81,7 +82,7 @@ class JsonMessageInterface:
 
         self._register_handlers()
 
-        self.meta["handlers"] = list(self.targets.literals) + [  # type: ignore
+        self.meta["handlers"] = list(self.targets.literals) + [
             x.data for x in self.targets.dynamic
         ]
 
@@ -150,16 +151,20 @@ class JsonMessageInterface:
             self.remote_meta = inbox
             outbox.update(self.meta)
 
+            # Use a binary encoding if the peer can decode one.
+            encoding = self.processor.negotiate(inbox.get("encodings", []))
+
             # Log peer's metadata.
             self.logger.info(
                 (
                     "remote metadata: package=%s, "
-                    "version=%s, kind=%s, handlers=%s"
+                    "version=%s, kind=%s, handlers=%s, encoding=%s"
                 ),
-                self.remote_meta["package"],
-                self.remote_meta["version"],
-                self.remote_meta["kind"],
-                self.remote_meta["handlers"],
+                self.remote_meta.get("package"),
+                self.remote_meta.get("version"),
+                self.remote_meta.get("kind"),
+                self.remote_meta.get("handlers"),
+                encoding,
             )
 
     def stage_remote_log(
@@ -197,7 +202,7 @@ class JsonMessageInterface:
             self._log_messages = []
 
         with BytesIO() as stream:
-            self.processor.encode_json(stream, data)
+            self.processor.encode_message(stream, data)
             self.write(stream.getvalue(), addr=addr)
 
     def handle_log_message(self, message: JsonMessage) -> None:
@@ -5,11 +5,28 @@ A module defining common metrics interfaces.
 # internal
 from runtimepy.metrics.channel import METRICS_DEPTH, ChannelMetrics
 from runtimepy.metrics.connection import ConnectionMetrics
+from runtimepy.metrics.jitter import JitterMetrics
+from runtimepy.metrics.loop import EventLoopMetrics
+from runtimepy.metrics.memory import AllocationSnapshots, GcMetrics
+from runtimepy.metrics.profile import SamplingProfiler
+from runtimepy.metrics.sequence import (
+    ReorderBuffer,
+    SequenceMetrics,
+    SequenceTracker,
+)
 from runtimepy.metrics.task import PeriodicTaskMetrics
 
 __all__ = [
+    "AllocationSnapshots",
     "ChannelMetrics",
     "METRICS_DEPTH",
     "ConnectionMetrics",
+    "EventLoopMetrics",
+    "GcMetrics",
+    "JitterMetrics",
     "PeriodicTaskMetrics",
+    "ReorderBuffer",
+    "SamplingProfiler",
+    "SequenceMetrics",
+    "SequenceTracker",
 ]
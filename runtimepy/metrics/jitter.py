@@ -0,0 +1,61 @@
+"""
+A module implementing a scheduling-jitter metrics interface.
+"""
+
+# third-party
+from vcorelib.math import metrics_time_ns as _metrics_time_ns
+
+# internal
+from runtimepy.primitives import Float as _Float
+from runtimepy.primitives import Uint32 as _Uint32
+
+# Upper bounds (in seconds) and names of jitter histogram bins (the last bin
+# counts everything else).
+JITTER_BINS: tuple[tuple[float, str], ...] = (
+    (1e-5, "le_10us"),
+    (1e-4, "le_100us"),
+    (1e-3, "le_1ms"),
+    (1e-2, "le_10ms"),
+)
+JITTER_OVERFLOW = "gt_10ms"
+
+
+class JitterMetrics:
+    """Metrics for how late periodic deadlines are serviced."""
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+
+        self.jitter_s = _Float(time_source=_metrics_time_ns)
+        self.max_jitter_s = _Float(time_source=_metrics_time_ns)
+
+        # Deadlines skipped due to overruns.
+        self.skipped = _Uint32(time_source=_metrics_time_ns)
+
+        self.histogram: dict[str, _Uint32] = {
+            name: _Uint32(time_source=_metrics_time_ns)
+            for name in [x[1] for x in JITTER_BINS] + [JITTER_OVERFLOW]
+        }
+
+    def record(self, jitter_s: float) -> None:
+        """Record a jitter measurement."""
+
+        self.jitter_s.value = jitter_s
+        self.max_jitter_s.value = max(self.max_jitter_s.value, jitter_s)
+
+        name = JITTER_OVERFLOW
+        for bound, bin_name in JITTER_BINS:
+            if jitter_s <= bound:
+                name = bin_name
+                break
+
+        self.histogram[name].value += 1
+
+    def reset(self) -> None:
+        """Reset metrics."""
+
+        self.jitter_s.value = 0.0
+        self.max_jitter_s.value = 0.0
+        self.skipped.value = 0
+        for count in self.histogram.values():
+            count.value = 0
@@ -0,0 +1,157 @@
+"""
+A module implementing an event-loop instrumentation (metrics) interface.
+"""
+
+# built-in
+import asyncio
+from asyncio.events import Handle
+from contextlib import contextmanager
+from logging import getLogger
+from time import perf_counter_ns
+from typing import Callable, Iterator, Optional
+
+# third-party
+from vcorelib.math import from_nanos as _from_nanos
+from vcorelib.math import metrics_time_ns as _metrics_time_ns
+from vcorelib.math import to_nanos as _to_nanos
+
+# internal
+from runtimepy.primitives import Float as _Float
+from runtimepy.primitives import Uint32 as _Uint32
+
+LOG = getLogger(__name__)
+
+# Event loops with callback timing enabled.
+TIMED: dict[asyncio.AbstractEventLoop, "EventLoopMetrics"] = {}
+
+ORIGINAL_RUN: Callable[[Handle], None] = (
+    Handle._run  # pylint: disable=protected-access
+)
+
+
+def _set_run(run: Callable[[Handle], None]) -> None:
+    """Set the method used to run event-loop callbacks."""
+    Handle._run = run  # type: ignore  # pylint: disable=protected-access
+
+
+def _timed_run(handle: Handle) -> None:
+    """Run a callback and record how long it took."""
+
+    start = perf_counter_ns()
+    try:
+        ORIGINAL_RUN(handle)
+    finally:
+        metrics = TIMED.get(
+            handle._loop  # type: ignore  # pylint: disable=protected-access
+        )
+        if metrics is not None:
+            metrics.record_callback(handle, perf_counter_ns() - start)
+
+
+class EventLoopMetrics:
+    """Metrics for how responsive an event loop is."""
+
+    def __init__(self, slow_callback_s: float = 0.1) -> None:
+        """Initialize this instance."""
+
+        self.slow_callback_ns = _to_nanos(slow_callback_s)
+
+        # How late a periodic probe callback ran.
+        self.lag_s = _Float(time_source=_metrics_time_ns)
+        self.max_lag_s = _Float(time_source=_metrics_time_ns)
+
+        # Longest callback (since the last poll) and the number of callbacks
+        # that took longer than the slow-callback threshold.
+        self.max_callback_s = _Float(time_source=_metrics_time_ns)
+        self.slow_callbacks = _Uint32(time_source=_metrics_time_ns)
+
+        self.tasks = _Uint32(time_source=_metrics_time_ns)
+        self.ready = _Uint32(time_source=_metrics_time_ns)
+
+        # Identity of the most recent slow callback.
+        self.slow_callback = ""
+
+        self._max_lag_ns = 0
+        self._max_callback_ns = 0
+
+    def record_lag(self, lag_ns: int) -> None:
+        """Record a loop-lag measurement."""
+
+        self.lag_s.value = _from_nanos(lag_ns)
+        self._max_lag_ns = max(self._max_lag_ns, lag_ns)
+
+    def record_callback(self, handle: Handle, duration_ns: int) -> None:
+        """Record a callback's duration."""
+
+        self._max_callback_ns = max(self._max_callback_ns, duration_ns)
+
+        if duration_ns > self.slow_callback_ns:
+            self.slow_callbacks.value += 1
+            self.slow_callback = repr(handle)
+            LOG.warning(
+                "Callback took %.3fs: %s.",
+                _from_nanos(duration_ns),
+                self.slow_callback,
+            )
+
+    def poll(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Update metrics (maximums reset on each poll)."""
+
+        self.tasks.value = len(asyncio.all_tasks(loop))
+        self.ready.value = len(
+            getattr(loop, "_ready", ())  # pylint: disable=protected-access
+        )
+
+        self.max_lag_s.value = _from_nanos(self._max_lag_ns)
+        self.max_callback_s.value = _from_nanos(self._max_callback_ns)
+        self._max_lag_ns = 0
+        self._max_callback_ns = 0
+
+    @contextmanager
+    def timing(self, loop: asyncio.AbstractEventLoop) -> Iterator[None]:
+        """
+        Time callbacks run by an event loop (only event loops that run
+        'asyncio.Handle' callbacks, i.e. not uvloop, are supported). This
+        wraps every callback run by every event loop (in this process), so
+        it should only be enabled when needed.
+        """
+
+        # Only one instance can time an event loop's callbacks.
+        if loop in TIMED:
+            yield
+            return
+
+        TIMED[loop] = self
+        _set_run(_timed_run)
+        try:
+            yield
+        finally:
+            del TIMED[loop]
+            if not TIMED:
+                _set_run(ORIGINAL_RUN)
+
+    @contextmanager
+    def probing(
+        self, loop: asyncio.AbstractEventLoop, period_s: float
+    ) -> Iterator[None]:
+        """Measure loop lag with a periodic probe callback."""
+
+        period_ns = _to_nanos(period_s)
+        handle: Optional[asyncio.TimerHandle] = None
+
+        def probe(expected_ns: int) -> None:
+            """Measure how late this callback ran and schedule the next."""
+
+            nonlocal handle
+
+            now_ns = perf_counter_ns()
+            self.record_lag(max(now_ns - expected_ns, 0))
+            handle = loop.call_later(period_s, probe, now_ns + period_ns)
+
+        handle = loop.call_later(
+            period_s, probe, perf_counter_ns() + period_ns
+        )
+        try:
+            yield
+        finally:
+            handle.cancel()
@@ -0,0 +1,182 @@
+"""
+A module implementing garbage-collector and allocation metrics interfaces.
+"""
+
+# built-in
+from contextlib import contextmanager
+import gc
+from time import perf_counter_ns
+import tracemalloc
+from typing import Any, Iterator, Optional
+
+# third-party
+from vcorelib.math import from_nanos as _from_nanos
+from vcorelib.math import metrics_time_ns as _metrics_time_ns
+
+# internal
+from runtimepy.primitives import Float as _Float
+from runtimepy.primitives import Uint32 as _Uint32
+from runtimepy.primitives import Uint64 as _Uint64
+
+# Don't attribute allocations to snapshot machinery.
+SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+class GcMetrics:
+    """Metrics for garbage-collector activity and allocation rate."""
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+
+        # Objects tracked by each generation (see 'gc.get_count').
+        self.generations = [
+            _Uint32(time_source=_metrics_time_ns)
+            for _ in range(len(gc.get_count()))
+        ]
+
+        self.collections = _Uint32(time_source=_metrics_time_ns)
+        self.collected = _Uint32(time_source=_metrics_time_ns)
+        self.uncollectable = _Uint32(time_source=_metrics_time_ns)
+
+        # Collection pauses.
+        self.pause_s = _Float(time_source=_metrics_time_ns)
+        self.max_pause_s = _Float(time_source=_metrics_time_ns)
+
+        # Net container-object allocations (estimated from collector
+        # counters) and tracemalloc-traced memory.
+        self.allocation_rate = _Float(time_source=_metrics_time_ns)
+        self.traced_bytes = _Uint64(time_source=_metrics_time_ns)
+        self.traced_peak_bytes = _Uint64(time_source=_metrics_time_ns)
+
+        # Collector events are accumulated as plain integers (the callback
+        # runs during collections, which may happen at any allocation) and
+        # published to primitives when polled.
+        self._start_ns = 0
+        self._pause_ns = 0
+        self._max_pause_ns = 0
+        self._collections = 0
+        self._collected = 0
+        self._uncollectable = 0
+
+        self._allocated = self._allocations()
+        self._poll_ns = perf_counter_ns()
+
+    @staticmethod
+    def _allocations() -> int:
+        """
+        Estimate net container-object allocations (the first generation's
+        count is reset by each collection).
+        """
+
+        threshold = gc.get_threshold()[0]
+        return int(
+            gc.get_count()[0]
+            + threshold * sum(x["collections"] for x in gc.get_stats())
+        )
+
+    def _callback(self, phase: str, info: dict[str, Any]) -> None:
+        """Handle garbage-collector events."""
+
+        if phase == "start":
+            self._start_ns = perf_counter_ns()
+        elif self._start_ns:
+            pause_ns = perf_counter_ns() - self._start_ns
+            self._start_ns = 0
+
+            self._pause_ns = pause_ns
+            self._max_pause_ns = max(self._max_pause_ns, pause_ns)
+
+            self._collections += 1
+            self._collected += info["collected"]
+            self._uncollectable += info["uncollectable"]
+
+    @contextmanager
+    def tracking(self) -> Iterator[None]:
+        """Measure garbage-collector pauses."""
+
+        gc.callbacks.append(self._callback)
+        try:
+            yield
+        finally:
+            gc.callbacks.remove(self._callback)
+
+    def poll(self) -> None:
+        """Update metrics (maximums reset on each poll)."""
+
+        for generation, count in zip(self.generations, gc.get_count()):
+            generation.value = count
+
+        now_ns = perf_counter_ns()
+        allocated = self._allocations()
+        elapsed_ns = now_ns - self._poll_ns
+        if elapsed_ns > 0:
+            self.allocation_rate.value = max(
+                allocated - self._allocated, 0
+            ) / _from_nanos(elapsed_ns)
+        self._allocated = allocated
+        self._poll_ns = now_ns
+
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            self.traced_bytes.value = current
+            self.traced_peak_bytes.value = peak
+
+        self.collections.value = self._collections
+        self.collected.value = self._collected
+        self.uncollectable.value = self._uncollectable
+
+        self.pause_s.value = _from_nanos(self._pause_ns)
+        self.max_pause_s.value = _from_nanos(self._max_pause_ns)
+        self._max_pause_ns = 0
+
+
+class AllocationSnapshots:
+    """
+    Compares tracemalloc snapshots to find the allocation sites with the most
+    growth.
+    """
+
+    def __init__(self, frames: int = 1) -> None:
+        """Initialize this instance."""
+
+        self.frames = frames
+        self.previous: Optional[tracemalloc.Snapshot] = None
+        self.started = False
+
+    def snapshot(self, limit: int = 10) -> list[tracemalloc.StatisticDiff]:
+        """
+        Take a snapshot and get the allocation sites that grew the most since
+        the previous one (the first snapshot starts tracing, if necessary,
+        and only records a baseline).
+        """
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self.started = True
+            self.previous = None
+
+        current = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+
+        result = []
+        if self.previous is not None:
+            result = [
+                x
+                for x in current.compare_to(self.previous, "lineno")
+                if x.size_diff > 0
+            ][:limit]
+
+        self.previous = current
+        return result
+
+    def stop(self) -> None:
+        """Stop tracing (if this instance started it)."""
+
+        if self.started:
+            tracemalloc.stop()
+            self.started = False
+        self.previous = None
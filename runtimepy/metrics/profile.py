@@ -0,0 +1,258 @@
+"""
+A module implementing a sampling profiler that attributes samples to runtime
+entities (tasks, connections and structs).
+"""
+
+# built-in
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+import sys
+from threading import Event, Lock, Thread, get_ident
+from types import CodeType, FrameType
+from typing import Any, Callable, Coroutine, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+# The entity whose code is currently running (in this context).
+CURRENT_ENTITY: ContextVar[Optional[object]] = ContextVar(
+    "CURRENT_ENTITY", default=None
+)
+
+# Labels for samples that aren't attributed to an entity.
+IDLE = "idle"
+OTHER = "other"
+
+DEFAULT_INTERVAL_S = 0.005
+
+
+class Attribution:
+    """Tracks which entity frames (and threads) are running code for."""
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+
+        # Attribution is only tracked while a profiler is running.
+        self.enabled = False
+
+        # Coroutine frames (e.g. a task's 'dispatch') mapped to entities.
+        self.frames: dict[FrameType, object] = {}
+
+        # Entities running synchronous code (by thread).
+        self.threads: dict[int, object] = {}
+
+    def entity(self, ident: int, frame: Optional[FrameType]) -> object:
+        """Determine which entity a thread's current frame is running for."""
+
+        # Synchronous code can't be suspended, so it takes precedence.
+        result = self.threads.get(ident)
+        if result is not None:
+            return result
+
+        while frame is not None:
+            result = self.frames.get(frame)
+            if result is not None:
+                return result
+            frame = frame.f_back
+
+        return None
+
+
+ATTRIBUTION = Attribution()
+
+
+async def _attributed(entity: object, coro: Coroutine[Any, Any, T]) -> T:
+    """Await a coroutine, attributing its execution to an entity."""
+
+    token = CURRENT_ENTITY.set(entity)
+    frame = getattr(coro, "cr_frame", None)
+    if frame is not None:
+        ATTRIBUTION.frames[frame] = entity
+
+    try:
+        return await coro
+    finally:
+        if frame is not None:
+            ATTRIBUTION.frames.pop(frame, None)
+        CURRENT_ENTITY.reset(token)
+
+
+def attributed(
+    entity: object, coro: Coroutine[Any, Any, T]
+) -> Coroutine[Any, Any, T]:
+    """
+    Attribute a coroutine's execution to an entity (the coroutine is returned
+    as-is when no profiler is running).
+    """
+
+    if not ATTRIBUTION.enabled:
+        return coro
+    return _attributed(entity, coro)
+
+
+@contextmanager
+def attribute(entity: object) -> Iterator[None]:
+    """Attribute synchronous code to an entity."""
+
+    if not ATTRIBUTION.enabled:
+        yield
+        return
+
+    ident = get_ident()
+    previous = ATTRIBUTION.threads.get(ident)
+    ATTRIBUTION.threads[ident] = entity
+    token = CURRENT_ENTITY.set(entity)
+
+    try:
+        yield
+    finally:
+        CURRENT_ENTITY.reset(token)
+        if previous is None:
+            ATTRIBUTION.threads.pop(ident, None)
+        else:
+            ATTRIBUTION.threads[ident] = previous
+
+
+def _code_label(code: CodeType) -> str:
+    """Get a (flamegraph-compatible) label for a code object."""
+
+    return (
+        f"{code.co_name} ({Path(code.co_filename).name}:"
+        f"{code.co_firstlineno})"
+    ).replace(";", ":")
+
+
+def _is_idle(frame: FrameType) -> bool:
+    """Determine if a frame is an event loop waiting for events."""
+
+    code = frame.f_code
+    return code.co_name in {"select", "poll"} and code.co_filename.endswith(
+        "selectors.py"
+    )
+
+
+class SamplingProfiler:
+    """
+    Samples a thread's stack from a background thread (using
+    'sys._current_frames') and attributes samples to runtime entities.
+    """
+
+    def __init__(self, interval_s: float = DEFAULT_INTERVAL_S) -> None:
+        """Initialize this instance."""
+
+        self.interval_s = interval_s
+
+        self.samples = 0
+        self.entities: Counter[object] = Counter()
+        self.stacks: Counter[tuple[object, tuple[str, ...]]] = Counter()
+
+        self._labels: dict[CodeType, str] = {}
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self._target = 0
+
+    @property
+    def running(self) -> bool:
+        """Determine if this profiler is running."""
+        return self._thread is not None
+
+    def reset(self) -> None:
+        """Discard samples."""
+
+        with self._lock:
+            self.samples = 0
+            self.entities.clear()
+            self.stacks.clear()
+
+    def snapshot(self) -> tuple[int, dict[object, int]]:
+        """Get the total number of samples and samples per entity."""
+
+        with self._lock:
+            return self.samples, dict(self.entities)
+
+    def sample(self, frame: FrameType) -> None:
+        """Record a stack sample."""
+
+        entity = ATTRIBUTION.entity(self._target, frame)
+        if entity is None:
+            entity = IDLE if _is_idle(frame) else OTHER
+
+        stack = []
+        current: Optional[FrameType] = frame
+        while current is not None:
+            code = current.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = _code_label(code)
+                self._labels[code] = label
+            stack.append(label)
+            current = current.f_back
+        stack.reverse()
+
+        with self._lock:
+            self.samples += 1
+            self.entities[entity] += 1
+            self.stacks[(entity, tuple(stack))] += 1
+
+    def _run(self) -> None:
+        """Sample the target thread until stopped."""
+
+        while not self._stop.wait(self.interval_s):
+            frame = sys._current_frames().get(  # pylint: disable=W0212
+                self._target
+            )
+            if frame is not None:
+                self.sample(frame)
+
+    def start(self, ident: int = None) -> None:
+        """Begin sampling a thread (the current thread by default)."""
+
+        if self._thread is not None:
+            return
+
+        self._target = get_ident() if ident is None else ident
+        self._stop.clear()
+        ATTRIBUTION.enabled = True
+
+        self._thread = Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+        ATTRIBUTION.enabled = False
+        ATTRIBUTION.frames.clear()
+        ATTRIBUTION.threads.clear()
+
+    def folded(self, label: Callable[[object], str] = str) -> Iterator[str]:
+        """
+        Get samples in 'folded stacks' format (each line is a
+        semicolon-separated stack, rooted at an entity, and a sample count)
+        for flamegraph tools.
+        """
+
+        with self._lock:
+            stacks = list(self.stacks.items())
+
+        for (entity, stack), count in stacks:
+            yield ";".join((label(entity),) + stack) + f" {count}"
+
+    def write(self, path: Path, label: Callable[[object], str] = str) -> int:
+        """Write folded stacks to a file and return the number of lines."""
+
+        lines = list(self.folded(label=label))
+        with path.open("w", encoding="utf-8") as path_fd:
+            for line in lines:
+                path_fd.write(line + "\n")
+        return len(lines)
@@ -0,0 +1,214 @@
+"""
+A module implementing sequence-number (loss, duplicate, re-ordering and
+jitter) tracking interfaces.
+"""
+
+# built-in
+from typing import Callable, Generic, Iterator, NamedTuple, Optional, TypeVar
+
+# third-party
+from vcorelib.math import metrics_time_ns
+
+# internal
+from runtimepy.primitives import Float as _Float
+from runtimepy.primitives import Uint16 as _Uint16
+from runtimepy.primitives import Uint32 as _Uint32
+
+# The default modulus for (16-bit) sequence numbers.
+SEQUENCE_MODULUS = 1 << 16
+
+
+class SequenceMetrics(NamedTuple):
+    """Metrics for sequence-numbered messages (aggregated over sources)."""
+
+    received: _Uint32
+    lost: _Uint32
+    duplicates: _Uint32
+    reordered: _Uint32
+    jitter_ms: _Float
+    sources: _Uint16
+
+    @staticmethod
+    def create() -> "SequenceMetrics":
+        """Create a new metrics instance."""
+
+        return SequenceMetrics(
+            _Uint32(time_source=metrics_time_ns),
+            _Uint32(time_source=metrics_time_ns),
+            _Uint32(time_source=metrics_time_ns),
+            _Uint32(time_source=metrics_time_ns),
+            _Float(time_source=metrics_time_ns),
+            _Uint16(time_source=metrics_time_ns),
+        )
+
+
+class SequenceTracker:
+    """
+    Tracks the sequence numbers and arrival times of messages from a single
+    source. Recently seen sequence numbers are kept in a bit mask (relative
+    to the highest sequence number seen) so that duplicates can be told
+    apart from late (re-ordered) messages.
+    """
+
+    window = 64
+
+    def __init__(
+        self, metrics: SequenceMetrics, modulus: int = SEQUENCE_MODULUS
+    ) -> None:
+        """Initialize this instance."""
+
+        self.metrics = metrics
+        self.modulus = modulus
+        self.half = modulus // 2
+        self.mask = (1 << self.window) - 1
+
+        self.highest: Optional[int] = None
+        self.seen = 0
+
+        # Inter-arrival jitter estimate (RFC 3550, section 6.4.1).
+        self.jitter_ns = 0.0
+        self.transit_ns: Optional[int] = None
+
+    def __call__(self, sequence: int) -> None:
+        """Update tracking with a newly received sequence number."""
+
+        metrics = self.metrics
+        metrics.received.value += 1
+
+        if self.highest is None:
+            self.highest = sequence
+            self.seen = 1
+            return
+
+        delta = (sequence - self.highest) % self.modulus
+
+        # Newer than anything seen so far (count any skipped as lost).
+        if 0 < delta < self.half:
+            if delta > 1:
+                metrics.lost.value += delta - 1
+            self.seen = ((self.seen << delta) | 1) & self.mask
+            self.highest = sequence
+            return
+
+        behind = (self.modulus - delta) % self.modulus
+        if behind < self.window:
+            bit = 1 << behind
+            if self.seen & bit:
+                metrics.duplicates.value += 1
+            else:
+                self.seen |= bit
+                metrics.reordered.value += 1
+                if metrics.lost.value:
+                    metrics.lost.value -= 1
+
+        # Too far behind to be a late message, assume the sender restarted.
+        else:
+            self.highest = sequence
+            self.seen = 1
+
+    def arrival(self, arrival_ns: int, timestamp_ns: int) -> None:
+        """Update the jitter estimate with a message's arrival time."""
+
+        transit = arrival_ns - timestamp_ns
+        if self.transit_ns is not None:
+            self.jitter_ns += (
+                abs(transit - self.transit_ns) - self.jitter_ns
+            ) / 16.0
+            self.metrics.jitter_ms.value = self.jitter_ns / 1e6
+        self.transit_ns = transit
+
+
+V = TypeVar("V")
+
+
+class ReorderBuffer(Generic[V]):
+    """
+    A buffer that releases sequence-numbered items in order, waiting at most
+    a bounded amount of time (or number of items) for missing ones.
+    """
+
+    def __init__(
+        self,
+        window_ns: int,
+        depth: int = 64,
+        modulus: int = SEQUENCE_MODULUS,
+        time_source: Callable[[], int] = metrics_time_ns,
+    ) -> None:
+        """Initialize this instance."""
+
+        self.window_ns = window_ns
+        self.depth = depth
+        self.modulus = modulus
+        self.half = modulus // 2
+        self.time_source = time_source
+
+        self.expected: Optional[int] = None
+        self.pending: dict[int, tuple[int, V]] = {}
+
+    def ingest(self, sequence: int, item: V) -> Iterator[V]:
+        """
+        Add an item to the buffer and release any that are ready. Items that
+        arrive after their turn has been skipped are dropped.
+        """
+
+        now = self.time_source()
+
+        if self.expected is None:
+            self.expected = sequence
+
+        behind = (self.expected - sequence) % self.modulus
+        if 0 < behind <= self.half:
+            # Too late (drop).
+            if behind <= self.depth:
+                return
+
+            # Too far behind to be a late item, assume the sender restarted.
+            yield from self.flush()
+            self.expected = sequence
+
+        if sequence not in self.pending:
+            self.pending[sequence] = (now, item)
+
+        yield from self.release(now)
+
+    def flush(self) -> Iterator[V]:
+        """Release all buffered items (in order)."""
+
+        if self.expected is not None:
+            expected = self.expected
+            for sequence in sorted(
+                self.pending, key=lambda x: (x - expected) % self.modulus
+            ):
+                yield self.pending[sequence][1]
+
+        self.pending.clear()
+        self.expected = None
+
+    def release(self, now: int = None) -> Iterator[V]:
+        """Release items that are in order or have waited long enough."""
+
+        if now is None:
+            now = self.time_source()
+
+        pending = self.pending
+        while pending:
+            assert self.expected is not None
+
+            if self.expected in pending:
+                yield pending.pop(self.expected)[1]
+                self.expected = (self.expected + 1) % self.modulus
+                continue
+
+            # Give up on the missing item(s) once the oldest buffered item
+            # has waited for the entire window, or the buffer is full.
+            if (
+                len(pending) > self.depth
+                or now - min(x[0] for x in pending.values()) >= self.window_ns
+            ):
+                expected = self.expected
+                self.expected = min(
+                    pending, key=lambda x: (x - expected) % self.modulus
+                )
+                continue
+
+            break
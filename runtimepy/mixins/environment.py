@@ -5,8 +5,16 @@ A module implementing a channel-environment class mixin.
 # internal
 from runtimepy import METRICS_NAME
 from runtimepy.channel.environment import ChannelEnvironment
-from runtimepy.metrics import ConnectionMetrics, PeriodicTaskMetrics
+from runtimepy.metrics import (
+    ConnectionMetrics,
+    JitterMetrics,
+    PeriodicTaskMetrics,
+    SequenceMetrics,
+)
 from runtimepy.metrics.channel import ChannelMetrics
+from runtimepy.metrics.loop import EventLoopMetrics
+from runtimepy.metrics.memory import GcMetrics
+from runtimepy.primitives import AnyPrimitive
 
 # 10 Hz metrics.
 METRICS_MIN_PERIOD_S = 0.1
@@ -75,6 +83,143 @@ class ChannelEnvironmentMixin:
                 min_period_s=METRICS_MIN_PERIOD_S,
             )
 
+    def register_jitter_metrics(
+        self,
+        metrics: JitterMetrics,
+        *names: str,
+        namespace: str = METRICS_NAME,
+    ) -> None:
+        """Register scheduling-jitter metrics."""
+
+        with self.env.names_pushed(namespace, *names):
+            self.env.channel(
+                "jitter_s",
+                metrics.jitter_s,
+                description="Most recent deadline lateness.",
+                min_period_s=METRICS_MIN_PERIOD_S,
+            )
+            self.env.channel(
+                "max_jitter_s",
+                metrics.max_jitter_s,
+                description="Maximum deadline lateness measured.",
+                min_period_s=METRICS_MIN_PERIOD_S,
+            )
+            self.env.channel(
+                "skipped",
+                metrics.skipped,
+                description="Deadlines skipped due to overruns.",
+                min_period_s=METRICS_MIN_PERIOD_S,
+            )
+
+            with self.env.names_pushed("histogram"):
+                for name, count in metrics.histogram.items():
+                    self.env.channel(
+                        name,
+                        count,
+                        description=(
+                            "Deadlines serviced with this much lateness."
+                        ),
+                        min_period_s=METRICS_MIN_PERIOD_S,
+                    )
+
+    def register_loop_metrics(
+        self,
+        metrics: EventLoopMetrics,
+        *names: str,
+        namespace: str = METRICS_NAME,
+    ) -> None:
+        """Register event-loop metrics."""
+
+        channels: list[tuple[str, AnyPrimitive, str]] = [
+            ("lag_s", metrics.lag_s, "Most recent loop lag."),
+            (
+                "max_lag_s",
+                metrics.max_lag_s,
+                "Maximum loop lag (since the previous poll).",
+            ),
+            (
+                "max_callback_s",
+                metrics.max_callback_s,
+                "Longest callback duration (since the previous poll).",
+            ),
+            (
+                "slow_callbacks",
+                metrics.slow_callbacks,
+                "Callbacks that took longer than the threshold.",
+            ),
+            ("tasks", metrics.tasks, "Number of event-loop tasks."),
+            (
+                "ready",
+                metrics.ready,
+                "Number of callbacks ready to run.",
+            ),
+        ]
+
+        with self.env.names_pushed(namespace, *names):
+            for name, channel, description in channels:
+                self.env.channel(
+                    name,
+                    channel,
+                    description=description,
+                    min_period_s=METRICS_MIN_PERIOD_S,
+                )
+
+    def register_gc_metrics(
+        self,
+        metrics: GcMetrics,
+        *names: str,
+        namespace: str = METRICS_NAME,
+    ) -> None:
+        """Register garbage-collector and allocation metrics."""
+
+        channels: list[tuple[str, AnyPrimitive, str]] = [
+            ("collections", metrics.collections, "Collections run."),
+            ("collected", metrics.collected, "Objects collected."),
+            (
+                "uncollectable",
+                metrics.uncollectable,
+                "Uncollectable objects found.",
+            ),
+            ("pause_s", metrics.pause_s, "Most recent collection pause."),
+            (
+                "max_pause_s",
+                metrics.max_pause_s,
+                "Longest collection pause (since the previous poll).",
+            ),
+            (
+                "allocation_rate",
+                metrics.allocation_rate,
+                "Net container-object allocations per second.",
+            ),
+            (
+                "traced_bytes",
+                metrics.traced_bytes,
+                "Memory traced by tracemalloc.",
+            ),
+            (
+                "traced_peak_bytes",
+                metrics.traced_peak_bytes,
+                "Peak memory traced by tracemalloc.",
+            ),
+        ]
+
+        with self.env.names_pushed(namespace, *names):
+            for idx, generation in enumerate(metrics.generations):
+                self.env.channel(
+                    f"generation{idx}",
+                    generation,
+                    description=f"Objects tracked by generation {idx}.",
+                    min_period_s=METRICS_MIN_PERIOD_S,
+                )
+
+            for name, channel, description in channels:
+                self.env.channel(
+                    name,
+                    channel,
+                    description=description,
+                    min_period_s=METRICS_MIN_PERIOD_S,
+                )
+
     def register_channel_metrics(
         self, name: str, channel: ChannelMetrics, verb: str
     ) -> None:
@@ -120,3 +265,49 @@ class ChannelEnvironmentMixin:
                 ("rx", metrics.rx, "received"),
             ]:
                 self.register_channel_metrics(name, direction, verb)
+
+    def register_sequence_metrics(
+        self,
+        metrics: SequenceMetrics,
+        *names: str,
+        namespace: str = METRICS_NAME,
+    ) -> None:
+        """Register sequence-number tracking metrics."""
+
+        with self.env.names_pushed(namespace, *names):
+            self.env.channel(
+                "received",
+                metrics.received,
+                description="Number of sequence-numbered messages received.",
+                min_period_s=METRICS_MIN_PERIOD_S,
+            )
+            self.env.channel(
+                "lost",
+                metrics.lost,
+                description="Number of messages skipped in sequence.",
+                min_period_s=METRICS_MIN_PERIOD_S,
+            )
+            self.env.channel(
+                "duplicates",
+                metrics.duplicates,
+                description="Number of duplicate messages received.",
+                min_period_s=METRICS_MIN_PERIOD_S,
+            )
+            self.env.channel(
+                "reordered",
+                metrics.reordered,
+                description="Number of messages received out of order.",
+                min_period_s=METRICS_MIN_PERIOD_S,
+            )
+            self.env.channel(
+                "jitter_ms",
+                metrics.jitter_ms,
+                description="Inter-arrival jitter estimate (milliseconds).",
+                min_period_s=METRICS_MIN_PERIOD_S,
+            )
+            self.env.channel(
+                "sources",
+                metrics.sources,
+                description="Number of distinct message sources.",
+                min_period_s=METRICS_MIN_PERIOD_S,
+            )
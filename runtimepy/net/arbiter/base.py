@@ -38,9 +38,11 @@ from runtimepy.net.arbiter.info import (
     RuntimeStruct,
 )
 from runtimepy.net.arbiter.result import AppResult, ResultState
+from runtimepy.net.arbiter.shard import ShardProcess
 from runtimepy.net.arbiter.task import (
     ArbiterTaskManager as _ArbiterTaskManager,
 )
+from runtimepy.net.arbiter.tuning import LoopTuning
 from runtimepy.net.connection import Connection as _Connection
 from runtimepy.net.manager import ConnectionManager as _ConnectionManager
 from runtimepy.net.server import RuntimepyServerConnection
@@ -81,6 +83,10 @@ class BaseConnectionArbiter(_NamespaceMixin, _LoggerMixin, TuiMixin):
     A class implementing a base connection-manager for a broader application.
     """
 
+    # Event-loop and garbage-collector settings (replaced, not modified, when
+    # configuration data is loaded).
+    tuning = LoopTuning()
+
     def __init__(
         self,
         manager: _ConnectionManager = None,
@@ -139,6 +145,9 @@ class BaseConnectionArbiter(_NamespaceMixin, _LoggerMixin, TuiMixin):
         self._peers: dict[str, RuntimeProcessTask] = {}
         self._runtime_peers: dict[str, _RuntimepyPeer] = {}
 
+        # Application shards (run in worker processes).
+        self._shards: dict[str, ShardProcess] = {}
+
         self._servers: list[_asyncio.Task[None]] = []
         self._servers_started = _asyncio.Semaphore(0)
 
@@ -245,6 +254,16 @@ class BaseConnectionArbiter(_NamespaceMixin, _LoggerMixin, TuiMixin):
             )
             self.logger.info("Started process '%s'.", name)
 
+    async def _start_shards(self, stack: _AsyncExitStack) -> None:
+        """Start shards (and register their environments)."""
+
+        for shard in self._shards.values():
+            await stack.enter_async_context(shard.running(self.stop_sig))
+
+    def add_init(self, app: NetworkApplication) -> None:
+        """Add an initialization method."""
+        self._inits.append([app])
+
     async def _main(
         self,
         stack: _AsyncExitStack,
@@ -259,12 +278,23 @@ class BaseConnectionArbiter(_NamespaceMixin, _LoggerMixin, TuiMixin):
 
         clear_env()
 
+        loop = _asyncio.get_running_loop()
+        if not self.tuning.matches(loop):
+            self.logger.warning(
+                "Running on '%s' event loop (not '%s').",
+                type(loop).__name__,
+                self.tuning.implementation,
+            )
+        self.tuning.apply(loop)
+        stack.callback(self.tuning.restore)
+
         # Wait for servers to start.
         for _ in range(len(self._servers)):
             await self._servers_started.acquire()
 
         # Start processes.
         await self._start_processes(stack)
+        await self._start_shards(stack)
 
         with self.log_time("Connection initialization", reminder=True):
             await self._init_connections()
@@ -319,6 +349,8 @@ class BaseConnectionArbiter(_NamespaceMixin, _LoggerMixin, TuiMixin):
             # Run initialization methods.
             result = await self._run_apps_list(self._inits, info)
             if result == 0:
+                self.tuning.initialized()
+
                 # Get application methods.
                 apps = self._apps
                 if app is not None:
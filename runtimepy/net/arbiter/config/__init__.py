@@ -30,6 +30,8 @@ from runtimepy.net.arbiter.imports import (
     ImportConnectionArbiter as _ImportConnectionArbiter,
 )
 from runtimepy.net.arbiter.imports.util import get_apps
+from runtimepy.net.arbiter.shard import ShardProcess
+from runtimepy.net.arbiter.tuning import LoopTuning
 
 ConfigObject = dict[str, _Any]
 ConfigBuilder = _Callable[[ConfigObject], None]
@@ -132,6 +134,19 @@ class ConfigConnectionArbiter(_ImportConnectionArbiter):
             wait_for_stop=wait_for_stop,
         )
 
+    def _register_shards(self, shards: list[ConfigObject]) -> None:
+        """Register shards (run in worker processes)."""
+
+        for shard in shards:
+            name = shard["name"]
+            assert name not in self._shards, f"Duplicate shard '{name}'!"
+            self._shards[name] = ShardProcess(
+                name,
+                shard["configs"],
+                type(self),
+                period_s=shard["period_s"],
+            )
+
     async def process_config(
         self, config: ConnectionArbiterConfig, wait_for_stop: bool = False
     ) -> None:
@@ -195,7 +210,10 @@ class ConfigConnectionArbiter(_ImportConnectionArbiter):
                 ),
             ), f"Couldn't register a '{factory}' server!"
 
+        self.tuning = LoopTuning.create(config.event_loop)
+
         # Register tasks.
+        self.task_manager.shared = config.shared_task_scheduler
         for task in config.tasks:
             name = task["name"]
             factory = task["factory"]
@@ -204,6 +222,9 @@ class ConfigConnectionArbiter(_ImportConnectionArbiter):
                 name,
                 period_s=task["period_s"],
                 average_depth=task["average_depth"],
+                overrun_policy=task["overrun_policy"],
+                spin_s=task["spin_s"],
+                worker=task["worker"],
                 markdown=task.get("markdown"),
                 config=task.get("config"),
             ), f"Couldn't register task '{name}' ({factory})!"
@@ -230,6 +251,9 @@ class ConfigConnectionArbiter(_ImportConnectionArbiter):
                 ),
             ), f"Couldn't register process '{name}' ({factory})!"
 
+        # Register shards.
+        self._register_shards(config.shards)
+
         # Load initialization methods.
         self._inits = get_apps(config.inits)
 
@@ -68,9 +68,18 @@ class ConnectionArbiterConfig(_RuntimepyDictCodec):
         self.tasks: list[_Any] = data.get("tasks", [])  # type: ignore
         self.structs: list[_Any] = data.get("structs", [])  # type: ignore
         self.processes: list[_Any] = data.get("processes", [])  # type: ignore
+        self.shards: list[_Any] = data.get("shards", [])  # type: ignore
 
         self.directory = _Path(str(data.get("directory", ".")))
 
+        self.event_loop: _JsonObject = _cast(
+            _JsonObject, data.get("event_loop", {})
+        )
+
+        self.shared_task_scheduler = bool(
+            data.get("shared_task_scheduler", False)
+        )
+
     def asdict(self) -> _JsonObject:
         """Obtain a dictionary representing this instance."""
         return self.data
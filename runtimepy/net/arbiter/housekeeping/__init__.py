@@ -5,11 +5,18 @@ runtime.
 
 # built-in
 import asyncio
-from typing import Awaitable
+from typing import Any, Awaitable
+
+# third-party
+from vcorelib.names import name_search
 
 # internal
+from runtimepy.channel.environment.command import GLOBAL
+from runtimepy.channel.history import DEFAULT_CAPACITY
+from runtimepy.metrics.profile import attribute, attributed
 from runtimepy.mixins.async_command import AsyncCommandProcessingMixin
 from runtimepy.net.arbiter.info import AppInfo as _AppInfo
+from runtimepy.net.arbiter.info import RuntimeStruct as _RuntimeStruct
 from runtimepy.net.arbiter.task import ArbiterTask as _ArbiterTask
 from runtimepy.net.arbiter.task import TaskFactory as _TaskFactory
 from runtimepy.net.manager import ConnectionManager as _ConnectionManager
@@ -53,6 +60,12 @@ class ConnectionMetricsPoller(_ArbiterTask):
         if self.poll_connection_metrics:
             self.manager.poll_metrics()
 
+        # Poll structs (e.g. event-loop instrumentation).
+        for struct in self.app.search_structs(_RuntimeStruct):
+            if struct.housekeeping_poll:
+                with attribute(struct):
+                    struct.poll()
+
         # Handle any incoming commands.
         for mapping in (
             self.app.connections.values(),
@@ -61,7 +74,14 @@ class ConnectionMetricsPoller(_ArbiterTask):
         ):
             for item in mapping:
                 if isinstance(item, AsyncCommandProcessingMixin):
-                    self.processors.append(item.process_command_queue())
+                    # Route commands to tasks' own threads.
+                    thread = getattr(item, "thread", None)
+                    processor = attributed(item, item.process_command_queue())
+                    self.processors.append(
+                        thread.call(processor)
+                        if thread is not None
+                        else processor
+                    )
 
         # Service connection tasks. The connection manager should probably do
         # this on its own at some point.
@@ -82,6 +102,23 @@ async def init(app: _AppInfo) -> int:
             "poll_connection_metrics", False
         )
 
+    # Record channel history (served by the HTTP server's history endpoint),
+    # e.g. config: {history: [{environments: "ui", channels: "metrics.*"}]}.
+    history: list[dict[str, Any]] = app.config_param("history", [])
+    for item in history:
+        for name in name_search(GLOBAL, item.get("environments", ".*")):
+            channels = GLOBAL.record_history(
+                name,
+                pattern=item.get("channels", ".*"),
+                capacity=item.get("capacity", DEFAULT_CAPACITY),
+            )
+            app.logger.info(
+                "Recording history for '%s': %s.", name, ", ".join(channels)
+            )
+
+    if history:
+        app.stack.callback(GLOBAL.stop_history)
+
     return 0
 
 
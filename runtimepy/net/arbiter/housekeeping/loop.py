@@ -0,0 +1,59 @@
+"""
+A module implementing an event-loop instrumentation struct.
+"""
+
+# built-in
+import asyncio
+
+# internal
+from runtimepy.metrics.loop import EventLoopMetrics
+from runtimepy.net.arbiter.info import RuntimeStruct
+
+DEFAULT_PROBE_PERIOD_S = 0.01
+DEFAULT_SLOW_CALLBACK_S = 0.05
+
+
+class LoopMonitor(RuntimeStruct):
+    """
+    A struct that measures event-loop lag, task counts and ready-queue
+    depth (polled by the housekeeping task). Timing every callback (to find
+    slow callbacks) adds overhead to the whole event loop, so it's only
+    enabled with the 'callbacks' config option.
+    """
+
+    metrics: EventLoopMetrics
+    loop: asyncio.AbstractEventLoop
+
+    housekeeping_poll = True
+
+    def init_env(self) -> None:
+        """Initialize this instance's channel environment."""
+
+        self.metrics = EventLoopMetrics(
+            slow_callback_s=float(
+                self.config.get(  # type: ignore
+                    "slow_callback_s", DEFAULT_SLOW_CALLBACK_S
+                )
+            )
+        )
+        self.register_loop_metrics(self.metrics)
+
+        self.loop = asyncio.get_running_loop()
+
+        self.app.stack.enter_context(
+            self.metrics.probing(
+                self.loop,
+                float(
+                    self.config.get(  # type: ignore
+                        "probe_period_s", DEFAULT_PROBE_PERIOD_S
+                    )
+                ),
+            )
+        )
+
+        if self.config.get("callbacks", False):
+            self.app.stack.enter_context(self.metrics.timing(self.loop))
+
+    def poll(self) -> None:
+        """Update task counts, ready-queue depth and maximums."""
+        self.metrics.poll(self.loop)
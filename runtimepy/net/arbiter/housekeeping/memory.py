@@ -0,0 +1,124 @@
+"""
+A module implementing a garbage-collector and allocation instrumentation
+struct.
+"""
+
+# built-in
+from argparse import Namespace
+from typing import Optional
+
+# internal
+from runtimepy.channel.environment.command import FieldOrChannel
+from runtimepy.metrics.memory import AllocationSnapshots, GcMetrics
+from runtimepy.net.arbiter.info import RuntimeStruct
+from runtimepy.primitives import Bool, Float, Int32
+
+DEFAULT_TOP = 10
+
+
+class MemoryMonitor(RuntimeStruct):
+    """
+    A struct that measures garbage-collector activity and allocation rate
+    and reports the allocation sites that grew the most between on-demand
+    tracemalloc snapshots (polled by the housekeeping task).
+    """
+
+    metrics: GcMetrics
+    snapshots: AllocationSnapshots
+
+    snapshot: Bool
+    sites: list[tuple[Float, Int32]]
+
+    housekeeping_poll = True
+
+    def take_snapshot(self) -> None:
+        """
+        Take an allocation snapshot and update (and log) the top allocation
+        sites since the previous snapshot.
+        """
+
+        diffs = self.snapshots.snapshot(limit=len(self.sites))
+        if not diffs:
+            self.logger.info("Recorded allocation-snapshot baseline.")
+
+        for idx, (size, count) in enumerate(self.sites):
+            size.value = 0.0
+            count.value = 0
+
+            if idx < len(diffs):
+                diff = diffs[idx]
+                size.value = diff.size_diff / 1024.0
+                count.value = diff.count_diff
+
+                frame = diff.traceback[0]
+                self.logger.info(
+                    "#%d %s:%d: %+.1f KiB (%+d blocks, %.1f KiB total).",
+                    idx + 1,
+                    frame.filename,
+                    frame.lineno,
+                    size.value,
+                    diff.count_diff,
+                    diff.size / 1024.0,
+                )
+
+    def init_env(self) -> None:
+        """Initialize this instance's channel environment."""
+
+        self.metrics = GcMetrics()
+        self.register_gc_metrics(self.metrics)
+        self.app.stack.enter_context(self.metrics.tracking())
+
+        self.snapshots = AllocationSnapshots(
+            frames=int(self.config.get("frames", 1))  # type: ignore
+        )
+        self.app.stack.callback(self.snapshots.stop)
+
+        self.snapshot = Bool()
+        self.env.channel(
+            "snapshot",
+            self.snapshot,
+            commandable=True,
+            description=(
+                "Takes an allocation snapshot (on the next poll) when set."
+            ),
+        )
+
+        self.sites = []
+        for idx in range(
+            int(self.config.get("top", DEFAULT_TOP))  # type: ignore
+        ):
+            size = Float()
+            count = Int32()
+            with self.env.names_pushed("sites", str(idx + 1)):
+                self.env.channel(
+                    "size_kb",
+                    size,
+                    description="Growth since the previous snapshot (KiB).",
+                )
+                self.env.channel(
+                    "blocks",
+                    count,
+                    description="New blocks since the previous snapshot.",
+                )
+            self.sites.append((size, count))
+
+        async def snapshot(_: Namespace, __: Optional[FieldOrChannel]) -> None:
+            """Take an allocation snapshot."""
+            self.take_snapshot()
+
+        async def stop_tracing(
+            _: Namespace, __: Optional[FieldOrChannel]
+        ) -> None:
+            """Stop tracing allocations."""
+            self.snapshots.stop()
+
+        self._setup_async_commands(snapshot, stop_tracing)
+
+    def poll(self) -> None:
+        """Update metrics (and take a snapshot if requested)."""
+
+        self.metrics.poll()
+
+        if self.snapshot:
+            self.snapshot.value = False
+            self.take_snapshot()
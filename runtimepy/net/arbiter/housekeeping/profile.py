@@ -0,0 +1,166 @@
+"""
+A module implementing a sampling-profiler struct.
+"""
+
+# built-in
+from argparse import Namespace
+from pathlib import Path
+from typing import Optional
+
+# internal
+from runtimepy.channel.environment.command import FieldOrChannel
+from runtimepy.metrics.profile import (
+    DEFAULT_INTERVAL_S,
+    IDLE,
+    OTHER,
+    SamplingProfiler,
+)
+from runtimepy.net.arbiter.info import RuntimeStruct
+from runtimepy.primitives import Bool, Float, Uint32
+
+
+class Profiler(RuntimeStruct):
+    """
+    A struct that controls a sampling profiler, reports each task's,
+    connection's and struct's share of event-loop thread samples and dumps
+    flamegraph-compatible ('folded') stacks (only within the configured
+    output directory).
+    """
+
+    profiler: SamplingProfiler
+    labels: dict[int, str]
+    directory: Path
+
+    enabled: Bool
+    samples: Uint32
+    shares: dict[str, Float]
+
+    housekeeping_poll = True
+
+    def label(self, entity: object) -> str:
+        """Get a label for a profiled entity."""
+
+        result = self.labels.get(id(entity))
+        if result is None:
+            result = str(getattr(entity, "name", entity))
+        return result
+
+    def dump(self, name: str = None) -> Optional[Path]:
+        """
+        Write folded stacks to a file in the output directory (files outside
+        of it are rejected).
+        """
+
+        if name is None:
+            name = str(self.config.get("path", f"{self.name}.folded"))
+
+        directory = self.directory.resolve()
+        path = directory.joinpath(name).resolve()
+        if not path.is_relative_to(directory):
+            self.logger.error(
+                "Not writing stacks to '%s' (outside '%s').", name, directory
+            )
+            return None
+
+        count = self.profiler.write(path, label=self.label)
+        self.logger.info("Wrote %d stacks to '%s'.", count, path)
+        return path
+
+    def init_env(self) -> None:
+        """Initialize this instance's channel environment."""
+
+        self.profiler = SamplingProfiler(
+            interval_s=float(
+                self.config.get(  # type: ignore
+                    "interval_s", DEFAULT_INTERVAL_S
+                )
+            )
+        )
+        self.app.stack.callback(self.profiler.stop)
+
+        self.directory = Path(str(self.config.get("directory", ".")))
+
+        self.labels = {}
+        for mapping in (
+            self.app.tasks,
+            self.app.connections,
+            self.app.structs,
+        ):
+            for name, entity in mapping.items():
+                self.labels[id(entity)] = name
+
+        self.enabled = Bool()
+        self.env.channel(
+            "enabled",
+            self.enabled,
+            commandable=True,
+            description="Samples the event-loop thread when true.",
+        )
+        self.samples = Uint32()
+        self.env.channel(
+            "samples",
+            self.samples,
+            description="Samples taken (since the previous poll).",
+        )
+
+        self.shares = {}
+        for label in [*self.labels.values(), IDLE, OTHER]:
+            if label not in self.shares:
+                self.shares[label] = Float()
+                self.env.channel(
+                    f"share.{label}",
+                    self.shares[label],
+                    description=(
+                        f"Share of samples attributed to '{label}' "
+                        "(since the previous poll)."
+                    ),
+                )
+
+        self._previous: dict[object, int] = {}
+        self._previous_samples = 0
+
+        async def dump(args: Namespace, __: Optional[FieldOrChannel]) -> None:
+            """Write folded stacks to a file."""
+            self.dump(args.extra[0] if args.extra else None)
+
+        async def reset(_: Namespace, __: Optional[FieldOrChannel]) -> None:
+            """Discard samples."""
+
+            self.profiler.reset()
+            self._previous = {}
+            self._previous_samples = 0
+
+        self._setup_async_commands(dump, reset)
+
+        self.enabled.value = bool(self.config.get("start", False))
+        self.poll()
+
+    def poll(self) -> None:
+        """Start or stop sampling and update entity shares."""
+
+        if self.enabled and not self.profiler.running:
+            self.profiler.start()
+        elif not self.enabled and self.profiler.running:
+            self.profiler.stop()
+
+        total, entities = self.profiler.snapshot()
+
+        samples = total - self._previous_samples
+        self.samples.value = samples
+
+        # Entities without a channel (e.g. ones created after
+        # initialization) are counted as 'other' so that shares sum to one.
+        shares: dict[str, int] = {}
+        for entity, count in entities.items():
+            label = self.label(entity)
+            if label not in self.shares:
+                label = OTHER
+            shares[label] = (
+                shares.get(label, 0) + count - self._previous.get(entity, 0)
+            )
+
+        for label, share in self.shares.items():
+            share.value = shares.get(label, 0) / samples if samples else 0.0
+
+        self._previous = entities
+        self._previous_samples = total
@@ -62,6 +62,9 @@ class RuntimeStruct(RuntimeStructBase, _ABC):
     # going down.
     final_poll = False
 
+    # Set this for structs to be polled by the housekeeping task.
+    housekeeping_poll = False
+
     def init_env(self) -> None:
         """Initialize this sample environment."""
 
@@ -0,0 +1,282 @@
+"""
+A module implementing arbiter shards: parts of an application (connections,
+tasks and structs) that run in worker processes and publish their channel
+environments through shared memory.
+"""
+
+# built-in
+import asyncio
+from contextlib import asynccontextmanager, suppress
+import multiprocessing
+from multiprocessing.connection import Connection
+from multiprocessing.synchronize import Event
+from typing import Any, AsyncIterator, Optional
+
+# third-party
+from vcorelib.logging import LoggerMixin
+
+# internal
+from runtimepy.channel.environment import ChannelEnvironment
+from runtimepy.channel.environment.command import GLOBAL, register_env
+from runtimepy.channel.environment.command.processor import (
+    ChannelCommandProcessor,
+)
+from runtimepy.channel.environment.shared import (
+    SharedEnvironmentLayout,
+    SharedEnvironmentReader,
+    SharedEnvironmentWriter,
+)
+from runtimepy.net.arbiter.info import AppInfo
+
+DEFAULT_PERIOD_S = 0.1
+
+# How long to wait for a shard to publish its environments.
+DEFAULT_TIMEOUT_S = 60.0
+
+
+class ShardPublisher:
+    """Publishes a (worker-process) arbiter's environments."""
+
+    def __init__(self, conn: Connection, stop: Event, period_s: float) -> None:
+        """Initialize this instance."""
+
+        self.conn = conn
+        self.stop = stop
+        self.period_s = period_s
+        self.writers: dict[str, SharedEnvironmentWriter] = {}
+
+    async def _run(self, app: AppInfo) -> None:
+        """Publish environments until stopped."""
+
+        try:
+            while not self.stop.is_set() and not app.stop.is_set():
+                for writer in self.writers.values():
+                    writer.publish()
+                await asyncio.sleep(self.period_s)
+        finally:
+            app.stop.set()
+            for writer in self.writers.values():
+                writer.close()
+
+    async def publish(self, app: AppInfo) -> int:
+        """An initialization method that begins publishing environments."""
+
+        for name, command in GLOBAL.items():
+            self.writers[name] = SharedEnvironmentWriter(command.env)
+
+        self.conn.send(
+            {
+                "layouts": {
+                    name: writer.layout.asdict()
+                    for name, writer in self.writers.items()
+                }
+            }
+        )
+
+        task = asyncio.create_task(self._run(app))
+
+        async def cleanup() -> None:
+            """Wait for publishing to stop."""
+
+            app.stop.set()
+            await task
+
+        app.stack.push_async_callback(cleanup)
+        return 0
+
+
+def run_shard(
+    factory: type,
+    configs: list[str],
+    period_s: float,
+    conn: Connection,
+    stop: Event,
+) -> None:
+    """Run an arbiter (in a worker process) that publishes environments."""
+
+    publisher = ShardPublisher(conn, stop, period_s)
+
+    async def main() -> int:
+        """Load configuration data and run the arbiter."""
+
+        arbiter = factory()
+        await arbiter.load_configs(configs, wait_for_stop=True)
+        arbiter.add_init(publisher.publish)
+        return int(await arbiter.app())
+
+    result = -1
+    try:
+        result = asyncio.run(main())
+    finally:
+        conn.send({"result": result})
+        conn.close()
+
+
+class ShardProcess(LoggerMixin):
+    """Runs part of an application in a worker process."""
+
+    def __init__(
+        self,
+        name: str,
+        configs: list[str],
+        factory: type,
+        period_s: float = DEFAULT_PERIOD_S,
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+    ) -> None:
+        """Initialize this instance."""
+
+        super().__init__()
+        self.name = name
+        self.configs = configs
+
+        # The (configurable) arbiter class to run in the worker process.
+        self.factory = factory
+        self.period_s = period_s
+        self.timeout_s = timeout_s
+
+        self.readers: dict[str, SharedEnvironmentReader] = {}
+        self.environments: dict[str, ChannelEnvironment] = {}
+
+        # The worker process's result (once it has exited).
+        self.result: Optional[int] = None
+
+    def read(self) -> int:
+        """Update environments from shared memory."""
+        return sum(reader.read() for reader in self.readers.values())
+
+    def _exited(self, message: dict[str, Any], exitcode: Optional[int]) -> int:
+        """Handle the worker process exiting."""
+
+        result = message.get("result", exitcode)
+        self.result = -1 if result is None else int(result)
+
+        # Environments are no longer updated.
+        for name in self.environments:
+            GLOBAL.pop(f"{self.name}.{name}", None)
+
+        return self.result
+
+    async def _poll(
+        self,
+        recv: Connection,
+        process: multiprocessing.process.BaseProcess,
+        stop_sig: Optional[asyncio.Event],
+    ) -> None:
+        """Periodically update environments (until the worker exits)."""
+
+        # The worker only sends a (result) message or closes its end of the
+        # pipe when exiting.
+        while not recv.poll() and process.is_alive():
+            self.read()
+            await asyncio.sleep(self.period_s)
+
+        result = self._exited(self._receive(recv, 0.0), process.exitcode)
+        self.logger.warning(
+            "Shard '%s' exited on its own (%d).", self.name, result
+        )
+        if stop_sig is not None:
+            stop_sig.set()
+
+    def _attach(self, layouts: dict[str, Any]) -> None:
+        """Attach to published environments."""
+
+        for name, data in layouts.items():
+            reader = SharedEnvironmentReader(
+                SharedEnvironmentLayout.create(data)
+            )
+            self.readers[name] = reader
+            reader.read()
+
+            env = reader.environment()
+            self.environments[name] = env
+            register_env(
+                f"{self.name}.{name}",
+                ChannelCommandProcessor(env, self.logger),
+            )
+
+    def _close(self) -> None:
+        """Detach from published environments."""
+
+        for reader in self.readers.values():
+            reader.close()
+        self.readers.clear()
+        self.environments.clear()
+
+    @staticmethod
+    def _receive(conn: Connection, timeout_s: float) -> dict[str, Any]:
+        """Receive a message from a worker process."""
+
+        if not conn.poll(timeout_s):
+            return {}
+
+        with suppress(EOFError):
+            return conn.recv()  # type: ignore
+
+        return {}
+
+    @asynccontextmanager
+    async def running(
+        self, stop_sig: asyncio.Event = None
+    ) -> AsyncIterator["ShardProcess"]:
+        """
+        Run this shard's worker process. The stop signal (if provided) is set
+        if the worker exits on its own.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        # Don't fork processes with running event loops.
+        ctx = multiprocessing.get_context("spawn")
+        recv, send = ctx.Pipe(duplex=False)
+        stop = ctx.Event()
+
+        process = ctx.Process(
+            target=run_shard,
+            args=(self.factory, self.configs, self.period_s, send, stop),
+            name=self.name,
+            daemon=True,
+        )
+        process.start()
+        send.close()
+
+        poller: Optional[asyncio.Task[None]] = None
+
+        try:
+            message = await loop.run_in_executor(
+                None, self._receive, recv, self.timeout_s
+            )
+            assert (
+                "layouts" in message
+            ), f"Shard '{self.name}' didn't start ({message})!"
+
+            self._attach(message["layouts"])
+            self.logger.info(
+                "Shard '%s' started (%s).",
+                self.name,
+                ", ".join(self.environments),
+            )
+
+            poller = asyncio.create_task(self._poll(recv, process, stop_sig))
+            yield self
+
+        finally:
+            stop.set()
+
+            if poller is not None:
+                poller.cancel()
+                with suppress(asyncio.CancelledError):
+                    await poller
+
+            await loop.run_in_executor(None, process.join, self.timeout_s)
+            if process.is_alive():
+                process.terminate()
+
+            if self.result is None:
+                self.logger.info(
+                    "Shard '%s' exited (%d).",
+                    self.name,
+                    self._exited(self._receive(recv, 0.0), process.exitcode),
+                )
+
+            self._close()
+            recv.close()
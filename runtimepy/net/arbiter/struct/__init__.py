@@ -3,18 +3,21 @@ A module implementing runtime struct interfaces.
 """
 
 # built-in
-from io import BytesIO
-from typing import Generic, Iterator, Optional, TypeVar
+from struct import Struct
+from typing import Any, Generic, Iterator, Optional, TypeVar
 
 # third-party
 from vcorelib.math import default_time_ns
 from vcorelib.math.keeper import TimeSource
 
 # internal
+from runtimepy.metrics import ReorderBuffer, SequenceMetrics, SequenceTracker
 from runtimepy.net.arbiter.info import AppInfo, RuntimeStruct
-from runtimepy.net.mtu import UDP_DEFAULT_MTU, UDP_HEADER_SIZE
+from runtimepy.net.mtu import ETHERNET_MTU, UDP_DEFAULT_MTU, UDP_HEADER_SIZE
 from runtimepy.net.udp.connection import UdpConnection
+from runtimepy.net.util import IpHostTuplelike
 from runtimepy.primitives import Uint16, Uint64
+from runtimepy.primitives.byte_order import ByteOrder
 from runtimepy.primitives.serializable.framer import SerializableFramer
 
 
@@ -28,6 +31,7 @@ class TimestampedStruct(RuntimeStruct):
     # Header.
     timestamp: Uint64
     sequence: Uint16
+    header: Struct
 
     def init_env(self) -> None:
         """Initialize this sample environment."""
@@ -55,6 +59,28 @@ class TimestampedStruct(RuntimeStruct):
             description="A monotonic counter (per instance update).",
         )
 
+    def update_byte_order(self, byte_order: ByteOrder, **kwargs) -> None:
+        """Update the over-the-wire byte order for this struct."""
+
+        super().update_byte_order(byte_order, **kwargs)
+        self.header = Struct(
+            byte_order.fmt
+            + self.timestamp.kind.format
+            + self.sequence.kind.format
+        )
+
+    def frames(self, data: bytes) -> Iterator[bytes]:
+        """Iterate over the individual struct frames in a message."""
+
+        size = self.array.size
+
+        # Quick sanity check.
+        data_len = len(data)
+        assert data_len % size == 0, (data_len, size)
+
+        for idx in range(0, data_len, size):
+            yield data[idx : idx + size]
+
     def update_single(self, data: bytes) -> int:
         """Update this struct instance and return the nanosecond timestamp."""
 
@@ -70,15 +96,8 @@ class TimestampedStruct(RuntimeStruct):
     def process_datagram(self, data: bytes) -> Iterator[int]:
         """Process an array message."""
 
-        size = self.array.size
-
-        # Quick sanity check.
-        data_len = len(data)
-        assert data_len % size == 0, (data_len, size)
-
-        with BytesIO(data) as stream:
-            for _ in range(data_len // size):
-                yield self.update_single(stream.read(size))
+        for frame in self.frames(data):
+            yield self.update_single(frame)
 
     def poll(self) -> None:
         """Update this instance's timestamp."""
@@ -103,6 +122,96 @@ class UdpStructTransceiver(UdpConnection, Generic[T]):
     # Make these private + add 'assign' method?
     struct_rx: Optional[T] = None
 
+    # Hold received structs for up to this long (per source) so that they
+    # can be processed in sequence order (disabled if zero).
+    reorder_window_ns: int = 0
+    reorder_depth: int = 64
+
+    sequence_metrics: SequenceMetrics
+
+    # Additional (unicast) addresses that every transmitted frame is sent to.
+    destinations: list[IpHostTuplelike]
+
+    @classmethod
+    async def create_connection(cls, markdown: str = None, **kwargs) -> Any:
+        """Create a UDP connection (with optional fan-out destinations)."""
+
+        destinations = kwargs.pop("destinations", [])
+
+        conn = await super().create_connection(markdown=markdown, **kwargs)
+        try:
+            for destination in destinations:
+                conn.add_destination(destination)
+        except ValueError:
+            await conn.close()
+            raise
+
+        return conn
+
+    def init(self) -> None:
+        """Initialize this instance."""
+
+        super().init()
+
+        self.destinations = []
+
+        self.sequence_metrics = SequenceMetrics.create()
+        self.register_sequence_metrics(self.sequence_metrics, "sequence")
+
+        self.sequence_trackers: dict[tuple[str, int], SequenceTracker] = {}
+        self.reorder_buffers: dict[tuple[str, int], ReorderBuffer[bytes]] = {}
+
+    def _tracker(self, addr: tuple[str, int]) -> SequenceTracker:
+        """Get the sequence tracker for a source address."""
+
+        tracker = self.sequence_trackers.get(addr)
+        if tracker is None:
+            tracker = SequenceTracker(self.sequence_metrics)
+            self.sequence_trackers[addr] = tracker
+            self.sequence_metrics.sources.value = len(self.sequence_trackers)
+            if self.reorder_window_ns > 0:
+                self.reorder_buffers[addr] = ReorderBuffer(
+                    self.reorder_window_ns, depth=self.reorder_depth
+                )
+
+        return tracker
+
+    def add_destination(self, addr: IpHostTuplelike) -> None:
+        """
+        Add a destination that transmitted frames are also sent to. This
+        requires an unconnected socket (e.g. 'connect: false' or
+        'multicast').
+        """
+
+        if self._transport.get_extra_info("peername") is not None:
+            raise ValueError(
+                f"Can't send to '{addr}' from a connected socket "
+                f"({self.remote_address})!"
+            )
+
+        addr = tuple(addr)  # type: ignore
+        if addr not in self.destinations:
+            self.destinations.append(addr)
+
+    def remove_destination(self, addr: IpHostTuplelike) -> None:
+        """Stop sending transmitted frames to a destination."""
+
+        addr = tuple(addr)  # type: ignore
+        if addr in self.destinations:
+            self.destinations.remove(addr)
+
+    def fan_out(self, data: bytes) -> None:
+        """
+        Send an (already encoded) frame to the remote address (if set) and
+        every fan-out destination.
+        """
+
+        if self.remote_address is not None:
+            self.sendto(data, addr=self.remote_address)
+
+        for addr in self.destinations:
+            self.sendto(data, addr=addr)
+
     def assign_tx(self, instance: T) -> None:
         """Assign a struct to this connection."""
 
@@ -113,6 +222,7 @@ class UdpStructTransceiver(UdpConnection, Generic[T]):
         assert self.struct_tx is None, "Transmit struct already assigned!"
 
         self.struct_tx = instance
+        instance.env.channels.consume()
         self.framer_tx = SerializableFramer(
             self.struct_tx.array, UDP_DEFAULT_MTU
         )
@@ -126,9 +236,14 @@ class UdpStructTransceiver(UdpConnection, Generic[T]):
                 result = self.framer_tx.capture()
             return result
 
-        # This actually sends data over this connection.
+        # This actually sends data over this connection. MTU probing needs a
+        # remote address (fan-out only connections assume Ethernet).
         self.framer_tx.set_mtu(
-            self.mtu(probe_create=get_payload),
+            (
+                self.mtu(probe_create=get_payload)
+                if self.remote_address is not None
+                else ETHERNET_MTU
+            ),
             logger=self.logger,
             protocol_overhead=UDP_HEADER_SIZE,
         )
@@ -182,21 +297,67 @@ class UdpStructTransceiver(UdpConnection, Generic[T]):
 
             result = self.framer_tx.capture(sample=sample, flush=flush)
             if result:
-                self.sendto(result)
+                self.fan_out(result)
+
+    def disable_extra(self) -> None:
+        """Additional tasks to perform when disabling."""
+
+        super().disable_extra()
+
+        # The transmit struct is no longer consumed by this connection.
+        if self.struct_tx is not None:
+            self.struct_tx.env.channels.consume(-1)
 
     def handle_update(
         self, timestamp_ns: int, instance: T, addr: tuple[str, int]
     ) -> None:
         """Handle individual struct updates."""
 
+    def release_reordered(self) -> None:
+        """
+        Process any held (re-ordered) structs that have waited for the entire
+        re-ordering window. Structs are otherwise only released as new ones
+        arrive, so this should be called periodically when re-ordering is
+        enabled.
+        """
+
+        instance = self.struct_rx
+        if instance is not None:
+            for addr, reorder in self.reorder_buffers.items():
+                for ready in reorder.release():
+                    self.handle_update(
+                        instance.update_single(ready), instance, addr
+                    )
+
     async def process_datagram(
         self, data: bytes, addr: tuple[str, int]
     ) -> bool:
         """Process an array of struct instances."""
 
         # Should we handle the other branch?
-        if self.struct_rx is not None:
-            for timestamp_ns in self.struct_rx.process_datagram(data):
-                self.handle_update(timestamp_ns, self.struct_rx, addr)
+        instance = self.struct_rx
+        if instance is not None:
+            tracker = self._tracker(addr)
+            arrival_ns = type(instance).time_keeper()
+            timestamp_ns = None
+
+            reorder = self.reorder_buffers.get(addr)
+            if reorder is None:
+                for frame in instance.frames(data):
+                    timestamp_ns = instance.update_single(frame)
+                    tracker(instance.sequence.value)
+                    self.handle_update(timestamp_ns, instance, addr)
+            else:
+                unpack_from = instance.header.unpack_from
+                for frame in instance.frames(data):
+                    timestamp_ns, sequence = unpack_from(frame)
+                    tracker(sequence)
+                    for ready in reorder.ingest(sequence, frame):
+                        self.handle_update(
+                            instance.update_single(ready), instance, addr
+                        )
+
+            if timestamp_ns is not None:
+                tracker.arrival(arrival_ns, timestamp_ns)
 
         return True
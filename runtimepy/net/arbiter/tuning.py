@@ -0,0 +1,148 @@
+"""
+A module implementing event-loop selection and tuning.
+"""
+
+# built-in
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from enum import StrEnum
+import gc
+from typing import Any, Optional
+
+# internal
+
+
+class LoopImplementation(StrEnum):
+    """Event-loop implementations."""
+
+    # Use uvloop if it's available.
+    AUTO = "auto"
+
+    ASYNCIO = "asyncio"
+    UVLOOP = "uvloop"
+
+
+def is_uvloop(loop: asyncio.AbstractEventLoop) -> bool:
+    """Determine if an event loop is a uvloop event loop."""
+    return type(loop).__module__.startswith("uvloop")
+
+
+@dataclass
+class LoopTuning:
+    """
+    Event-loop and garbage-collector settings (unset settings leave the
+    event loop's or garbage collector's current configuration as-is).
+    """
+
+    implementation: LoopImplementation = LoopImplementation.AUTO
+    debug: Optional[bool] = None
+    slow_callback_s: Optional[float] = None
+
+    # The default executor's maximum number of workers (zero uses the
+    # event loop's default executor).
+    executor_workers: int = 0
+
+    # Move objects created during initialization to a permanent generation
+    # (so they're never scanned by the garbage collector).
+    gc_freeze: bool = False
+
+    gc_thresholds: Optional[list[int]] = None
+
+    # Garbage-collector thresholds to restore (when settings are reverted).
+    _thresholds: Optional[tuple[int, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _frozen: bool = field(default=False, init=False, repr=False, compare=False)
+
+    @staticmethod
+    def create(data: Optional[dict[str, Any]]) -> "LoopTuning":
+        """Create settings from configuration data."""
+
+        names = {x.name for x in fields(LoopTuning) if x.init}
+        result = LoopTuning(
+            **{
+                key: val
+                for key, val in (data or {}).items()
+                if key in names and val is not None
+            }
+        )
+        result.implementation = LoopImplementation(result.implementation)
+        return result
+
+    def update(self, **kwargs) -> "LoopTuning":
+        """Create new settings with some values overridden."""
+        return LoopTuning.create({**self.asdict(), **kwargs})
+
+    def asdict(self) -> dict[str, Any]:
+        """Get these settings as a dictionary (omitting unset settings)."""
+
+        return {
+            x.name: (
+                str(getattr(self, x.name))
+                if x.name == "implementation"
+                else getattr(self, x.name)
+            )
+            for x in fields(self)
+            if x.init and getattr(self, x.name) is not None
+        }
+
+    def new_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Create a new event loop."""
+
+        if self.implementation is not LoopImplementation.ASYNCIO:
+            try:
+                # pylint: disable=import-outside-toplevel
+                import uvloop
+
+                return uvloop.new_event_loop()
+            except ImportError:
+                if self.implementation is LoopImplementation.UVLOOP:
+                    raise
+
+        return asyncio.new_event_loop()
+
+    def matches(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """Determine if an event loop is the configured implementation."""
+
+        return self.implementation is LoopImplementation.AUTO or (
+            is_uvloop(loop)
+            == (self.implementation is LoopImplementation.UVLOOP)
+        )
+
+    def apply(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Apply settings to an event loop (and the garbage collector)."""
+
+        if self.debug is not None:
+            loop.set_debug(self.debug)
+        if self.slow_callback_s is not None:
+            loop.slow_callback_duration = self.slow_callback_s
+
+        if self.executor_workers > 0:
+            loop.set_default_executor(
+                ThreadPoolExecutor(max_workers=self.executor_workers)
+            )
+
+        if self.gc_thresholds:
+            if self._thresholds is None:
+                self._thresholds = gc.get_threshold()
+            gc.set_threshold(*self.gc_thresholds)
+
+    def initialized(self) -> None:
+        """Apply settings that take effect after initialization."""
+
+        if self.gc_freeze and not self._frozen:
+            gc.collect()
+            gc.freeze()
+            self._frozen = True
+
+    def restore(self) -> None:
+        """Revert garbage-collector settings."""
+
+        if self._thresholds is not None:
+            gc.set_threshold(*self._thresholds)
+            self._thresholds = None
+
+        if self._frozen:
+            gc.unfreeze()
+            self._frozen = False
@@ -23,6 +23,7 @@ from runtimepy.channel.environment.command.processor import (
     ChannelCommandProcessor,
 )
 from runtimepy.metrics import ConnectionMetrics
+from runtimepy.metrics.profile import attributed
 from runtimepy.mixins.environment import ChannelEnvironmentMixin
 from runtimepy.mixins.logging import LoggerMixinLevelControl
 from runtimepy.net.backoff import ExponentialBackoff
@@ -67,6 +68,9 @@ class Connection(
         # task for it.
         self._binary_messages: _asyncio.Queue[BinaryMessage] = _asyncio.Queue()
 
+        # The size of queued (not yet sent) messages.
+        self._queued_bytes = 0
+
         # Tasks common to connection processing.
         self._tasks: list[_asyncio.Task[None]] = []
 
@@ -163,12 +167,22 @@ class Connection(
 
     def send_text(self, data: str) -> None:
         """Enqueue a text message to send."""
+        self._queued_bytes += len(data)
         self._text_messages.put_nowait(data)
 
     def send_binary(self, data: BinaryMessage) -> None:
         """Enqueue a binary message tos end."""
+        self._queued_bytes += len(data)
         self._binary_messages.put_nowait(data)
 
+    @property
+    def queued_bytes(self) -> int:
+        """
+        Get the size of messages waiting to be sent (text messages are
+        counted by characters).
+        """
+        return self._queued_bytes
+
     @property
     def disabled(self) -> bool:
         """Determine if this connection is disabled."""
@@ -330,9 +344,13 @@ class Connection(
                 if message is not None:
                     # Process a text or binary message.
                     if isinstance(message, str):
-                        result = await self.process_text(message)
+                        result = await attributed(
+                            self, self.process_text(message)
+                        )
                     else:
-                        result = await self.process_binary(message)
+                        result = await attributed(
+                            self, self.process_binary(message)
+                        )
 
                 # If we failed to read a message, disable.
                 if not result:
@@ -350,6 +368,7 @@ class Connection(
             # Process it.
             if data is not None:
                 await self._send_text_message(data)
+                self._queued_bytes -= len(data)
                 queue.task_done()
 
     async def _process_write_binary(self) -> None:
@@ -364,6 +383,7 @@ class Connection(
             # Process it.
             if data is not None:
                 await self._send_binay_message(data)
+                self._queued_bytes -= len(data)
                 queue.task_done()
 
     @property
@@ -5,12 +5,21 @@ A module implementing an HTTP-message processing interface.
 # built-in
 from typing import Iterator, Optional, cast
 
-# third-party
-from vcorelib.io import ByteFifo
-
 # internal
 from runtimepy.net.http.common import HeadersMixin
-from runtimepy.net.http.state import HeaderProcessingState, T
+from runtimepy.net.http.state import (
+    DEFAULT_MAX_HEADER_SIZE,
+    HEADER_END,
+    LINE_END,
+    HeaderProcessingState,
+    HeaderTooLarge,
+    MalformedMessage,
+    T,
+)
+
+__all__ = ["HttpMessageProcessor", "HeaderTooLarge", "MalformedMessage"]
+
+EMPTY = memoryview(b"")
 
 
 class HttpMessageProcessor:
@@ -19,40 +28,149 @@ class HttpMessageProcessor:
     stream.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_header_size: int = DEFAULT_MAX_HEADER_SIZE) -> None:
         """Initialize this instance."""
 
+        # Unprocessed data (contiguous) and data received since it was last
+        # made contiguous. Buffers are never modified in place, so yielded
+        # payloads remain valid.
+        self.data = EMPTY
+        self.chunks: list[bytes] = []
+        self.pending = 0
+
+        # The amount of contiguous data needed before processing can make
+        # progress (avoids re-joining buffers while receiving large bodies).
+        self.needed = 0
+
         # Header parsing.
-        self.buffer = ByteFifo()
-        self.header = HeaderProcessingState.create()
+        self.header = HeaderProcessingState.create(max_header_size)
 
         self.current_header: Optional[HeadersMixin] = None
 
+        # Chunks of a body using chunked transfer coding.
+        self.body_chunks: list[memoryview] = []
+
+    @property
+    def size(self) -> int:
+        """The number of unprocessed bytes."""
+        return len(self.data) + self.pending
+
+    def _coalesce(self) -> None:
+        """Make all buffered data contiguous."""
+
+        if self.chunks:
+            if not self.data and len(self.chunks) == 1:
+                self.data = memoryview(self.chunks[0])
+            else:
+                self.data = memoryview(b"".join([self.data, *self.chunks]))
+
+            self.chunks.clear()
+            self.pending = 0
+
+    def _read_chunks(self) -> bool:
+        """
+        Read as many complete chunks of a chunked body as possible. Returns
+        True when the last chunk (and any trailer section) has been read.
+        """
+
+        while True:
+            data = self.data
+
+            match = LINE_END.search(data)
+            if match is None:
+                return False
+
+            line = bytes(data[: match.start()])
+            try:
+                size = int(line.split(b";", maxsplit=1)[0], 16)
+            except ValueError as exc:
+                raise MalformedMessage(
+                    f"Invalid chunk size {line!r}."
+                ) from exc
+
+            # The last chunk is followed by an optional trailer section and
+            # an empty line.
+            if size == 0:
+                trailer = HEADER_END.search(data, match.start())
+                if trailer is None:
+                    return False
+                self.data = data[trailer.end() :]
+                return True
+
+            # Chunk data is followed by a line terminator.
+            chunk_end = match.end() + size
+            total = chunk_end + (
+                1 if len(data) > chunk_end and data[chunk_end] == 0x0A else 2
+            )
+            if len(data) < total:
+                self.needed = total
+                return False
+
+            self.body_chunks.append(data[match.end() : chunk_end])
+            self.data = data[total:]
+
+    def _chunked_body(self) -> Optional[memoryview]:
+        """Get a complete chunked body."""
+
+        chunks = self.body_chunks
+        self.body_chunks = []
+
+        if not chunks:
+            return None
+        if len(chunks) == 1:
+            return chunks[0]
+        return memoryview(b"".join(chunks))
+
     def ingest(
         self, data: bytes, kind: type[T]
-    ) -> Iterator[tuple[T, Optional[bytes]]]:
-        """Process a binary frame."""
+    ) -> Iterator[tuple[T, Optional[memoryview]]]:
+        """
+        Process a binary frame. Payloads are views of the received data.
+        """
+
+        if data:
+            self.chunks.append(data)
+            self.pending += len(data)
+
+        if self.size < self.needed:
+            return
 
-        self.buffer.ingest(data)
+        self._coalesce()
+        self.needed = 0
 
-        can_read_payload = True
-        while self.buffer.size > 0 and can_read_payload:
+        while self.data:
             # Finish parsing header if necessary.
             if self.current_header is None:
-                self.current_header = self.header.service(self.buffer, kind)
+                self.current_header, consumed = self.header.service(
+                    self.data, kind
+                )
+                if self.current_header is None:
+                    break
+
+                self.data = self.data[consumed:]
 
-            # Read payload data.
-            if self.current_header is not None:
-                payload = None
+            payload = None
 
-                # Determine if any data payload is expected, and if so if we
-                # have enough bytes to fully read it.
+            if self.current_header.chunked:
+                if not self._read_chunks():
+                    break
+                payload = self._chunked_body()
+
+            # Determine if any data payload is expected, and if so if we have
+            # enough bytes to fully read it.
+            else:
                 payload_len = self.current_header.content_length
-                can_read_payload = (
-                    payload_len == 0 or self.buffer.size >= payload_len
-                )
-                if can_read_payload:
-                    if payload_len > 0:
-                        payload = self.buffer.pop(payload_len)
-                    yield cast(T, self.current_header), payload
-                    self.current_header = None
+                if len(self.data) < payload_len:
+                    self.needed = payload_len
+                    break
+
+                if payload_len > 0:
+                    payload = self.data[:payload_len]
+                    self.data = self.data[payload_len:]
+
+            header = cast(T, self.current_header)
+            self.current_header = None
+            yield header, payload
+
+        if not self.data:
+            self.data = EMPTY
@@ -11,6 +11,9 @@ from typing import Optional, TextIO, Union
 from vcorelib import DEFAULT_ENCODING
 from vcorelib.logging import LoggerType
 
+# internal
+from runtimepy.net.http.version import HttpVersion
+
 HTTPMethodlike = Union[str, http.HTTPMethod]
 HEADER_LINESEP = "\r\n"
 
@@ -52,6 +55,22 @@ class HeadersMixin(ABC):
         """Get a value for context length."""
         return int(self.get("content-length", "0"))  # type: ignore
 
+    @property
+    def chunked(self) -> bool:
+        """Determine if this message's body uses chunked transfer coding."""
+        return "chunked" in str(self.get("transfer-encoding", "")).lower()
+
+    def persistent(self, version: HttpVersion) -> bool:
+        """
+        Determine if a connection should persist after this message (given
+        the message's protocol version).
+        """
+
+        options = str(self.get("connection", "")).lower()
+        if "close" in options:
+            return False
+        return version.persistent or "keep-alive" in options
+
     def write_field_lines(self, stream: TextIO) -> None:
         """Write field lines to a stream."""
 
@@ -4,57 +4,89 @@ A module implementing an HTTP-header processing state interface.
 
 # built-in
 from dataclasses import dataclass
+import re
 from typing import Optional, TypeVar
 
 # third-party
 from vcorelib import DEFAULT_ENCODING
-from vcorelib.io import ByteFifo
 
 # internal
 from runtimepy.net.http.common import HeadersMixin
 
 T = TypeVar("T", bound=HeadersMixin)
 
+# The end of the header section (an empty line). Bare line feeds are also
+# recognized as line terminators (RFC 9112, section 2.2).
+HEADER_END = re.compile(b"\r?\n\r?\n")
+HEADER_END_MAX = 4
+LINE_END = re.compile(b"\r?\n")
+
+# Line terminators that may precede a message (and are ignored).
+LEADING_LINES = b"\r\n"
+
+DEFAULT_MAX_HEADER_SIZE = 16 * 1024
+
+
+class HeaderTooLarge(ValueError):
+    """The header section of an HTTP message exceeds the configured limit."""
+
+
+class MalformedMessage(ValueError):
+    """An HTTP message can't be parsed."""
+
 
 @dataclass
 class HeaderProcessingState:
     """A container for header-related processing state."""
 
-    lines: list[str]
-    line: str
+    max_size: int
+
+    # How much of the current buffer has already been searched for the end
+    # of the header section.
+    scanned: int = 0
 
     @staticmethod
-    def create() -> "HeaderProcessingState":
+    def create(
+        max_size: int = DEFAULT_MAX_HEADER_SIZE,
+    ) -> "HeaderProcessingState":
         """Create a default instance."""
-        return HeaderProcessingState([], "")
+        return HeaderProcessingState(max_size)
 
-    def service(self, buffer: ByteFifo, kind: type[T]) -> Optional[T]:
+    def service(
+        self, data: memoryview, kind: type[T]
+    ) -> tuple[Optional[T], int]:
         """
-        Continue processing the input fifo as if it contains request-header
-        data.
+        Attempt to parse a header section from the start of a buffer. Returns
+        the header (if the entire section is buffered) and the number of bytes
+        it occupied. Buffers passed to successive calls must begin with the
+        same data (until a header is returned).
         """
 
-        result = None
+        start = 0
+        size = len(data)
+        while start < size and data[start] in LEADING_LINES:
+            start += 1
 
-        while result is None and buffer.size:
-            curr_raw = buffer.pop(1)
-            if curr_raw is not None:
-                curr = curr_raw.decode(encoding=DEFAULT_ENCODING)
+        match = HEADER_END.search(
+            data, max(start, self.scanned - (HEADER_END_MAX - 1))
+        )
+        end = size if match is None else match.start()
 
-                # Any '\r\n' sequence signifies the end of a header line.
-                if curr == "\n":
-                    if self.line:
-                        self.lines.append(self.line)
-                        self.line = ""
+        if end - start > self.max_size:
+            raise HeaderTooLarge(
+                f"Header section exceeds {self.max_size} bytes!"
+            )
 
-                    # Two sequences in a row signifies the end of the header
-                    # section.
-                    else:
-                        result = kind()
-                        result.from_lines(self.lines)
-                        self.lines = []
+        if match is None:
+            self.scanned = size
+            return None, 0
 
-                elif curr != "\r":
-                    self.line += curr
+        self.scanned = 0
 
-        return result
+        result = kind()
+        result.from_lines(
+            str(data[start:end], DEFAULT_ENCODING)
+            .replace("\r", "")
+            .split("\n")
+        )
+        return result, match.end()
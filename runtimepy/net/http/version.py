@@ -32,6 +32,13 @@ class HttpVersion:
         """Get version information as a string."""
         return f"HTTP/{major}.{minor}"
 
+    @property
+    def persistent(self) -> bool:
+        """
+        Whether or not connections persist by default (HTTP/1.1 and later).
+        """
+        return (self.major, self.minor) >= (1, 1)
+
     def __str__(self) -> str:
         """Get this instance as a string."""
         return HttpVersion.version_str(major=self.major, minor=self.minor)
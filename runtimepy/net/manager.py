@@ -7,12 +7,13 @@ from __future__ import annotations
 # built-in
 import asyncio as _asyncio
 from contextlib import suppress as _suppress
+from functools import partial as _partial
 from typing import Iterator as _Iterator
 from typing import Optional as _Optional
 from typing import TypeVar as _TypeVar
 
 # third-party
-from vcorelib.asyncio import log_exceptions as _log_exceptions
+from vcorelib.asyncio import log_task_exception as _log_task_exception
 from vcorelib.logging import LoggerMixin
 from vcorelib.math import metrics_time_ns as _metrics_time_ns
 
@@ -31,7 +32,12 @@ class ConnectionManager(LoggerMixin):
         super().__init__()
         self.queue: _asyncio.Queue[_Connection] = _asyncio.Queue()
         self._running = False
-        self._conns: list[_Connection] = []
+        self._stop_sig: _Optional[_asyncio.Event] = None
+
+        # Managed connections (and their processing tasks). Connections are
+        # added and removed as events occur (instead of scanning every
+        # connection on every event).
+        self._conns: dict[_Connection, _Optional[_asyncio.Task[None]]] = {}
 
     @property
     def num_connections(self) -> int:
@@ -41,12 +47,12 @@ class ConnectionManager(LoggerMixin):
     @property
     def connection_tasks(self) -> _Iterator[_asyncio.Task[None]]:
         """Iterate over connection tasks."""
-        for conn in self._conns:
+        for conn in list(self._conns):
             yield from conn.tasks
 
     def by_type(self, kind: type[T]) -> _Iterator[T]:
         """Iterate over connections of a specific type."""
-        for conn in self._conns:
+        for conn in list(self._conns):
             if isinstance(conn, kind):
                 yield conn
 
@@ -64,6 +70,48 @@ class ConnectionManager(LoggerMixin):
         for conn in self._conns:
             conn.metrics.poll(time_ns=time_ns)
 
+    def _process(self, conn: _Connection) -> None:
+        """Create a processing task for a connection."""
+
+        # Don't process connections that were closed before being managed.
+        if conn.disabled and not conn.auto_restart:
+            return
+
+        assert self._stop_sig is not None
+
+        # Start processing immediately (so connections can't be closed
+        # between being checked and starting to process).
+        task = _asyncio.eager_task_factory(
+            _asyncio.get_running_loop(), conn.process(stop_sig=self._stop_sig)
+        )
+        self._conns[conn] = task
+        task.add_done_callback(_partial(self._processed, conn))
+
+    def _processed(self, conn: _Connection, task: _asyncio.Task[None]) -> None:
+        """Handle a connection's processing task completing."""
+
+        _log_task_exception(task, logger=self.logger)
+
+        # Ignore tasks for connections that are no longer managed.
+        if self._conns.get(conn) is not task:
+            return
+
+        # Check if this connection should be restarted.
+        if (
+            conn.disabled
+            and conn.auto_restart
+            and self._stop_sig is not None
+            and not self._stop_sig.is_set()
+        ):
+            self._process(conn)
+
+        # Filter out disabled connections.
+        elif conn.disabled:
+            del self._conns[conn]
+
+        else:
+            self._conns[conn] = None
+
     async def manage(self, stop_sig: _asyncio.Event) -> None:
         """Handle incoming connections until the stop signal is set."""
 
@@ -73,10 +121,10 @@ class ConnectionManager(LoggerMixin):
             return
 
         self._running = True
+        self._stop_sig = stop_sig
 
         stop_sig_task = _asyncio.create_task(stop_sig.wait())
-        tasks: list[_asyncio.Task[None]] = []
-        self._conns = []
+        self._conns = {}
         new_conn_task: _Optional[_asyncio.Task[_Connection]] = None
 
         while not stop_sig.is_set():
@@ -85,48 +133,32 @@ class ConnectionManager(LoggerMixin):
                 # Wait for a connection to be established.
                 new_conn_task = _asyncio.create_task(self.queue.get())
 
-            # Wait for any task to complete.
+            # Wait for a new connection (or the stop signal).
             await _asyncio.wait(
-                [stop_sig_task, new_conn_task] + tasks,  # type: ignore
+                [stop_sig_task, new_conn_task],
                 return_when=_asyncio.FIRST_COMPLETED,
             )
 
-            # Filter completed tasks out of the working set.
-            next_tasks = _log_exceptions(tasks)
-
-            # Filter out disabled connections.
-            enabled = []
-            for conn in self._conns:
-                if not conn.disabled:
-                    enabled.append(conn)
-
-                # Check if this connection should be restarted.
-                elif conn.auto_restart:
-                    next_tasks.append(
-                        _asyncio.create_task(conn.process(stop_sig=stop_sig))
-                    )
-                    enabled.append(conn)
-
-            self._conns = enabled
-
             # If a new connection was made, register a task for processing
-            # it.
+            # it (and any others already queued).
             if new_conn_task.done():
-                new_conn = new_conn_task.result()
-                self._conns.append(new_conn)
-                next_tasks.append(
-                    _asyncio.create_task(new_conn.process(stop_sig=stop_sig))
-                )
+                self._process(new_conn_task.result())
                 new_conn_task = None
 
-            tasks = next_tasks
+                while not self.queue.empty():
+                    self._process(self.queue.get_nowait())
 
         with self.log_time("Shutting down", reminder=True):
             # Allow existing tasks to clean up.
             if new_conn_task is not None:
                 new_conn_task.cancel()
+                with _suppress(_asyncio.CancelledError):
+                    await new_conn_task
+
+            tasks = [x for x in self._conns.values() if x is not None]
             if tasks:
                 with _suppress(_asyncio.TimeoutError):
                     await _asyncio.wait_for(_asyncio.gather(*tasks), 1.0)
 
         self._running = False
+        self._stop_sig = None
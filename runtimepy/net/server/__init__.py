@@ -22,13 +22,17 @@ from runtimepy.net.html import full_markdown_page
 from runtimepy.net.http.header import RequestHeader
 from runtimepy.net.http.request_target import PathMaybeQuery
 from runtimepy.net.http.response import ResponseHeader
+from runtimepy.net.server.history import history_handler
 from runtimepy.net.server.html import HtmlApp, HtmlApps, get_html, html_handler
 from runtimepy.net.server.json import encode_json, json_handler
 from runtimepy.net.server.markdown import markdown_for_dir
-from runtimepy.net.tcp.http import HttpConnection
+from runtimepy.net.server.render import RenderCache
+from runtimepy.net.server.static import StaticFile, StaticFileCache
+from runtimepy.net.tcp.http import HttpBody, HttpConnection
 from runtimepy.util import normalize_root, path_has_part, read_binary
 
 MIMETYPES_INIT = False
+HTML_CONTENT_TYPE = f"text/html; charset={DEFAULT_ENCODING}"
 
 
 def package_data_dir() -> Path:
@@ -55,6 +59,17 @@ class RuntimepyServerConnection(HttpConnection):
     class_paths: list[Pathlike] = [Path(), package_data_dir()]
     class_redirect_paths: dict[Path, Union[str, Path]] = {}
 
+    # Static files are served from memory (and pre-compressed).
+    static_cache_budget: int = 32 * 1024 * 1024
+    static_cache: StaticFileCache
+
+    # Request paths previously resolved to static files (per set of search
+    # paths).
+    static_paths: dict[tuple[tuple[Path, ...], str], Path] = {}
+
+    # Rendered markdown pages and directory listings.
+    render_cache: RenderCache[bytes] = RenderCache()
+
     def add_path(self, path: Pathlike, front: bool = False) -> None:
         """Add a path."""
 
@@ -109,6 +124,13 @@ class RuntimepyServerConnection(HttpConnection):
                 with favicon.open("rb") as favicon_fd:
                     type(self).favicon_data = favicon_fd.read()
 
+        # Create the static-file cache if necessary.
+        if not hasattr(type(self), "static_cache"):
+            cache = StaticFileCache(type(self).static_cache_budget)
+            with self.log_time("Pre-loading static files"):
+                cache.preload(package_data_dir())
+            type(self).static_cache = cache
+
     def redirect_to(
         self,
         path: str,
@@ -154,7 +176,7 @@ class RuntimepyServerConnection(HttpConnection):
                 uri_query=query,
             )
 
-        response["Content-Type"] = f"text/html; charset={DEFAULT_ENCODING}"
+        response["Content-Type"] = HTML_CONTENT_TYPE
 
         return document.encode_str().encode()
 
@@ -167,16 +189,101 @@ class RuntimepyServerConnection(HttpConnection):
     ) -> bytes:
         """Render a markdown file as HTML and return the result."""
 
-        return self.render_markdown(
-            (await read_binary(path)).decode(), response, query, **kwargs
-        )
+        stat = path.stat()
+        key = (path, query, tuple(sorted(kwargs.items())))
+        validator = (stat.st_mtime_ns, stat.st_size)
+
+        result = self.render_cache.get(key, validator)
+        if result is None:
+            result = self.render_cache.put(
+                key,
+                self.render_markdown(
+                    (await read_binary(path)).decode(),
+                    response,
+                    query,
+                    **kwargs,
+                ),
+                validator,
+            )
+        else:
+            response["Content-Type"] = HTML_CONTENT_TYPE
+
+        return result
+
+    def render_directory(
+        self, path: Path, response: ResponseHeader, query: Optional[str]
+    ) -> bytes:
+        """Render a directory listing as HTML and return the result."""
+
+        key = (path, query, tuple(self.apps))
+        validator = path.stat().st_mtime_ns
+
+        result = self.render_cache.get(key, validator)
+        if result is None:
+            result = self.render_cache.put(
+                key,
+                self.render_markdown(
+                    markdown_for_dir(path, {"applications": self.apps.keys()}),
+                    response,
+                    query,
+                ),
+                validator,
+            )
+        else:
+            response["Content-Type"] = HTML_CONTENT_TYPE
+
+        return result
+
+    def serve_static(
+        self,
+        entry: StaticFile,
+        response: ResponseHeader,
+        request: RequestHeader = None,
+    ) -> bytes:
+        """Respond with a static file."""
+
+        # Set MIME type if it can be determined.
+        if entry.mime:
+            response["Content-Type"] = entry.mime
+
+        response["ETag"] = entry.etag
+        response["Last-Modified"] = entry.last_modified
+        response["Cache-Control"] = "no-cache"
+
+        if entry.variants:
+            response["Vary"] = "Accept-Encoding"
+
+        if request is None:
+            return entry.data
+
+        if entry.not_modified(request):
+            response.status = http.HTTPStatus.NOT_MODIFIED
+            return bytes()
+
+        data, coding = entry.body(request)
+        if coding:
+            response["Content-Encoding"] = coding
+        return data
 
     async def try_file(
-        self, path: PathMaybeQuery, response: ResponseHeader
+        self,
+        path: PathMaybeQuery,
+        response: ResponseHeader,
+        request: RequestHeader = None,
     ) -> Optional[bytes]:
         """Try serving this path as a file directly from the file-system."""
 
         result = None
+        cache = self.static_cache
+
+        # Check for a previously resolved file first.
+        key = (tuple(self.paths), path[0])
+        resolved = self.static_paths.get(key)
+        if resolved is not None:
+            entry = await cache.get(resolved)
+            if entry is not None:
+                return self.serve_static(entry, response, request)
+            del self.static_paths[key]
 
         # Keep track of directories encountered.
         directories: list[Path] = []
@@ -201,31 +308,18 @@ class RuntimepyServerConnection(HttpConnection):
                     )
 
             # Handle files.
-            if candidate.is_file():
-                mime, encoding = mimetypes.guess_type(candidate, strict=False)
-
-                # Set MIME type if it can be determined.
-                if mime:
-                    response["Content-Type"] = mime
-
-                # We don't handle this yet.
-                assert not encoding, (candidate, mime, encoding)
-
-                self.logger.info("Serving '%s' (MIME: %s)", candidate, mime)
-
-                # Return the file data.
-                result = await read_binary(candidate)
+            entry = await cache.get(candidate)
+            if entry is not None:
+                self.logger.info(
+                    "Serving '%s' (MIME: %s)", candidate, entry.mime
+                )
+                self.static_paths[key] = candidate
+                result = self.serve_static(entry, response, request)
                 break
 
         # Handle a directory as a last resort.
-        if not result and directories:
-            result = self.render_markdown(
-                markdown_for_dir(
-                    directories[0], {"applications": self.apps.keys()}
-                ),
-                response,
-                path[1],
-            )
+        if result is None and directories:
+            result = self.render_directory(directories[0], response, path[1])
 
         return result
 
@@ -258,7 +352,7 @@ class RuntimepyServerConnection(HttpConnection):
         self,
         response: ResponseHeader,
         request: RequestHeader,
-        request_data: Optional[bytes],
+        request_data: Optional[memoryview],
     ) -> Optional[bytes]:
         """Handle POST requests."""
 
@@ -280,8 +374,8 @@ class RuntimepyServerConnection(HttpConnection):
         self,
         response: ResponseHeader,
         request: RequestHeader,
-        request_data: Optional[bytes],
-    ) -> Optional[bytes]:
+        request_data: Optional[memoryview],
+    ) -> Optional[HttpBody]:
         """Handle GET requests."""
 
         request.log(self.logger, False, level=logging.INFO)
@@ -299,12 +393,19 @@ class RuntimepyServerConnection(HttpConnection):
                     return self.favicon_data
 
                 # Try serving a file and handling redirects.
-                for handler in [self.try_redirect, self.try_file]:
-                    result = await handler(
-                        request.target.origin_form, response
+                result = await self.try_redirect(
+                    request.target.origin_form, response
+                )
+                if result is None:
+                    result = await self.try_file(
+                        request.target.origin_form, response, request=request
                     )
-                    if result is not None:
-                        return result
+                if result is not None:
+                    return result
+
+                # Handle channel-history queries.
+                if path_has_part(path, "history"):
+                    return history_handler(request, response)
 
                 # Handle raw data queries.
                 if path_has_part(request.target.path):
@@ -23,6 +23,7 @@ class WebApplication:
 
     worker_classes = [
         "JsonConnection",
+        "MessagePack",
         "DataConnection",
         "PointBuffer",
         "PointManager",
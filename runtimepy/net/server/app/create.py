@@ -15,7 +15,7 @@ from runtimepy.net.html.bootstrap.tabs import TabbedContent
 from runtimepy.net.http.header import RequestHeader
 from runtimepy.net.http.response import ResponseHeader
 from runtimepy.net.server.app.base import WebApplication
-from runtimepy.net.server.html import HtmlApp
+from runtimepy.net.server.html import HtmlApp, render_cached
 
 DOCUMENTS: dict[str, Html] = {}
 T = TypeVar("T")
@@ -29,7 +29,8 @@ def config_param(
 
 
 HtmlAppComposer = Callable[
-    [AppInfo, Html, RequestHeader, ResponseHeader, Optional[bytes]], Html
+    [AppInfo, Html, RequestHeader, ResponseHeader, Optional[memoryview]],
+    Html,
 ]
 
 
@@ -43,7 +44,7 @@ def create_cacheable_app(app: AppInfo, compose: HtmlAppComposer) -> HtmlApp:
         document: Html,
         request: RequestHeader,
         response: ResponseHeader,
-        request_data: Optional[bytes],
+        request_data: Optional[memoryview],
     ) -> Html:
         """A simple 'Hello, world!' application."""
 
@@ -67,6 +68,11 @@ def create_cacheable_app(app: AppInfo, compose: HtmlAppComposer) -> HtmlApp:
                 )
                 DOCUMENTS[compose_name] = document
 
+                # Documents that will be re-used only need to be rendered
+                # once.
+                if config_param(app, "caching", True):
+                    render_cached(document)
+
         return document
 
     return cached_app
@@ -82,7 +88,7 @@ def create_app(
         document: Html,
         request: RequestHeader,
         response: ResponseHeader,
-        request_data: Optional[bytes],
+        request_data: Optional[memoryview],
     ) -> Html:
         """Main package web application."""
 
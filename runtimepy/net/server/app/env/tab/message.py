@@ -21,6 +21,10 @@ class ChannelEnvironmentTabMessaging(ChannelEnvironmentTabBase):
     def _setup_callback(self, name: str, state: TabState) -> None:
         """Register a channel's value-change callback."""
 
+        # Callbacks only need to be registered once (while shown).
+        if name in state.callbacks:
+            return
+
         chan = self.command.env.field_or_channel(name)
         assert isinstance(chan, Channel) or chan is not None
         prim = chan.raw
@@ -30,8 +34,8 @@ class ChannelEnvironmentTabMessaging(ChannelEnvironmentTabBase):
 
             # Render enumerations etc. here instead of trying to do it
             # in the UI.
-            state.points[name].append(
-                (self.command.env.value(name), prim.last_updated_ns)
+            state.add_point(
+                name, (self.command.env.value(name), prim.last_updated_ns)
             )
 
         state.primitives[name] = prim
@@ -111,6 +115,13 @@ class ChannelEnvironmentTabMessaging(ChannelEnvironmentTabBase):
                 level=logging.INFO if result else logging.ERROR,
             )
 
+        # Handle plot-related messages.
+        elif kind == "plot":
+            value = data["value"]
+            state.set_plotted(value["channel"], value["state"])
+        elif kind == "plot.decimation":
+            state.decimation.update(data)
+
         # Handle tab-event messages.
         elif kind.startswith("tab"):
             if "shown" in kind:
@@ -20,7 +20,7 @@ def landing_page(
     document: Html,
     request: RequestHeader,
     response: ResponseHeader,
-    request_data: Optional[bytes],
+    request_data: Optional[memoryview],
 ) -> Html:
     """Create a landing page application"""
 
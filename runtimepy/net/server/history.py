@@ -0,0 +1,203 @@
+"""
+A module implementing a binary (columnar) channel-history endpoint.
+"""
+
+# built-in
+from array import array
+import http
+import json
+import sys
+from typing import Any, AsyncIterator, Optional
+from urllib.parse import parse_qs
+
+# third-party
+from vcorelib import DEFAULT_ENCODING
+
+# internal
+from runtimepy.channel.environment.command import GLOBAL, GlobalEnvironment
+from runtimepy.channel.history import (
+    DTYPE_CODES,
+    TIMESTAMP_CODE,
+    TIMESTAMP_DTYPE,
+    HistorySelection,
+    little_endian,
+)
+from runtimepy.net.http.header import RequestHeader
+from runtimepy.net.http.response import ResponseHeader
+from runtimepy.net.tcp.http import HttpBody
+from runtimepy.util import parse_path_parts
+
+HISTORY_CONTENT_TYPE = "application/vnd.runtimepy.history"
+HISTORY_FORMAT = "runtimepy-history/1"
+
+# The size of individual chunks of array data written to a response.
+HISTORY_CHUNK_SIZE = 64 * 1024
+
+# The response starts with this many bytes: the (little-endian) size of the
+# JSON header that follows.
+HEADER_SIZE_BYTES = 4
+
+
+def history_header(
+    env: str, selections: list[HistorySelection]
+) -> dict[str, object]:
+    """Create a JSON header describing the arrays that follow it."""
+
+    return {
+        "format": HISTORY_FORMAT,
+        "environment": env,
+        "byteorder": "little",
+        "timestamp_dtype": TIMESTAMP_DTYPE,
+        "channels": [
+            {
+                "name": item.name,
+                "kind": str(item.kind),
+                "dtype": item.dtype,
+                "count": len(item),
+            }
+            for item in selections
+        ],
+    }
+
+
+async def stream_history(
+    env: str,
+    selections: list[HistorySelection],
+    chunk_size: int = HISTORY_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    Stream channel history: a size-prefixed JSON header, then (for each
+    channel in order) raw timestamp and value arrays.
+    """
+
+    header = json.dumps(
+        history_header(env, selections), separators=(",", ":")
+    ).encode(DEFAULT_ENCODING)
+
+    yield len(header).to_bytes(HEADER_SIZE_BYTES, "little") + header
+
+    for item in selections:
+        for column in (item.timestamps, item.values):
+            data = memoryview(little_endian(column))
+            for idx in range(0, len(data), chunk_size):
+                yield bytes(data[idx : idx + chunk_size])
+
+
+def decode_history(
+    data: bytes,
+) -> tuple[dict[str, Any], dict[str, tuple[array[int], array[Any]]]]:
+    """
+    Decode a history response into its JSON header and (timestamp, value)
+    arrays for each channel.
+    """
+
+    view = memoryview(data)
+    size = int.from_bytes(view[:HEADER_SIZE_BYTES], "little")
+    offset = HEADER_SIZE_BYTES + size
+    header = json.loads(str(view[HEADER_SIZE_BYTES:offset], DEFAULT_ENCODING))
+
+    result = {}
+    for channel in header["channels"]:
+        columns = []
+        for code in (TIMESTAMP_CODE, DTYPE_CODES[channel["dtype"]]):
+            column = array(code)
+            end = offset + column.itemsize * channel["count"]
+            column.frombytes(view[offset:end])
+            if sys.byteorder != "little":  # pragma: nocover
+                column.byteswap()
+            columns.append(column)
+            offset = end
+
+        result[channel["name"]] = (columns[0], columns[1])
+
+    return header, result
+
+
+def parse_history_query(
+    query: Optional[str],
+) -> tuple[Optional[list[str]], Optional[int], Optional[int]]:
+    """Parse channel names and a time range from a query string."""
+
+    parsed = parse_qs(query or "")
+
+    names: Optional[list[str]] = None
+    if "channels" in parsed:
+        names = [
+            name
+            for item in parsed["channels"]
+            for name in item.split(",")
+            if name
+        ]
+
+    start = parsed.get("start")
+    end = parsed.get("end")
+
+    return (
+        names,
+        int(start[0]) if start else None,
+        int(end[0]) if end else None,
+    )
+
+
+def history_error(
+    response: ResponseHeader, status: http.HTTPStatus, message: str
+) -> bytes:
+    """Create an error response."""
+
+    response.status = status
+    response["Content-Type"] = f"application/json; charset={DEFAULT_ENCODING}"
+    return json.dumps({"error": message}).encode(DEFAULT_ENCODING) + b"\n"
+
+
+def history_handler(
+    request: RequestHeader,
+    response: ResponseHeader,
+    environments: GlobalEnvironment = None,
+    key: str = "history",
+) -> HttpBody:
+    """
+    Handle a request for channel history, e.g.
+    '/history/<env>?channels=a,b&start=<ns>&end=<ns>'.
+    """
+
+    if environments is None:
+        environments = GLOBAL
+
+    assert request.target.origin_form is not None
+    path, query = request.target.origin_form
+
+    parts = [x for x in parse_path_parts(path, key=key) if x]
+    if len(parts) != 1:
+        return history_error(
+            response,
+            http.HTTPStatus.NOT_FOUND,
+            f"Expected '/{key}/<environment>' "
+            f"(recording: {list(environments.history)}).",
+        )
+
+    env = parts[0]
+    recorder = environments.history.get(env)
+    if recorder is None:
+        return history_error(
+            response,
+            http.HTTPStatus.NOT_FOUND,
+            f"No history recorded for environment '{env}'.",
+        )
+
+    try:
+        names, start, end = parse_history_query(query)
+    except ValueError as exc:
+        return history_error(response, http.HTTPStatus.BAD_REQUEST, str(exc))
+
+    missing = [x for x in names or [] if x not in recorder.channels]
+    if missing:
+        return history_error(
+            response,
+            http.HTTPStatus.NOT_FOUND,
+            f"No history recorded for channel(s): {', '.join(missing)}.",
+        )
+
+    response["Content-Type"] = HISTORY_CONTENT_TYPE
+    return stream_history(
+        env, recorder.select(names=names, start_ns=start, end_ns=end)
+    )
@@ -3,6 +3,7 @@ A module implementing HTML interfaces for web applications.
 """
 
 # built-in
+from io import StringIO
 from typing import Awaitable, Callable, Optional, TextIO
 
 # third-party
@@ -12,13 +13,26 @@ from vcorelib import DEFAULT_ENCODING
 # internal
 from runtimepy.net.http.header import RequestHeader
 from runtimepy.net.http.response import ResponseHeader
+from runtimepy.net.server.render import RenderCache
 from runtimepy.net.tcp.http import HttpConnection
 
 HtmlApp = Callable[
-    [Html, RequestHeader, ResponseHeader, Optional[bytes]], Awaitable[Html]
+    [Html, RequestHeader, ResponseHeader, Optional[memoryview]],
+    Awaitable[Html],
 ]
 HtmlApps = dict[str, HtmlApp]
 
+# Rendered documents (for applications that re-use documents).
+RENDERED: RenderCache[str] = RenderCache(capacity=32)
+
+
+def render_cached(document: Html) -> str:
+    """Render a document and cache the result."""
+
+    with StringIO() as stream:
+        document.render(stream)
+        return RENDERED.put(document, stream.getvalue())
+
 
 def get_html() -> Html:
     """Get a default HTML document."""
@@ -31,7 +45,7 @@ async def html_handler(
     stream: TextIO,
     request: RequestHeader,
     response: ResponseHeader,
-    request_data: Optional[bytes],
+    request_data: Optional[memoryview],
     default_app: HtmlApp = None,
 ) -> bool:
     """Render an HTML document in response to an HTTP request."""
@@ -42,6 +56,12 @@ async def html_handler(
     # Create the application.
     app = apps.get(request.target.path, default_app)
     if app is not None:
-        (await app(get_html(), request, response, request_data)).render(stream)
+        document = await app(get_html(), request, response, request_data)
+
+        rendered = RENDERED.get(document)
+        if rendered is not None:
+            stream.write(rendered)
+        else:
+            document.render(stream)
 
     return app is not None
@@ -0,0 +1,58 @@
+"""
+A module implementing a cache for rendered web-server content.
+"""
+
+# built-in
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Generic, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class RenderCache(Generic[V]):
+    """
+    A least-recently-used cache of rendered content. Entries are stored with
+    a validator (e.g. a source file's modification time) and are only used
+    while the validator still matches.
+    """
+
+    def __init__(self, capacity: int = 128) -> None:
+        """Initialize this instance."""
+
+        self.capacity = capacity
+        self.entries: OrderedDict[Hashable, tuple[Any, V]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, validator: Any = None) -> Optional[V]:
+        """Get a cached value (if it's still valid)."""
+
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] == validator:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, value: V, validator: Any = None) -> V:
+        """Store a value (evicting the least-recently used if necessary)."""
+
+        self.entries[key] = (validator, value)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+        return value
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """Remove a specific entry (or all entries)."""
+
+        if key is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(key, None)
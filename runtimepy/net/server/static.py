@@ -0,0 +1,301 @@
+"""
+A module implementing an in-memory cache of static files for the HTTP
+server.
+"""
+
+# built-in
+import asyncio
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+import gzip
+import mimetypes
+import os
+from pathlib import Path
+from stat import S_ISREG
+from typing import Iterable, NamedTuple, Optional
+
+# third-party
+try:
+    import brotli
+except ImportError:  # pragma: nocover
+    brotli = None
+
+# internal
+from runtimepy.net.http.header import RequestHeader
+from runtimepy.util import read_binary
+
+# Content types that benefit from compression.
+COMPRESSIBLE = ("text/", "application/javascript", "application/json")
+COMPRESSIBLE_SUFFIXES = ("+xml", "+json", "/xml")
+COMPRESS_MIN_SIZE = 256
+COMPRESS_MAX_SIZE = 8 * 1024 * 1024
+
+# Content types for files that are themselves compressed.
+ENCODED_TYPES = {
+    "gzip": "application/gzip",
+    "br": "application/x-brotli",
+    "bzip2": "application/x-bzip2",
+    "xz": "application/x-xz",
+}
+
+
+def compressible(mime: Optional[str]) -> bool:
+    """Determine if content of a given type should be compressed."""
+
+    return mime is not None and (
+        mime.startswith(COMPRESSIBLE) or mime.endswith(COMPRESSIBLE_SUFFIXES)
+    )
+
+
+def compress(data: bytes, mime: Optional[str]) -> dict[str, bytes]:
+    """Create compressed variants of file data (keyed by content coding)."""
+
+    result: dict[str, bytes] = {}
+
+    if COMPRESS_MIN_SIZE <= len(data) <= COMPRESS_MAX_SIZE and compressible(
+        mime
+    ):
+        if brotli is not None:
+            result["br"] = brotli.compress(data, quality=9)
+        result["gzip"] = gzip.compress(data, compresslevel=9, mtime=0)
+
+    # Only keep variants that are actually smaller.
+    return {key: val for key, val in result.items() if len(val) < len(data)}
+
+
+def guess_mime(path: Path) -> Optional[str]:
+    """Determine the content type of a file."""
+
+    mime, encoding = mimetypes.guess_type(path, strict=False)
+    if encoding:
+        mime = ENCODED_TYPES.get(encoding, "application/octet-stream")
+    return mime
+
+
+def accepted_codings(request: RequestHeader) -> set[str]:
+    """Get the content codings that a request accepts."""
+
+    result = set()
+
+    for item in str(request.get("accept-encoding", "")).split(","):
+        coding, *params = item.strip().split(";")
+        if coding and not any(x.strip() in {"q=0", "q=0.0"} for x in params):
+            result.add(coding.strip().lower())
+
+    return result
+
+
+class StaticFile(NamedTuple):
+    """A static file's contents and metadata."""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    mime: Optional[str]
+    data: bytes
+    variants: dict[str, bytes]
+
+    @staticmethod
+    def create(
+        path: Path,
+        stat: os.stat_result,
+        data: bytes,
+        variants: Optional[dict[str, bytes]] = None,
+    ) -> "StaticFile":
+        """
+        Create a new instance (compressing the data if variants aren't
+        provided).
+        """
+
+        mime = guess_mime(path)
+        return StaticFile(
+            path,
+            stat.st_mtime_ns,
+            stat.st_size,
+            mime,
+            data,
+            compress(data, mime) if variants is None else variants,
+        )
+
+    @property
+    def etag(self) -> str:
+        """An entity tag for this file's current contents."""
+        return f'"{self.mtime_ns:x}-{self.size:x}"'
+
+    @property
+    def last_modified(self) -> str:
+        """This file's modification time (as an HTTP date)."""
+        return formatdate(self.mtime_ns / 1e9, usegmt=True)
+
+    @property
+    def footprint(self) -> int:
+        """The amount of memory used by this instance's data."""
+        return len(self.data) + sum(len(x) for x in self.variants.values())
+
+    def current(self, stat: os.stat_result) -> bool:
+        """Determine if this instance reflects a file's current state."""
+        return stat.st_mtime_ns == self.mtime_ns and stat.st_size == self.size
+
+    def not_modified(self, request: RequestHeader) -> bool:
+        """
+        Determine if a conditional request can be answered with a 304 (Not
+        Modified) response (RFC 9110, section 13.1).
+        """
+
+        if_none_match = request.get("if-none-match")
+        if if_none_match is not None:
+            etag = self.etag
+            return any(
+                x == "*" or x.removeprefix("W/") == etag
+                for x in (y.strip() for y in if_none_match.split(","))
+            )
+
+        if_modified_since = request.get("if-modified-since")
+        if if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return self.mtime_ns // 10**9 <= since
+
+        return False
+
+    def body(self, request: RequestHeader) -> tuple[bytes, Optional[str]]:
+        """Get the best representation of this file for a request."""
+
+        if self.variants:
+            accepted = accepted_codings(request)
+            for coding, data in self.variants.items():
+                if coding in accepted:
+                    return data, coding
+
+        return self.data, None
+
+
+class StaticFileCache:
+    """A least-recently-used cache of static files with a size budget."""
+
+    def __init__(self, budget: int) -> None:
+        """Initialize this instance."""
+
+        self.budget = budget
+        self.size = 0
+        self.entries: OrderedDict[Path, StaticFile] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def _stat(self, path: Path) -> Optional[os.stat_result]:
+        """Get file-system information for a possible (regular) file."""
+
+        try:
+            result: Optional[os.stat_result] = path.stat()
+        except (OSError, ValueError):
+            result = None
+
+        if result is None or not S_ISREG(result.st_mode):
+            self.discard(path)
+            result = None
+
+        return result
+
+    def discard(self, path: Path) -> None:
+        """Remove a file from the cache."""
+
+        entry = self.entries.pop(path, None)
+        if entry is not None:
+            self.size -= entry.footprint
+
+    def _add(self, entry: StaticFile) -> StaticFile:
+        """Add an entry to the cache (evicting others if necessary)."""
+
+        self.discard(entry.path)
+
+        footprint = entry.footprint
+        if footprint <= self.budget:
+            while self.size + footprint > self.budget:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= evicted.footprint
+
+            self.entries[entry.path] = entry
+            self.size += footprint
+
+        return entry
+
+    def lookup(
+        self, path: Path
+    ) -> tuple[Optional[StaticFile], Optional[os.stat_result]]:
+        """
+        Look up a cached file. Returns the entry (if it's cached and current)
+        and file-system information (if the path is a regular file).
+        """
+
+        stat = self._stat(path)
+        entry = None
+
+        if stat is not None:
+            entry = self.entries.get(path)
+            if entry is not None and entry.current(stat):
+                self.entries.move_to_end(path)
+                self.hits += 1
+            else:
+                entry = None
+
+        return entry, stat
+
+    def cacheable(self, size: int) -> bool:
+        """
+        Determine if a file of a given size, along with any compressed
+        variants (each smaller than the original), always fits in the cache.
+        """
+        return 3 * size <= self.budget
+
+    async def get(self, path: Path) -> Optional[StaticFile]:
+        """Get a static file (loading it into the cache if necessary)."""
+
+        entry, stat = self.lookup(path)
+        if entry is None and stat is not None:
+            self.misses += 1
+            data = await read_binary(path)
+
+            # Only compress files that will be cached (otherwise they would
+            # be re-compressed on every request). Compression is CPU-bound so
+            # it's done off of the event loop.
+            variants: dict[str, bytes] = {}
+            if self.cacheable(stat.st_size):
+                variants = await asyncio.get_running_loop().run_in_executor(
+                    None, compress, data, guess_mime(path)
+                )
+
+            entry = self._add(StaticFile.create(path, stat, data, variants))
+
+        return entry
+
+    def preload(
+        self,
+        root: Path,
+        suffixes: Iterable[str] = (".js", ".css", ".html", ".svg"),
+    ) -> int:
+        """
+        Load (and compress) files under a directory ahead of time. Returns
+        the number of files loaded.
+        """
+
+        count = 0
+        suffixes = tuple(suffixes)
+
+        for path in sorted(root.rglob("*")):
+            if path.suffix in suffixes:
+                stat = self._stat(path)
+                if stat is not None:
+                    self._add(
+                        StaticFile.create(
+                            path,
+                            stat,
+                            path.read_bytes(),
+                            None if self.cacheable(stat.st_size) else {},
+                        )
+                    )
+                    count += 1
+
+        return count
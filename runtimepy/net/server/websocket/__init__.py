@@ -4,7 +4,8 @@ A module implementing a simple WebSocket server for the package.
 
 # built-in
 from collections import defaultdict
-from typing import Optional
+import json
+from typing import BinaryIO, Optional
 
 # third-party
 from vcorelib.math import RateLimiter, metrics_time_ns, to_nanos
@@ -15,22 +16,149 @@ from runtimepy.net.arbiter.tcp.json import WebsocketJsonMessageConnection
 from runtimepy.net.server.app.env.tab import ChannelEnvironmentTab
 from runtimepy.net.server.app.env.tab.message import TabMessageSender
 from runtimepy.net.server.struct import UiState
-from runtimepy.net.server.websocket.state import TabState
+from runtimepy.net.server.websocket.pacing import FramePacer
+from runtimepy.net.server.websocket.points import (
+    POINTS_PREFIX,
+    PointColumns,
+    PointStreamEncoder,
+    decode_points,
+)
+from runtimepy.net.server.websocket.state import TabStates
+from runtimepy.net.stream.base import PrefixedMessageConnection
 from runtimepy.net.websocket import WebsocketConnection
 
 
+class RuntimepyDataWebsocketConnection(
+    PrefixedMessageConnection, WebsocketConnection
+):
+    """A class implementing a WebSocket connection for streaming raw data."""
+
+    # Connections by client-provided token (used to pair data connections
+    # with UI connections).
+    streams: dict[str, "RuntimepyDataWebsocketConnection"] = {}
+
+    token: Optional[str]
+    points: PointStreamEncoder
+
+    # Channel definitions and point counts (for received points).
+    channels: dict[int, tuple[str, str]]
+    point_counts: dict[tuple[str, str], int]
+
+    def init(self) -> None:
+        """Initialize this instance."""
+
+        super().init()
+        self.token = None
+        self.points = PointStreamEncoder()
+
+        self.channels = {}
+        self.point_counts = defaultdict(int)
+
+    def handle_points(self, columns: list[PointColumns]) -> None:
+        """Handle channel points received from a peer."""
+
+        for item in columns:
+            key = self.channels.get(item.identifier)
+            if key is not None:
+                self.point_counts[key] += len(item.timestamps)
+
+    def pair(self, token: str) -> None:
+        """Register this connection so it can be paired with a UI one."""
+
+        if self.token is None and token not in self.streams:
+            self.token = token
+            self.streams[token] = self
+        else:
+            self.logger.warning("Can't pair with token '%s'.", token)
+
+    async def process_single(
+        self, stream: BinaryIO, addr: tuple[str, int] = None
+    ) -> bool:
+        """Process a single message."""
+
+        del addr
+
+        raw = stream.read()
+        if raw[:1] == POINTS_PREFIX:
+            self.handle_points(decode_points(raw))
+            return True
+
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            data = None
+
+        if isinstance(data, dict) and isinstance(data.get("token"), str):
+            self.pair(data["token"])
+        elif isinstance(data, dict) and isinstance(data.get("channels"), dict):
+            for ident, key in data["channels"].items():
+                self.channels[int(ident)] = (key[0], key[1])
+        else:
+            self.logger.warning("Ignoring message '%s'.", raw)
+
+        return True
+
+    def flush(self) -> None:
+        """Send any pending channel points."""
+
+        for message in self.points.encode():
+            self.send_message(message)
+
+    def disable_extra(self) -> None:
+        """Additional tasks to perform when disabling."""
+
+        if self.token is not None:
+            self.streams.pop(self.token, None)
+
+        super().disable_extra()
+
+
 class RuntimepyWebsocketConnection(WebsocketJsonMessageConnection):
     """A class implementing a package-specific WebSocket connection."""
 
     send_interfaces: dict[str, TabMessageSender]
     ui_time: float
-    tabs: dict[str, TabState]
+    tabs: TabStates
 
     poll_governor: RateLimiter
     poll_connection_metrics: bool
 
     _ui: Optional[UiState]
 
+    # Adapts the rate of frame responses to congestion.
+    pacer: FramePacer
+
+    # A paired connection for streaming channel points.
+    data_token: Optional[str]
+    _data: Optional[RuntimepyDataWebsocketConnection]
+
+    def _get_data(self) -> Optional[RuntimepyDataWebsocketConnection]:
+        """Obtain a reference to a possible data-stream connection."""
+
+        if self._data is not None and self._data.disabled:
+            self._data = None
+
+        if self._data is None and self.data_token is not None:
+            self._data = RuntimepyDataWebsocketConnection.streams.get(
+                self.data_token
+            )
+
+        return self._data
+
+    def send_backlog(
+        self, data: RuntimepyDataWebsocketConnection = None
+    ) -> int:
+        """
+        Estimate how many bytes are waiting to be sent to the client (buffered
+        by the transport or queued as messages, for this connection and a
+        possible data-stream connection).
+        """
+
+        result = self.write_buffer_size + self.queued_bytes
+        if data is not None:
+            result += data.write_buffer_size + data.queued_bytes
+        return result
+
     def tab_sender(self, name: str) -> TabMessageSender:
         """Get a tab message-sending interface."""
 
@@ -95,19 +223,40 @@ class RuntimepyWebsocketConnection(WebsocketJsonMessageConnection):
 
             # Handle frame messages.
             if "time" in inbox:
+                # Skip (and merge into a later response) frames while this
+                # connection is congested.
+                data = self._get_data()
+                self.pacer.update(self.send_backlog(data), inbox.get("rtt"))
+                if not self.pacer.ready(inbox["time"]):
+                    return
+
                 # Poll UI state.
                 ui = self._get_ui()
                 if ui:
                     self._poll_ui_state(ui, inbox["time"])
 
-                # Allows tabs to respond on a per-frame basis.
-                for name in ChannelEnvironmentTab.all_tabs:
-                    result = self.tabs[name].frame(inbox["time"])
-                    if result:
-                        outbox[name] = result
+                # Allows shown tabs to respond on a per-frame basis (hidden
+                # tabs' log messages are delivered once they're shown).
+                outbox.update(
+                    self.tabs.frame(
+                        inbox["time"],
+                        stream=data.points if data is not None else None,
+                    )
+                )
+
+                if data is not None:
+                    data.flush()
+
+                # Allows the client to measure frame round-trip time.
+                outbox["frame"] = inbox["time"]
 
                 self.ui_time = inbox["time"]
 
+            # Pair with a data-stream connection.
+            elif "data_stream" in inbox:
+                self.data_token = str(inbox["data_stream"])
+                self._data = None
+
             # Handle messages from tabs.
             elif "name" in inbox and "event" in inbox:
                 name = inbox["name"]
@@ -117,6 +266,7 @@ class RuntimepyWebsocketConnection(WebsocketJsonMessageConnection):
                     response = await try_tab.handle_message(
                         inbox["event"], self.tab_sender(name), self.tabs[name]
                     )
+                    self.tabs.update(name)
                     if response:
                         outbox[name] = response
 
@@ -129,7 +279,7 @@ class RuntimepyWebsocketConnection(WebsocketJsonMessageConnection):
 
         self.send_interfaces = {}
         self.ui_time = 0.0
-        self.tabs = defaultdict(TabState.create)
+        self.tabs = TabStates()
 
         # Limit UI metrics update rate to 250 Hz.
         self.poll_governor = RateLimiter(
@@ -139,6 +289,11 @@ class RuntimepyWebsocketConnection(WebsocketJsonMessageConnection):
         self.poll_connection_metrics = False
         self._ui = None
 
+        self.pacer = FramePacer()
+
+        self.data_token = None
+        self._data = None
+
     async def async_init(self) -> bool:
         """A runtime initialization routine (executes during 'process')."""
 
@@ -154,13 +309,10 @@ class RuntimepyWebsocketConnection(WebsocketJsonMessageConnection):
         # Disable loggers when the connection closes.
         for state in self.tabs.values():
             state.clear_loggers()
+        self.tabs.deactivate()
 
         # Subtract from num_connections.
         ui = self._get_ui()
         if ui:
             self.poll_connection_metrics = False
             ui.env.add_int("num_connections", -1)
-
-
-class RuntimepyDataWebsocketConnection(WebsocketConnection):
-    """A class implementing a WebSocket connection for streaming raw data."""
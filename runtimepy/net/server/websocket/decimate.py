@@ -0,0 +1,181 @@
+"""
+A module implementing plot-point decimation (down-sampling).
+"""
+
+# built-in
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+# (value, nanosecond timestamp)
+Point = tuple[str | int | float | bool, int]
+
+# Bounds (inclusive) on negotiable per-frame point counts.
+MIN_POINTS = 4
+MAX_POINTS = 4096
+
+
+def _numeric(points: Sequence[Point]) -> bool:
+    """Determine if points have numeric values (e.g. not enumeration names)."""
+    return not isinstance(points[0][0], str)
+
+
+def stride(points: Sequence[Point], limit: int) -> list[Point]:
+    """
+    Select evenly spaced points (always including the first and last).
+    Works for any value type.
+    """
+
+    count = len(points)
+    if count <= limit:
+        return list(points)
+
+    step = (count - 1) / (limit - 1)
+    return [points[round(idx * step)] for idx in range(limit)]
+
+
+def min_max(points: Sequence[Point], limit: int) -> list[Point]:
+    """
+    Reduce points to (at most) 'limit' points by keeping the minimum and
+    maximum value from equally sized buckets (in time order). The last point
+    is always kept.
+    """
+
+    count = len(points)
+    if count <= limit or not _numeric(points):
+        return stride(points, limit)
+
+    # Reserve room for the last point.
+    buckets = max((limit - 1) // 2, 1)
+    size = (count - 1) / buckets
+
+    result: list[Point] = []
+    for bucket in range(buckets):
+        start = round(bucket * size)
+        end = max(round((bucket + 1) * size), start + 1)
+
+        low = high = start
+        for idx in range(start + 1, end):
+            value = points[idx][0]
+            if value < points[low][0]:  # type: ignore[operator]
+                low = idx
+            elif value > points[high][0]:  # type: ignore[operator]
+                high = idx
+
+        result.append(points[min(low, high)])
+        if low != high:
+            result.append(points[max(low, high)])
+
+    result.append(points[-1])
+    return result
+
+
+def _largest_triangle(
+    points: Sequence[Point],
+    start: int,
+    end: int,
+    prev: Point,
+    avg: tuple[float, float],
+) -> int:
+    """
+    Find the index of the point (in a range) forming the largest triangle with
+    a previous point and an average point.
+    """
+
+    prev_v, prev_t = prev
+    avg_v, avg_t = avg
+
+    best = start
+    best_area = -1.0
+    for idx in range(start, end):
+        value, time = points[idx]
+        area = abs(
+            (prev_t - avg_t) * (value - prev_v)  # type: ignore[operator]
+            - (prev_t - time) * (avg_v - prev_v)  # type: ignore[operator]
+        )
+        if area > best_area:
+            best_area = area
+            best = idx
+
+    return best
+
+
+def lttb(points: Sequence[Point], limit: int) -> list[Point]:
+    """
+    Reduce points to 'limit' points using the largest-triangle-three-buckets
+    algorithm (S. Steinarsson, 2013). The first and last points are always
+    kept.
+    """
+
+    count = len(points)
+    if count <= limit or not _numeric(points) or limit < 3:
+        return stride(points, limit)
+
+    result = [points[0]]
+    size = (count - 2) / (limit - 2)
+
+    prev = 0
+    for bucket in range(limit - 2):
+        end = int((bucket + 1) * size) + 1
+
+        # The average of the next bucket (or the last point).
+        span = (
+            points[end : min(int((bucket + 2) * size) + 1, count)]
+            or points[-1:]
+        )
+        avg = (
+            sum(x[0] for x in span) / len(span),  # type: ignore[misc]
+            sum(x[1] for x in span) / len(span),
+        )
+
+        prev = _largest_triangle(
+            points, int(bucket * size) + 1, end, points[prev], avg
+        )
+        result.append(points[prev])
+
+    result.append(points[-1])
+    return result
+
+
+Decimator = Callable[[Sequence[Point], int], list[Point]]
+
+METHODS: dict[str, Decimator] = {
+    "minmax": min_max,
+    "lttb": lttb,
+    "stride": stride,
+}
+
+
+@dataclass
+class Decimation:
+    """Per-tab plot-point decimation settings."""
+
+    method: str = "minmax"
+
+    # The maximum number of points delivered (per channel) each frame.
+    max_points: int = 512
+
+    @property
+    def max_buffered(self) -> int:
+        """
+        The number of points buffered (per channel) between frames before
+        they're decimated in place.
+        """
+        return self.max_points * 4
+
+    def update(self, data: dict[str, int | str]) -> None:
+        """
+        Update settings from a UI message (containing a plot's pixel width,
+        point-buffer depth and/or decimation method).
+        """
+
+        method = str(data.get("method", self.method))
+        if method in METHODS:
+            self.method = method
+
+        limits = [int(data[key]) for key in ("width", "depth") if key in data]
+        if limits:
+            self.max_points = max(MIN_POINTS, min(MAX_POINTS, *limits))
+
+    def __call__(self, points: Sequence[Point]) -> list[Point]:
+        """Decimate points."""
+        return METHODS[self.method](points, self.max_points)
@@ -0,0 +1,68 @@
+"""
+A module implementing adaptive pacing for UI frame responses.
+"""
+
+# built-in
+from dataclasses import dataclass
+from typing import Optional
+
+# Frame periods are increased by at least this much when congested.
+MIN_STEP_MS = 16.0
+
+
+@dataclass
+class FramePacer:
+    """
+    Adaptive pacing of UI frame responses for a single connection. Responses
+    are skipped (and their content merged into a later response) while the
+    connection is congested, based on how much data is waiting to be sent
+    and the client-reported frame round-trip time.
+    """
+
+    base_period_ms: float = 0.0
+    max_period_ms: float = 1000.0
+
+    # Bytes waiting to be sent (per connection).
+    high_water: int = 256 * 1024
+    low_water: int = 32 * 1024
+
+    max_rtt_ms: float = 250.0
+
+    period_ms: float = 0.0
+    rtt_ms: float = 0.0
+    last_ms: Optional[float] = None
+
+    responded: int = 0
+    merged: int = 0
+
+    def update(self, backlog: int, rtt_ms: float = None) -> None:
+        """Update the response period based on congestion."""
+
+        if rtt_ms is not None:
+            self.rtt_ms = (self.rtt_ms * 0.75) + (float(rtt_ms) * 0.25)
+
+        # Back off quickly when congested.
+        if backlog > self.high_water or self.rtt_ms > self.max_rtt_ms:
+            self.period_ms = min(
+                self.max_period_ms,
+                max(self.period_ms * 2.0, self.period_ms + MIN_STEP_MS),
+            )
+
+        # Recover slowly otherwise.
+        elif backlog <= self.low_water and self.rtt_ms <= self.max_rtt_ms / 2:
+            self.period_ms *= 0.9
+            if self.period_ms < 1.0:
+                self.period_ms = 0.0
+
+        self.period_ms = max(self.period_ms, self.base_period_ms)
+
+    def ready(self, now_ms: float) -> bool:
+        """Determine if a frame should be responded to."""
+
+        if self.last_ms is not None and now_ms - self.last_ms < self.period_ms:
+            self.merged += 1
+            return False
+
+        self.last_ms = now_ms
+        self.responded += 1
+        return True
@@ -0,0 +1,174 @@
+"""
+A module implementing a binary channel-point protocol for UI data streams.
+
+Point messages (little-endian, arrays aligned to 8 bytes):
+
+    u8 'P' | u8 version | u16 channel count | u32 reserved
+    (per channel) u16 channel id | u8 value type | u8 reserved | u32 count
+    (per channel) i64 timestamps[count] | values[count] (padded to 8 bytes)
+
+Channel identifiers are assigned per connection. Definitions are sent (as a
+JSON message, {"channels": {"<id>": ["<tab>", "<channel>"]}}) before the
+first points message that uses them.
+"""
+
+# built-in
+from array import array
+import json
+import struct
+import sys
+from typing import Any, Iterator, NamedTuple, Sequence
+
+# internal
+from runtimepy.channel.history import array_code, little_endian
+from runtimepy.net.server.websocket.decimate import Point
+from runtimepy.primitives.types.base import PrimitiveType
+
+POINTS_MAGIC = ord("P")
+POINTS_PREFIX = bytes([POINTS_MAGIC])
+POINTS_VERSION = 1
+
+HEADER = struct.Struct("<BBHI")
+DESCRIPTOR = struct.Struct("<HBxI")
+ALIGNMENT = 8
+
+# Value types (by array type code), the index is sent on the wire.
+VALUE_CODES = "bBhHiIqQfd"
+BOOL_TYPE = len(VALUE_CODES)
+DOUBLE_TYPE = VALUE_CODES.index("d")
+
+
+def value_type(kind: PrimitiveType[Any]) -> int:
+    """Get the wire value type for a primitive type."""
+
+    if kind.is_boolean:
+        return BOOL_TYPE
+
+    return VALUE_CODES.index(array_code(kind))
+
+
+def value_code(value_type_id: int) -> str:
+    """Get an array type code for a wire value type."""
+    return "B" if value_type_id == BOOL_TYPE else VALUE_CODES[value_type_id]
+
+
+def _padding(size: int) -> bytes:
+    """Get padding to align a size."""
+    return bytes(-size % ALIGNMENT)
+
+
+class PointColumns(NamedTuple):
+    """Decoded points for a single channel."""
+
+    identifier: int
+    timestamps: array  # type: ignore[type-arg]
+    values: array  # type: ignore[type-arg]
+
+
+class PointStreamEncoder:
+    """A class for encoding channel points into binary messages."""
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+
+        self.ids: dict[tuple[str, str], int] = {}
+        self.definitions: dict[str, tuple[str, str]] = {}
+        self.columns: list[tuple[int, int, array, array]] = []  # type: ignore
+
+    def add(
+        self,
+        tab: str,
+        name: str,
+        kind: PrimitiveType[Any],
+        points: Sequence[Point],
+    ) -> bool:
+        """
+        Add points for a channel to the next message. Returns False if the
+        points can't be encoded (e.g. their values are strings).
+        """
+
+        if not points or isinstance(points[0][0], str):
+            return False
+
+        key = (tab, name)
+        ident = self.ids.get(key)
+        if ident is None:
+            ident = len(self.ids)
+            self.ids[key] = ident
+            self.definitions[str(ident)] = key
+
+        values = [x[0] for x in points]
+
+        # Values of scaled (integer) channels aren't integers.
+        type_id = value_type(kind)
+        if type_id != BOOL_TYPE and any(isinstance(x, float) for x in values):
+            type_id = DOUBLE_TYPE
+
+        self.columns.append(
+            (
+                ident,
+                type_id,
+                array("q", [x[1] for x in points]),
+                array(value_code(type_id), values),
+            )
+        )
+        return True
+
+    def encode(self) -> Iterator[bytes]:
+        """Encode pending channel definitions and points."""
+
+        if self.definitions:
+            yield json.dumps(
+                {"channels": self.definitions}, separators=(",", ":")
+            ).encode()
+            self.definitions = {}
+
+        if self.columns:
+            parts = [
+                HEADER.pack(POINTS_MAGIC, POINTS_VERSION, len(self.columns), 0)
+            ]
+            parts.extend(
+                DESCRIPTOR.pack(ident, type_id, len(stamps))
+                for ident, type_id, stamps, _ in self.columns
+            )
+            for _, _, stamps, values in self.columns:
+                parts.append(little_endian(stamps))
+                data = little_endian(values)
+                parts.append(data)
+                parts.append(_padding(len(data)))
+
+            self.columns = []
+            yield b"".join(parts)
+
+
+def decode_points(data: bytes) -> list[PointColumns]:
+    """Decode a binary points message."""
+
+    view = memoryview(data)
+    magic, version, count, _ = HEADER.unpack_from(view)
+    assert magic == POINTS_MAGIC and version == POINTS_VERSION, (
+        magic,
+        version,
+    )
+
+    descriptors = [
+        DESCRIPTOR.unpack_from(view, HEADER.size + idx * DESCRIPTOR.size)
+        for idx in range(count)
+    ]
+
+    offset = HEADER.size + count * DESCRIPTOR.size
+    result = []
+    for ident, type_id, length in descriptors:
+        columns = []
+        for code in ("q", value_code(type_id)):
+            column = array(code)
+            end = offset + column.itemsize * length
+            column.frombytes(view[offset:end])
+            if sys.byteorder != "little":  # pragma: nocover
+                column.byteswap()
+            columns.append(column)
+            offset = end + len(_padding(end))
+
+        result.append(PointColumns(ident, columns[0], columns[1]))
+
+    return result
@@ -4,20 +4,21 @@ A module implementing a stateful data interface for per-connection tabs.
 
 # built-in
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
+from typing import Iterator
 
 # third-party
 from vcorelib.logging import ListLogger
 
 # internal
 from runtimepy.channel.environment.base import ValueMap
+from runtimepy.channel.environment.command import GLOBAL
 from runtimepy.message import JsonMessage
+from runtimepy.net.server.websocket.decimate import Decimation, Point
+from runtimepy.net.server.websocket.points import PointStreamEncoder
 from runtimepy.primitives import AnyPrimitive
 
-# (value, nanosecond timestamp)
-Point = tuple[str | int | float | bool, int]
-
 
 @dataclass
 class TabState:
@@ -34,8 +35,50 @@ class TabState:
 
     _loggers: list[logging.Logger]
 
-    def frame(self, time: float) -> JsonMessage:
-        """Handle a new UI frame."""
+    # Channels currently plotted (all other channels only need their most
+    # recent value).
+    plotted: set[str] = field(default_factory=set)
+    decimation: Decimation = field(default_factory=Decimation)
+
+    def add_point(self, name: str, point: Point) -> None:
+        """Buffer a channel point (decimating buffered points if necessary)."""
+
+        points = self.points[name]
+        points.append(point)
+
+        if len(points) >= self.decimation.max_buffered:
+            self.points[name] = self._reduce(name, points)
+
+    def _reduce(self, name: str, points: list[Point]) -> list[Point]:
+        """Reduce a channel's points to what should be sent to the UI."""
+
+        if name not in self.plotted:
+            return points[-1:]
+
+        if len(points) > self.decimation.max_points:
+            return self.decimation(points)
+
+        return points
+
+    def set_plotted(self, name: str, state: bool) -> None:
+        """Update whether or not a channel is plotted."""
+
+        if state:
+            self.plotted.add(name)
+        else:
+            self.plotted.discard(name)
+
+    def frame(
+        self,
+        time: float,
+        name: str = "",
+        stream: PointStreamEncoder = None,
+    ) -> JsonMessage:
+        """
+        Handle a new UI frame. Points for plotted channels are added to a
+        binary point stream (if one is provided), only their latest values are
+        included in the result.
+        """
 
         # Not used yet.
         del time
@@ -46,9 +89,32 @@ class TabState:
         if self.tab_logger:
             result["log_messages"] = self.tab_logger.drain_str()
 
-        # Handle channel updates.
+        # Handle channel updates (the number of points sent for each channel
+        # is bounded).
         if self.points:
-            result["points"] = self.points
+            points: JsonMessage = {}
+            values: JsonMessage = {}
+
+            for chan, chan_points in self.points.items():
+                if chan_points:
+                    reduced = self._reduce(chan, chan_points)
+                    if (
+                        stream is not None
+                        and chan in self.plotted
+                        and chan in self.primitives
+                        and stream.add(
+                            name, chan, self.primitives[chan].kind, reduced
+                        )
+                    ):
+                        values[chan] = reduced[-1][0]
+                    else:
+                        points[chan] = reduced
+
+            if points:
+                result["points"] = points
+            if values:
+                result["values"] = values
+
             self.points = defaultdict(list)
 
         return result
@@ -91,3 +157,75 @@ class TabState:
         return TabState(
             False, ListLogger.create(), defaultdict(list), {}, {}, {}, []
         )
+
+
+class TabStates:
+    """
+    Per-connection tab states. Only tabs that are shown (or have pending
+    data) are visited when handling frames.
+    """
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+
+        self.states: dict[str, TabState] = {}
+
+        # Tabs that need attention on each frame.
+        self.active: dict[str, TabState] = {}
+
+    def __getitem__(self, name: str) -> TabState:
+        """Get (or create) a tab's state."""
+
+        state = self.states.get(name)
+        if state is None:
+            state = TabState.create()
+            self.states[name] = state
+        return state
+
+    def __len__(self) -> int:
+        """Get the number of tab states."""
+        return len(self.states)
+
+    def values(self) -> Iterator[TabState]:
+        """Iterate over all tab states."""
+        yield from self.states.values()
+
+    @staticmethod
+    def _consume(name: str, count: int) -> None:
+        """Update the number of consumers of a tab's environment."""
+
+        command = GLOBAL.get(name)
+        if command is not None:
+            command.env.channels.consume(count)
+
+    def update(self, name: str) -> None:
+        """Update whether or not a tab is active (e.g. after a message)."""
+
+        state = self.states.get(name)
+        if state is not None and state.shown:
+            if name not in self.active:
+                self.active[name] = state
+                self._consume(name, 1)
+        elif self.active.pop(name, None) is not None:
+            self._consume(name, -1)
+
+    def deactivate(self) -> None:
+        """Deactivate all tabs (e.g. when a connection closes)."""
+
+        for name in self.active:
+            self._consume(name, -1)
+        self.active.clear()
+
+    def frame(
+        self, time: float, stream: PointStreamEncoder = None
+    ) -> JsonMessage:
+        """Handle a new UI frame for all active tabs."""
+
+        result: JsonMessage = {}
+
+        for name, state in self.active.items():
+            data = state.frame(time, name=name, stream=stream)
+            if data:
+                result[name] = data
+
+        return result
@@ -4,8 +4,7 @@ A module implementing a JSON message connection interface.
 
 # built-in
 from argparse import Namespace
-from json import JSONDecodeError, loads
-from typing import Optional
+from typing import BinaryIO, Optional
 
 # internal
 from runtimepy.channel.environment.command import FieldOrChannel
@@ -63,21 +62,29 @@ class JsonMessageConnection(
 
         return result
 
+    async def process_single(
+        self, stream: BinaryIO, addr: tuple[str, int] = None
+    ) -> bool:
+        """Process a single message."""
+
+        # Message backends can decode bytes directly.
+        return await self.process_message(stream.read(), addr=addr)
+
     async def process_message(
-        self, data: str, addr: tuple[str, int] = None
+        self, data: str | bytes, addr: tuple[str, int] = None
     ) -> bool:
-        """Process a string message."""
+        """Process a string (or binary-encoded) message."""
 
         result = True
 
         try:
-            decoded = loads(data)
+            decoded = self.processor.decode(data)
 
             if decoded and isinstance(decoded, dict):
                 result = await self.process_json(decoded, addr=addr)
             else:
                 self.logger.error("Ignoring message '%s'.", data)
-        except JSONDecodeError as exc:
+        except self.processor.decode_errors as exc:
             self.logger.exception("Couldn't decode '%s': %s", data, exc)
 
         return result
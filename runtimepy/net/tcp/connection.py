@@ -108,6 +108,10 @@ class TcpConnection(_Connection, _TransportMixin):
         self._transport.write(data)
         self.metrics.tx.increment(len(data))
 
+    async def drain(self) -> None:
+        """Wait for the underlying transport to accept more data."""
+        await self._protocol.writable.wait()
+
     async def restart(self) -> bool:
         """
         Reset necessary underlying state for this connection to 'process'
@@ -4,17 +4,32 @@ A module implementing a basic HTTP (multiple RFC's) connection interface.
 
 # built-in
 import asyncio
+from collections import deque
 from copy import copy
 import http
 from json import loads
-from typing import Any, Awaitable, Callable, Optional, Tuple, Union, cast
+from math import ceil
+from typing import (
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 # third-party
 from vcorelib import DEFAULT_ENCODING
 
 # internal
 from runtimepy import PKG_NAME, VERSION
-from runtimepy.net.http import HttpMessageProcessor
+from runtimepy.net.http import (
+    HeaderTooLarge,
+    HttpMessageProcessor,
+    MalformedMessage,
+)
 from runtimepy.net.http.header import RequestHeader
 from runtimepy.net.http.response import ResponseHeader
 from runtimepy.net.tcp.connection import TcpConnection as _TcpConnection
@@ -23,13 +38,17 @@ from runtimepy.net.tcp.connection import TcpConnection as _TcpConnection
 # async def handler(
 #     response: ResponseHeader,
 #     request: RequestHeader,
-#     request_data: Optional[bytes],
-# ) -> Optional[bytes]:
+#     request_data: Optional[memoryview],
+# ) -> Optional[HttpBody]:
 #     """Sample handler."""
 #
+# Bodies produced by an asynchronous iterator are sent using chunked transfer
+# coding. Request bodies are views of received data (use 'bytes' to keep a
+# copy beyond the handler call).
+HttpBody = Union[bytes, AsyncIterable[bytes]]
 HttpRequestHandler = Callable[
-    [ResponseHeader, RequestHeader, Optional[bytes]],
-    Awaitable[Optional[bytes]],
+    [ResponseHeader, RequestHeader, Optional[memoryview]],
+    Awaitable[Optional[HttpBody]],
 ]
 HttpResponse = Tuple[ResponseHeader, Optional[bytes]]
 
@@ -46,7 +65,7 @@ def to_json(response: HttpResponse) -> Any:
     ]
 
     return loads(
-        response[1].decode(encoding=DEFAULT_ENCODING),  # type: ignore
+        str(response[1], encoding=DEFAULT_ENCODING),  # type: ignore
     )
 
 
@@ -55,10 +74,12 @@ class HttpConnection(_TcpConnection):
 
     identity = f"{PKG_NAME}/{VERSION}"
 
-    expecting_response: bool
-
     log_alias = "HTTP"
 
+    # Accepted (server-side) connections are closed after being idle for
+    # this many seconds (persistent connections after serving a request).
+    keep_alive_timeout: float = 15.0
+
     # Handlers registered at the class level so that instances created at
     # runtime don't need additional initialization.
     handlers: HttpRequestHandlers = {}
@@ -69,15 +90,50 @@ class HttpConnection(_TcpConnection):
         # Incoming request handling.
         self.processor = HttpMessageProcessor()
 
-        # Outgoing request handling.
-        self.request_ready = asyncio.BoundedSemaphore()
-        self.expecting_response = False
-        self.responses: asyncio.Queue[HttpResponse] = asyncio.Queue(maxsize=1)
+        # Outgoing request handling. Requests can be pipelined, responses
+        # arrive in the order that requests were sent.
+        self.send_lock = asyncio.Lock()
+        self.pending_responses: deque[asyncio.Future[HttpResponse]] = deque()
+
+        # Keep-alive handling (connections aren't idle while requests are
+        # being received or responded to).
+        self.last_activity = 0.0
+        self.responding = 0
+        self.keep_alive_task: Optional[asyncio.Task[None]] = None
 
         self.handlers = copy(self.handlers)
         self.handlers[http.HTTPMethod.GET] = self.get_handler
         self.handlers[http.HTTPMethod.POST] = self.post_handler
 
+    def _start_keep_alive(self) -> None:
+        """Start the idle clock (and the task that enforces it)."""
+
+        self.last_activity = asyncio.get_running_loop().time()
+        if self.keep_alive_timeout > 0.0 and self.keep_alive_task is None:
+            self.keep_alive_task = asyncio.create_task(self._keep_alive())
+            self._conn_tasks.append(self.keep_alive_task)
+
+    async def async_init(self) -> bool:
+        """A runtime initialization routine (executes during 'process')."""
+
+        # Connections made with 'create_connection' (clients) store their
+        # creation arguments, accepted ones time out if no request arrives.
+        if not self._conn_kwargs:
+            self._start_keep_alive()
+
+        return True
+
+    @property
+    def expecting_response(self) -> bool:
+        """Whether or not responses to sent requests are outstanding."""
+        return bool(self.pending_responses)
+
+    def disable_extra(self) -> None:
+        """Additional tasks to perform when disabling."""
+
+        while self.pending_responses:
+            self.pending_responses.popleft().cancel()
+
     @classmethod
     def get_log_prefix(cls, is_ssl: bool = False) -> str:
         """Get a logging prefix for this instance."""
@@ -88,24 +144,24 @@ class HttpConnection(_TcpConnection):
         self,
         response: ResponseHeader,
         request: RequestHeader,
-        request_data: Optional[bytes],
-    ) -> Optional[bytes]:
+        request_data: Optional[memoryview],
+    ) -> Optional[HttpBody]:
         """Sample handler."""
 
     async def post_handler(
         self,
         response: ResponseHeader,
         request: RequestHeader,
-        request_data: Optional[bytes],
-    ) -> Optional[bytes]:
+        request_data: Optional[memoryview],
+    ) -> Optional[HttpBody]:
         """Sample handler."""
 
     async def _process_request(
         self,
         response: ResponseHeader,
         request_header: RequestHeader,
-        request_data: Optional[bytes] = None,
-    ) -> Optional[bytes]:
+        request_data: Optional[memoryview] = None,
+    ) -> Optional[HttpBody]:
         """Process an individual request."""
 
         result = None
@@ -129,23 +185,30 @@ class HttpConnection(_TcpConnection):
         return result
 
     async def request(
-        self, request: RequestHeader, data: Optional[bytes] = None
+        self, request: RequestHeader, data: Optional[HttpBody] = None
     ) -> HttpResponse:
-        """Make an HTTP request."""
+        """
+        Make an HTTP request. Requests are pipelined, they're sent without
+        waiting for responses to previous requests.
+        """
+
+        # Set boilerplate header data.
+        request["user-agent"] = self.identity
 
-        async with self.request_ready:
-            # Set boilerplate header data.
-            request["user-agent"] = self.identity
+        result: asyncio.Future[HttpResponse] = (
+            asyncio.get_running_loop().create_future()
+        )
 
-            self._send(request, data)
-            self.expecting_response = True
-            result = await self.responses.get()
-            self.expecting_response = False
+        # Streamed bodies are sent in pieces, don't allow other requests to
+        # be interleaved.
+        async with self.send_lock:
+            self.pending_responses.append(result)
+            await self._send_message(request, data)
 
-        return result
+        return await result
 
     async def request_json(
-        self, request: RequestHeader, data: Optional[bytes] = None
+        self, request: RequestHeader, data: Optional[HttpBody] = None
     ) -> Any:
         """
         Perform a request and convert the response to a data structure by
@@ -171,9 +234,124 @@ class HttpConnection(_TcpConnection):
 
         header.log(self.logger, True)
 
+    async def _send_chunked(
+        self,
+        header: Union[ResponseHeader, RequestHeader],
+        chunks: AsyncIterable[bytes],
+    ) -> None:
+        """
+        Send a request or response with a body using chunked transfer coding
+        (so that the body doesn't need to be buffered in memory).
+        """
+
+        header.headers.pop("content-length", None)
+        header["transfer-encoding"] = "chunked"
+
+        self.send_binary(bytes(header))
+        header.log(self.logger, True)
+
+        loop = asyncio.get_running_loop()
+        async for chunk in chunks:
+            if chunk:
+                self.send_binary(
+                    b"".join([f"{len(chunk):x}\r\n".encode(), chunk, b"\r\n"])
+                )
+                await self.drain()
+                self.last_activity = loop.time()
+
+        self.send_binary(b"0\r\n\r\n")
+
+    async def _send_message(
+        self,
+        header: Union[ResponseHeader, RequestHeader],
+        data: Optional[HttpBody] = None,
+    ) -> None:
+        """Send a request or response to a request."""
+
+        if data is None or isinstance(data, (bytes, bytearray, memoryview)):
+            self._send(header, data)
+        else:
+            await self._send_chunked(header, data)
+
+    async def _keep_alive(self) -> None:
+        """Disable this connection once it's been idle for too long."""
+
+        loop = asyncio.get_running_loop()
+
+        while self._enabled:
+            remaining = (
+                self.last_activity + self.keep_alive_timeout - loop.time()
+            )
+            if remaining > 0.0:
+                await asyncio.sleep(remaining)
+            elif self.responding:
+                await asyncio.sleep(self.keep_alive_timeout)
+            else:
+                self.disable("keep-alive timeout")
+
+    async def _respond(
+        self, request: RequestHeader, payload: Optional[memoryview]
+    ) -> bool:
+        """
+        Respond to a request. Returns whether or not the connection should
+        persist.
+        """
+
+        persistent = request.persistent(request.version)
+
+        response = ResponseHeader()
+
+        self.responding += 1
+        try:
+            result = await self._process_request(response, request, payload)
+
+            if persistent:
+                response["connection"] = "keep-alive"
+                if self.keep_alive_timeout > 0.0:
+                    response["keep-alive"] = (
+                        f"timeout={ceil(self.keep_alive_timeout)}"
+                    )
+            else:
+                response["connection"] = "close"
+
+            await self._send_message(response, result)
+        finally:
+            self.responding -= 1
+
+        self.last_activity = asyncio.get_running_loop().time()
+        if persistent:
+            self._start_keep_alive()
+
+        return persistent
+
     async def process_binary(self, data: bytes) -> bool:
         """Process a binary frame."""
 
+        self.last_activity = asyncio.get_running_loop().time()
+
+        try:
+            await self._process_messages(data)
+        except (HeaderTooLarge, MalformedMessage) as exc:
+            self.logger.error(str(exc))
+
+            if not self.expecting_response:
+                response = ResponseHeader(
+                    status=(
+                        http.HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE
+                        if isinstance(exc, HeaderTooLarge)
+                        else http.HTTPStatus.BAD_REQUEST
+                    )
+                )
+                response["server"] = self.identity
+                self._send(response)
+
+            return False
+
+        return True
+
+    async def _process_messages(self, data: bytes) -> None:
+        """Process HTTP messages from a binary frame."""
+
         for header, payload in self.processor.ingest(
             data,
             RequestHeader if not self.expecting_response else ResponseHeader,
@@ -182,18 +360,19 @@ class HttpConnection(_TcpConnection):
 
             if not self.expecting_response:
                 # Process request.
-                response = ResponseHeader()
-                self._send(
-                    response,
-                    await self._process_request(
-                        response, cast(RequestHeader, header), payload
-                    ),
-                )
+                if not await self._respond(
+                    cast(RequestHeader, header), payload
+                ):
+                    self.disable("connection close")
+                    break
 
-            # Process the response to a pending request.
+            # Process the response to the oldest pending request.
             else:
-                await self.responses.put(
-                    (cast(ResponseHeader, header), payload)
-                )
-
-        return True
+                pending = self.pending_responses.popleft()
+                if not pending.done():
+                    pending.set_result(
+                        (
+                            cast(ResponseHeader, header),
+                            bytes(payload) if payload is not None else None,
+                        )
+                    )
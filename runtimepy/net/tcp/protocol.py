@@ -4,6 +4,7 @@ A module implementing a Protocol for TcpConnection.
 
 # built-in
 from asyncio import BaseTransport as _BaseTransport
+from asyncio import Event as _Event
 from asyncio import Protocol as _Protocol
 from logging import getLogger as _getLogger
 from typing import Optional as _Optional
@@ -26,6 +27,24 @@ class QueueProtocol(_BinaryMessageQueueMixin, _Protocol):
     logger: _LoggerType
     conn: _Connection
 
+    def __init__(self) -> None:
+        """Initialize this protocol."""
+
+        super().__init__()
+
+        # Cleared while the transport's write buffer is above its high-water
+        # mark.
+        self.writable = _Event()
+        self.writable.set()
+
+    def pause_writing(self) -> None:
+        """Handle the transport's write buffer exceeding its limit."""
+        self.writable.clear()
+
+    def resume_writing(self) -> None:
+        """Handle the transport's write buffer draining."""
+        self.writable.set()
+
     def data_received(self, data: _BinaryMessage) -> None:
         """Handle incoming data."""
         self.queue.put_nowait(data)
@@ -43,4 +62,5 @@ class QueueProtocol(_BinaryMessageQueueMixin, _Protocol):
 
         msg = "Disconnected." if exc is None else f"Disconnected: '{exc}'."
         self.logger.info(msg)
+        self.writable.set()
         self.conn.disable("disconnected")
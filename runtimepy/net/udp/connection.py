@@ -24,6 +24,7 @@ from runtimepy.net.udp.create import (
     try_udp_transport_protocol,
     udp_transport_protocol_backoff,
 )
+from runtimepy.net.udp.multicast import MulticastConfig, multicast_socket
 from runtimepy.net.udp.protocol import UdpQueueProtocol
 from runtimepy.net.util import IpHostTuplelike
 
@@ -139,6 +140,16 @@ class UdpConnection(_Connection, _TransportMixin):
 
         LOG.debug("kwargs: %s", kwargs)
 
+        # Multicast sockets are created (and configured) up front. They're
+        # never connected, datagrams are sent to the group address.
+        multicast = kwargs.pop("multicast", None)
+        if multicast is not None:
+            if not isinstance(multicast, MulticastConfig):
+                multicast = MulticastConfig.create(multicast)
+            kwargs["sock"] = multicast_socket(multicast)
+            kwargs["remote_addr"] = multicast.remote
+            kwargs["connect"] = False
+
         # Allows certain connections to have more sane defaults.
         connect = kwargs.pop("connect", cls.should_connect)
 
@@ -152,7 +163,7 @@ class UdpConnection(_Connection, _TransportMixin):
             # If only 'remote_addr' was specified, that's normally enough to
             # create the socket. Since we would have popped it, we now need
             # to specify a local address.
-            if "local_addr" not in kwargs:
+            if "local_addr" not in kwargs and "sock" not in kwargs:
                 kwargs["local_addr"] = ("0.0.0.0", 0)
                 kwargs.setdefault("family", _socket.AF_INET)
 
@@ -0,0 +1,79 @@
+"""
+A module implementing IP multicast socket utilities.
+"""
+
+# built-in
+import socket as _socket
+from typing import Any, NamedTuple
+
+# Only reach the local network segment by default.
+DEFAULT_MULTICAST_TTL = 1
+
+
+class MulticastConfig(NamedTuple):
+    """Options for an IPv4 multicast socket."""
+
+    group: str
+    port: int
+    interface: str = "0.0.0.0"
+    ttl: int = DEFAULT_MULTICAST_TTL
+    loopback: bool = True
+    join: bool = True
+
+    @staticmethod
+    def create(data: dict[str, Any]) -> "MulticastConfig":
+        """Create an instance from configuration data."""
+        return MulticastConfig(**data)
+
+    @property
+    def remote(self) -> tuple[str, int]:
+        """The group address that datagrams are sent to."""
+        return (self.group, self.port)
+
+
+def multicast_socket(config: MulticastConfig) -> _socket.SocketType:
+    """
+    Create a UDP socket that sends to (and, if joining the group, receives
+    from) a multicast group. Receiving sockets are bound with address re-use
+    enabled so that any number of local consumers can share a group and
+    port.
+    """
+
+    sock = _socket.socket(_socket.AF_INET, _socket.SOCK_DGRAM)
+
+    try:
+        interface = _socket.inet_aton(config.interface)
+
+        sock.setsockopt(
+            _socket.IPPROTO_IP, _socket.IP_MULTICAST_TTL, config.ttl
+        )
+        sock.setsockopt(
+            _socket.IPPROTO_IP,
+            _socket.IP_MULTICAST_LOOP,
+            int(config.loopback),
+        )
+        sock.setsockopt(_socket.IPPROTO_IP, _socket.IP_MULTICAST_IF, interface)
+
+        port = 0
+        if config.join:
+            port = config.port
+            sock.setsockopt(_socket.SOL_SOCKET, _socket.SO_REUSEADDR, 1)
+            if hasattr(_socket, "SO_REUSEPORT"):
+                sock.setsockopt(_socket.SOL_SOCKET, _socket.SO_REUSEPORT, 1)
+
+        sock.bind(("", port))
+
+        if config.join:
+            sock.setsockopt(
+                _socket.IPPROTO_IP,
+                _socket.IP_ADD_MEMBERSHIP,
+                _socket.inet_aton(config.group) + interface,
+            )
+
+        sock.setblocking(False)
+
+    except OSError:
+        sock.close()
+        raise
+
+    return sock
@@ -54,6 +54,13 @@ class WebsocketConnection(Connection):
         self.protocol = protocol
         super().__init__(self.protocol.logger, **kwargs)
 
+    @property
+    def write_buffer_size(self) -> int:
+        """Get the number of bytes buffered by the transport for sending."""
+
+        transport = getattr(self.protocol, "transport", None)
+        return transport.get_write_buffer_size() if transport else 0
+
     async def _handle_connection_closed(
         self, task: _Awaitable[V]
     ) -> _Optional[V]:
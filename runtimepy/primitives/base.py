@@ -10,6 +10,7 @@ from typing import BinaryIO as _BinaryIO
 from typing import Callable as _Callable
 from typing import Generic as _Generic
 from typing import Iterator as _Iterator
+from typing import Optional as _Optional
 from typing import TypeVar as _TypeVar
 
 # third-party
@@ -31,6 +32,10 @@ T = _TypeVar("T", bool, int, float)
 # Current value first, new value next.
 PrimitiveChangeCallaback = _Callable[[T, T], None]
 
+# Receives a primitive (with its current and new values) instead of the
+# primitive servicing its callbacks directly.
+PrimitiveCallbackForwarder = _Callable[["Primitive[T]", T, T], None]
+
 IDENT = Identifier()
 IDENT.curr_id = 0
 IDENT.scale = 1
@@ -45,6 +50,9 @@ class Primitive(_Generic[T]):
     # Nominally set the primitive type at the class level.
     kind: _AnyPrimitiveType
 
+    # Allows callbacks to be deferred (e.g. serviced on another thread).
+    forward: _Optional[PrimitiveCallbackForwarder[T]] = None
+
     def __hash__(self) -> int:
         """A hash for this instance."""
         return self._hash
@@ -143,6 +151,15 @@ class Primitive(_Generic[T]):
         """Determine if any callbacks should be serviced."""
 
         if self.callbacks and curr != new:
+            if self.forward is not None:
+                self.forward(self, curr, new)
+            else:
+                self.service_callbacks(curr, new)
+
+    def service_callbacks(self, curr: T, new: T) -> None:
+        """Service callbacks for a value change."""
+
+        if self.callbacks:
             to_remove = []
             for ident, (callback, once) in self.callbacks.items():
                 callback(curr, new)
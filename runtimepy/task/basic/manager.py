@@ -8,10 +8,12 @@ from contextlib import asynccontextmanager as _asynccontextmanager
 from typing import AsyncIterator as _AsyncIterator
 from typing import Generic as _Generic
 from typing import Iterator as _Iterator
+from typing import Optional as _Optional
 from typing import TypeVar as _TypeVar
 
 # internal
 from runtimepy.task.basic.periodic import PeriodicTask as _PeriodicTask
+from runtimepy.task.basic.shared import SharedTaskScheduler
 
 T = _TypeVar("T", bound=_PeriodicTask)
 
@@ -19,10 +21,15 @@ T = _TypeVar("T", bound=_PeriodicTask)
 class PeriodicTaskManager(_Generic[T]):
     """A class for managing periodic tasks as a single group."""
 
-    def __init__(self) -> None:
+    def __init__(self, shared: bool = False) -> None:
         """Initialize this instance."""
+
         self._tasks: dict[str, T] = {}
 
+        # Whether or not to dispatch all tasks from a single event-loop task.
+        self.shared = shared
+        self.scheduler: _Optional[SharedTaskScheduler] = None
+
     def register(self, task: T, period_s: float = None) -> bool:
         """Register a periodic task."""
 
@@ -43,12 +50,29 @@ class PeriodicTaskManager(_Generic[T]):
 
     async def start(self, stop_sig: _asyncio.Event = None) -> None:
         """Ensure tasks are started."""
-        await _asyncio.gather(
-            *(x.task(stop_sig=stop_sig) for x in self._tasks.values())
-        )
+
+        if self.shared:
+            await self.stop()
+            self.scheduler = SharedTaskScheduler(stop_sig=stop_sig)
+            for task in self._tasks.values():
+                # Tasks with dedicated threads run on their own.
+                if task.thread is not None:
+                    await task.task(stop_sig=stop_sig)
+                else:
+                    self.scheduler.add(task)
+            self.scheduler.start()
+        else:
+            await _asyncio.gather(
+                *(x.task(stop_sig=stop_sig) for x in self._tasks.values())
+            )
 
     async def stop(self) -> None:
         """Ensure tasks are stopped."""
+
+        if self.scheduler is not None:
+            await self.scheduler.stop()
+            self.scheduler = None
+
         await _asyncio.gather(*(x.stop() for x in self._tasks.values()))
 
     @_asynccontextmanager
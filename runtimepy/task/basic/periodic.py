@@ -27,12 +27,15 @@ from runtimepy.channel.environment.command.processor import (
     ChannelCommandProcessor,
 )
 from runtimepy.metrics import PeriodicTaskMetrics
+from runtimepy.metrics.profile import attributed
 from runtimepy.mixins.environment import ChannelEnvironmentMixin
 from runtimepy.mixins.logging import LoggerMixinLevelControl
 from runtimepy.primitives import Bool as _Bool
 from runtimepy.primitives import Double as _Double
 from runtimepy.primitives import Float as _Float
 from runtimepy.primitives.evaluation import EvalResult as _EvalResult
+from runtimepy.task.basic.schedule import DeadlineScheduler, OverrunPolicy
+from runtimepy.task.basic.thread import TaskThread
 from runtimepy.ui.controls import Controlslike
 
 
@@ -53,6 +56,11 @@ class PeriodicTask(
         period_controls: Controlslike = "period",
         markdown: str = None,
         config: _JsonObject = None,
+        overrun_policy: OverrunPolicy | str = OverrunPolicy.SKIP,
+        spin_s: float = 0.0,
+        *,
+        scheduler: DeadlineScheduler = None,
+        worker: str = "loop",
     ) -> None:
         """Initialize this task."""
 
@@ -64,6 +72,12 @@ class PeriodicTask(
         LoggerMixinLevelControl.__init__(self, logger=_getLogger(self.name))
         self._task: _Optional[_asyncio.Task[None]] = None
 
+        # Tasks can run on a dedicated thread (with their own event loop).
+        assert worker in ("loop", "thread"), worker
+        self.thread: _Optional[TaskThread] = (
+            TaskThread(self) if worker == "thread" else None
+        )
+
         # Setup runtime state.
         self._enabled = _Bool()
 
@@ -76,6 +90,13 @@ class PeriodicTask(
         self.command = ChannelCommandProcessor(self.env, self.logger)
         self.register_task_metrics(self.metrics)
 
+        # An explicit scheduler takes precedence over 'overrun_policy' and
+        # 'spin_s'.
+        if scheduler is None:
+            scheduler = DeadlineScheduler(policy=overrun_policy, spin_s=spin_s)
+        self.scheduler = scheduler
+        self.register_jitter_metrics(self.scheduler.metrics)
+
         # State.
         self.paused = _Bool()
         self.env.channel(
@@ -101,6 +122,7 @@ class PeriodicTask(
 
         self._dispatch_rate = _RateTracker(depth=average_depth)
         self._dispatch_time = _MovingAverage(depth=average_depth)
+        self._iter_time = _Double()
 
     def _init_state(self) -> None:
         """Add channels to this instance's channel environment."""
@@ -129,6 +151,11 @@ class PeriodicTask(
     async def dispatch(self) -> bool:
         """Dispatch an iteration of this task."""
 
+    @property
+    def enabled(self) -> bool:
+        """Whether or not this task is enabled."""
+        return bool(self._enabled)
+
     def disable(self) -> bool:
         """Disable this task, return whether or not any action was taken."""
 
@@ -152,13 +179,8 @@ class PeriodicTask(
             )
         )
 
-    async def run(
-        self, period_s: float = None, stop_sig: _asyncio.Event = None
-    ) -> None:
-        """
-        Run this task by executing the dispatch method at the specified period
-        until a dispatch iteration fails or the task is otherwise disabled.
-        """
+    def enable(self, period_s: float = None) -> None:
+        """Enable this task (before running iterations)."""
 
         assert not self._enabled
         self._enabled.raw.value = True
@@ -169,33 +191,46 @@ class PeriodicTask(
             "Task starting at %s.", _rate_str(self.period_s.value)
         )
 
-        iter_time = _Double()
+    async def iterate(
+        self, stop_sig: _asyncio.Event = None, shield: bool = True
+    ) -> None:
+        """Run a single iteration of this task."""
+
+        # When paused, don't run the iteration itself.
+        if not self.paused:
+            with self.metrics.measure(
+                self._dispatch_rate,
+                self._dispatch_time,
+                self._iter_time,
+                self.period_s.value,
+            ):
+                dispatch = attributed(self, self.dispatch())
+                self._enabled.raw.value = await (
+                    _asyncio.shield(dispatch) if shield else dispatch
+                )
+
+        # Check this synchronously. This may not be suitable for tasks
+        # with long periods.
+        if self._enabled and stop_sig is not None:
+            self._enabled.raw.value = not stop_sig.is_set()
+
+    async def run(
+        self, period_s: float = None, stop_sig: _asyncio.Event = None
+    ) -> None:
+        """
+        Run this task by executing the dispatch method at the specified period
+        until a dispatch iteration fails or the task is otherwise disabled.
+        """
+
+        self.enable(period_s=period_s)
+        self.scheduler.start()
 
         while self._enabled:
-            # When paused, don't run the iteration itself.
-            if not self.paused:
-                with self.metrics.measure(
-                    self._dispatch_rate,
-                    self._dispatch_time,
-                    iter_time,
-                    self.period_s.value,
-                ):
-                    self._enabled.raw.value = await _asyncio.shield(
-                        self.dispatch()
-                    )
-
-            # Check this synchronously. This may not be suitable for tasks
-            # with long periods.
-            if self._enabled and stop_sig is not None:
-                self._enabled.raw.value = not stop_sig.is_set()
+            await self.iterate(stop_sig=stop_sig)
 
             if self._enabled:
                 try:
-                    sleep_time = max(self.period_s.value - iter_time.value, 0)
-
-                    # Eventually run feedback control.
-
-                    await _asyncio.sleep(sleep_time)
+                    await self.scheduler.wait(self.period_s.value)
                 except _asyncio.CancelledError:
                     self.logger.debug("Task was cancelled.")
                     self.disable()
@@ -232,6 +267,8 @@ class PeriodicTask(
 
         await self.stop()
         self._task = _asyncio.create_task(
-            self.run(period_s=period_s, stop_sig=stop_sig)
+            (self.thread.run if self.thread is not None else self.run)(
+                period_s=period_s, stop_sig=stop_sig
+            )
         )
         return self._task
@@ -0,0 +1,102 @@
+"""
+A module implementing deadline-based (drift-free) periodic scheduling.
+"""
+
+# built-in
+import asyncio as _asyncio
+from enum import StrEnum
+
+# third-party
+from vcorelib.math import from_nanos as _from_nanos
+from vcorelib.math import metrics_time_ns as _metrics_time_ns
+from vcorelib.math import to_nanos as _to_nanos
+
+# internal
+from runtimepy.metrics.jitter import JitterMetrics
+
+# The maximum number of missed deadlines serviced back-to-back (when catching
+# up) before re-anchoring.
+MAX_CATCH_UP = 10
+
+
+class OverrunPolicy(StrEnum):
+    """What to do when one or more deadlines are missed."""
+
+    # Skip to the latest deadline that's due.
+    SKIP = "skip"
+
+    # Service missed deadlines back-to-back (bounded by MAX_CATCH_UP).
+    CATCH_UP = "catch_up"
+
+
+class DeadlineScheduler:
+    """
+    Schedules iterations against absolute deadlines (so that time spent
+    dispatching, measuring and waking up doesn't accumulate as drift).
+    """
+
+    def __init__(
+        self,
+        metrics: JitterMetrics = None,
+        policy: OverrunPolicy | str = OverrunPolicy.SKIP,
+        spin_s: float = 0.0,
+    ) -> None:
+        """Initialize this instance."""
+
+        if metrics is None:
+            metrics = JitterMetrics()
+        self.metrics = metrics
+
+        self.policy = OverrunPolicy(policy)
+
+        # Wake up this long before each deadline and busy-wait the rest
+        # (useful for sub-millisecond periods).
+        self.spin_ns = _to_nanos(spin_s)
+
+        self.deadline_ns = 0
+
+    def start(self, now_ns: int = None) -> None:
+        """Anchor deadlines to the current time."""
+
+        self.deadline_ns = _metrics_time_ns() if now_ns is None else now_ns
+
+    def advance(self, period_ns: int, now_ns: int) -> int:
+        """Determine the next deadline (applying the overrun policy)."""
+
+        deadline = self.deadline_ns + period_ns
+
+        if deadline < now_ns and period_ns > 0:
+            # The number of deadlines that passed before the latest one that
+            # is due (which is serviced late rather than skipped).
+            missed = (now_ns - deadline) // period_ns
+
+            # Give up catching up if too far behind.
+            if missed and (
+                self.policy is OverrunPolicy.SKIP or missed >= MAX_CATCH_UP
+            ):
+                deadline += missed * period_ns
+                self.metrics.skipped.value += missed
+
+        self.deadline_ns = deadline
+        return deadline
+
+    async def wait(self, period_s: float) -> None:
+        """Wait for the next deadline."""
+
+        deadline = self.advance(_to_nanos(period_s), _metrics_time_ns())
+
+        remaining = deadline - self.spin_ns - _metrics_time_ns()
+        if remaining > 0:
+            await _asyncio.sleep(_from_nanos(remaining))
+        else:
+            # Always yield to the event loop.
+            await _asyncio.sleep(0)
+
+        # Busy-wait the tail.
+        if self.spin_ns:
+            while _metrics_time_ns() < deadline:
+                pass
+
+        self.metrics.record(
+            max(_from_nanos(_metrics_time_ns() - deadline), 0.0)
+        )
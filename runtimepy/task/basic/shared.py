@@ -0,0 +1,241 @@
+"""
+A module implementing a shared scheduler for many periodic tasks.
+"""
+
+from __future__ import annotations
+
+# built-in
+import asyncio as _asyncio
+from contextlib import suppress as _suppress
+from functools import partial as _partial
+import heapq
+from logging import getLogger as _getLogger
+from typing import Optional as _Optional
+
+# third-party
+from vcorelib.logging import LoggerMixin
+from vcorelib.math import from_nanos as _from_nanos
+from vcorelib.math import metrics_time_ns as _metrics_time_ns
+from vcorelib.math import to_nanos as _to_nanos
+
+# internal
+from runtimepy.task.basic.periodic import PeriodicTask
+from runtimepy.task.basic.schedule import DeadlineScheduler, OverrunPolicy
+
+
+def task_period_ns(task: PeriodicTask) -> int:
+    """Get a task's period in nanoseconds."""
+    return max(_to_nanos(task.period_s.value), 1)
+
+
+class TaskGroup:
+    """
+    Tasks that share a period (and are dispatched in the same wakeup). Groups
+    always skip missed deadlines and never busy-wait (per-task overrun
+    policies and spin durations don't apply), skipped deadlines are counted
+    by each member task's metrics.
+    """
+
+    def __init__(self, period_ns: int, now_ns: int) -> None:
+        """Initialize this instance."""
+
+        self.period_ns = period_ns
+        self.tasks: dict[str, PeriodicTask] = {}
+
+        self.schedule = DeadlineScheduler()
+        self.schedule.start(now_ns)
+
+    @property
+    def deadline_ns(self) -> int:
+        """This group's next deadline."""
+        return self.schedule.deadline_ns
+
+    def advance(self, now_ns: int) -> int:
+        """Determine this group's next deadline."""
+
+        skipped = self.schedule.metrics.skipped
+        before = skipped.value
+        result = self.schedule.advance(self.period_ns, now_ns)
+
+        missed = skipped.value - before
+        if missed:
+            for task in self.tasks.values():
+                task.scheduler.metrics.skipped.value += missed
+
+        return result
+
+
+class SharedTaskScheduler(LoggerMixin):
+    """
+    Dispatches many periodic tasks from a single event-loop task. Tasks are
+    grouped by period and groups are kept in a heap ordered by their next
+    deadline.
+    """
+
+    def __init__(self, stop_sig: _asyncio.Event = None) -> None:
+        """Initialize this instance."""
+
+        super().__init__(logger=_getLogger(__name__))
+
+        self.stop_sig = stop_sig
+        self.groups: dict[int, TaskGroup] = {}
+
+        # (deadline, period) entries (periods identify groups).
+        self._heap: list[tuple[int, int]] = []
+
+        # Dispatches that didn't complete synchronously.
+        self._busy: dict[str, _asyncio.Task[None]] = {}
+
+        self._task: _Optional[_asyncio.Task[None]] = None
+        self._waiter: _Optional[_asyncio.Future[None]] = None
+
+    def __len__(self) -> int:
+        """Get the number of scheduled tasks."""
+        return sum(len(x.tasks) for x in self.groups.values())
+
+    def _add(self, task: PeriodicTask, now_ns: int) -> None:
+        """Add a task to the group for its period."""
+
+        period = task_period_ns(task)
+
+        group = self.groups.get(period)
+        if group is None:
+            group = TaskGroup(period, now_ns)
+            self.groups[period] = group
+            heapq.heappush(self._heap, (group.deadline_ns, period))
+
+            # Re-evaluate the next wakeup.
+            if self._waiter is not None and not self._waiter.done():
+                self._waiter.set_result(None)
+
+        group.tasks[task.name] = task
+
+    def add(self, task: PeriodicTask, period_s: float = None) -> None:
+        """Enable a task and begin dispatching it."""
+
+        scheduler = task.scheduler
+        if scheduler.policy is not OverrunPolicy.SKIP or scheduler.spin_ns:
+            self.logger.warning(
+                "Task '%s' overrun policy and spin duration don't apply "
+                "to shared scheduling.",
+                task.name,
+            )
+
+        task.enable(period_s=period_s)
+        self._add(task, _metrics_time_ns())
+
+    async def _sleep(self, duration_ns: int) -> None:
+        """Sleep (unless interrupted by a group being added)."""
+
+        loop = _asyncio.get_running_loop()
+        self._waiter = loop.create_future()
+        handle = loop.call_later(
+            _from_nanos(duration_ns), self._waiter.set_result, None
+        )
+        try:
+            await self._waiter
+        finally:
+            handle.cancel()
+            self._waiter = None
+
+    def _finish(
+        self, name: str, task: PeriodicTask, iteration: _asyncio.Task[None]
+    ) -> None:
+        """Handle a dispatch completing."""
+
+        self._busy.pop(name, None)
+        if not iteration.cancelled() and iteration.exception() is not None:
+            task.logger.exception(
+                "Task failed:", exc_info=iteration.exception()
+            )
+            task.disable()
+
+    def _dispatch(self, group: TaskGroup, now_ns: int) -> None:
+        """Dispatch all tasks in a group."""
+
+        loop = _asyncio.get_running_loop()
+        jitter_s = max(_from_nanos(now_ns - group.deadline_ns), 0.0)
+
+        for name, task in list(group.tasks.items()):
+            # Drop disabled tasks and move tasks with new periods.
+            if not task.enabled:
+                del group.tasks[name]
+                continue
+            if task_period_ns(task) != group.period_ns:
+                del group.tasks[name]
+                self._add(task, now_ns)
+                continue
+
+            # Skip tasks still completing a previous iteration.
+            if name in self._busy:
+                continue
+
+            task.scheduler.metrics.record(jitter_s)
+
+            # Iterations that complete synchronously don't need to be
+            # scheduled.
+            iteration = _asyncio.eager_task_factory(
+                loop, task.iterate(stop_sig=self.stop_sig, shield=False)
+            )
+            if iteration.done():
+                self._finish(name, task, iteration)
+            else:
+                self._busy[name] = iteration
+                iteration.add_done_callback(_partial(self._finish, name, task))
+
+    async def run(self) -> None:
+        """Dispatch tasks until none remain enabled."""
+
+        while self._heap:
+            deadline_ns, period = self._heap[0]
+
+            now_ns = _metrics_time_ns()
+            if deadline_ns > now_ns:
+                await self._sleep(deadline_ns - now_ns)
+                continue
+
+            heapq.heappop(self._heap)
+            group = self.groups[period]
+            self._dispatch(group, now_ns)
+
+            if group.tasks:
+                heapq.heappush(
+                    self._heap,
+                    (group.advance(_metrics_time_ns()), period),
+                )
+            else:
+                del self.groups[period]
+
+            # Always yield to the event loop.
+            await _asyncio.sleep(0)
+
+        self.logger.debug("No tasks remain enabled.")
+
+    def start(self) -> _asyncio.Task[None]:
+        """Create an event-loop task for this scheduler."""
+
+        assert self._task is None
+        self._task = _asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop dispatching tasks (and disable them)."""
+
+        if self._task is not None:
+            self._task.cancel()
+            with _suppress(_asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        for iteration in list(self._busy.values()):
+            iteration.cancel()
+            with _suppress(_asyncio.CancelledError):
+                await iteration
+
+        # Disable tasks last (completing iterations update enabled state).
+        for group in self.groups.values():
+            for task in group.tasks.values():
+                task.disable()
+
+        self.groups.clear()
+        self._heap.clear()
@@ -0,0 +1,174 @@
+"""
+A module implementing a dedicated-thread runner for periodic tasks.
+"""
+
+from __future__ import annotations
+
+# built-in
+import asyncio as _asyncio
+from collections import deque
+from contextlib import suppress as _suppress
+from threading import Thread
+from typing import Optional as _Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Coroutine
+from typing import TypeVar
+
+# internal
+from runtimepy.primitives import AnyPrimitive
+
+if TYPE_CHECKING:  # pragma: nocover
+    from runtimepy.task.basic.periodic import PeriodicTask
+
+V = TypeVar("V")
+
+
+class TaskThread:
+    """
+    Runs a periodic task on a dedicated thread (with its own event loop).
+    Callbacks for the task's channels are queued and serviced on the
+    original event loop, asynchronous commands are routed to the task's
+    event loop.
+
+    Nothing else is made thread-safe: a task running on a dedicated thread
+    must not use connections, transports or other entities' channels
+    directly. Such calls need to be scheduled on the original event loop
+    (see 'call_soon_main').
+
+    Dedicated threads isolate a task's scheduling from the original event
+    loop (and allow blocking calls that release the GIL), they don't make
+    CPU-bound Python code use additional cores. Such work should run in a
+    separate process (e.g. a shard).
+    """
+
+    def __init__(self, task: "PeriodicTask") -> None:
+        """Initialize this instance."""
+
+        self.task = task
+
+        self.loop: _Optional[_asyncio.AbstractEventLoop] = None
+        self._main: _Optional[_asyncio.AbstractEventLoop] = None
+        self._runner: _Optional[_asyncio.Task[None]] = None
+        self._stopping = False
+
+        # Channel changes waiting to be serviced on the main event loop
+        # (deque appends and pops are thread-safe).
+        self._changes: deque[tuple[AnyPrimitive, Any, Any]] = deque()
+        self._scheduled = False
+
+    def _forward(self, primitive: AnyPrimitive, curr: Any, new: Any) -> None:
+        """Queue a channel change (to be serviced on the main event loop)."""
+
+        self._changes.append((primitive, curr, new))
+
+        if not self._scheduled and self._main is not None:
+            self._scheduled = True
+            self._main.call_soon_threadsafe(self._drain)
+
+    def _drain(self) -> None:
+        """Service queued channel changes."""
+
+        self._scheduled = False
+        while self._changes:
+            primitive, curr, new = self._changes.popleft()
+            primitive.service_callbacks(curr, new)
+
+    def _attach(self, forward: bool = True) -> None:
+        """Begin (or stop) forwarding channel changes."""
+
+        for chan in self.task.env.channels.items.values():
+            chan.raw.forward = self._forward if forward else None
+
+    def call_soon_main(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Schedule a callback on the original event loop (thread-safe)."""
+
+        assert self._main is not None
+        self._main.call_soon_threadsafe(callback, *args)
+
+    def call(self, coro: Coroutine[Any, Any, V]) -> Awaitable[V]:
+        """Run a coroutine on this task's event loop."""
+
+        if self.loop is None or self.loop.is_closed():
+            return coro
+
+        return _asyncio.wrap_future(
+            _asyncio.run_coroutine_threadsafe(coro, self.loop)
+        )
+
+    def _run(
+        self,
+        done: _asyncio.Future[None],
+        period_s: float = None,
+        stop_sig: _asyncio.Event = None,
+    ) -> None:
+        """Run the task's event loop (until the task completes)."""
+
+        assert self._main is not None
+
+        loop = _asyncio.new_event_loop()
+        self.loop = loop
+        error: _Optional[BaseException] = None
+
+        try:
+            if not self._stopping:
+                self._runner = loop.create_task(
+                    self.task.run(period_s=period_s, stop_sig=stop_sig)
+                )
+                with _suppress(_asyncio.CancelledError):
+                    loop.run_until_complete(self._runner)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            error = exc
+        finally:
+            self._runner = None
+            loop.close()
+
+            def finish() -> None:
+                """Signal that the thread is finishing."""
+
+                if not done.done():
+                    if error is not None:
+                        done.set_exception(error)
+                    else:
+                        done.set_result(None)
+
+            self._main.call_soon_threadsafe(finish)
+
+    def _cancel(self) -> None:
+        """Request that the task stops running."""
+
+        self._stopping = True
+        self.task.disable()
+
+        loop = self.loop
+        runner = self._runner
+        if loop is not None and runner is not None:
+            with _suppress(RuntimeError):
+                loop.call_soon_threadsafe(runner.cancel)
+
+    async def run(
+        self, period_s: float = None, stop_sig: _asyncio.Event = None
+    ) -> None:
+        """Run the task on a dedicated thread."""
+
+        self._main = _asyncio.get_running_loop()
+        self._stopping = False
+        self._attach()
+
+        done: _asyncio.Future[None] = self._main.create_future()
+        thread = Thread(
+            target=self._run,
+            args=(done, period_s, stop_sig),
+            name=self.task.name,
+            daemon=True,
+        )
+        thread.start()
+
+        try:
+            await _asyncio.shield(done)
+        except _asyncio.CancelledError:
+            self._cancel()
+            await done
+            raise
+        finally:
+            self._attach(forward=False)
+            self._drain()
+            thread.join()
@@ -100,6 +100,7 @@ class SampleTelemetryTask(ArbiterTask, AsyncCommandProcessingMixin):
         """Dispatch an iteration of this task."""
 
         self.tx_conn.capture()
+        self.rx_conn.release_reordered()
 
         if self.metrics.dispatches.value % self.flush_count.value == 0:
             self.tx_conn.capture(sample=False, flush=True)
@@ -0,0 +1,56 @@
+"""
+Test the 'channel.environment.shared' module.
+"""
+
+# module under test
+from runtimepy.channel.environment import ChannelEnvironment
+from runtimepy.channel.environment.shared import (
+    SharedEnvironmentLayout,
+    SharedEnvironmentReader,
+    SharedEnvironmentWriter,
+)
+
+
+def test_shared_environment_basic():
+    """Test publishing an environment to shared memory and reading it."""
+
+    env = ChannelEnvironment()
+    env.int_channel("a", "uint16")
+    env.int_channel("b", "int64")
+    env.float_channel("c", "double")
+    env.bool_channel("d")
+    env.finalize()
+
+    writer = SharedEnvironmentWriter(env)
+
+    # Layouts can be sent to other processes.
+    layout = SharedEnvironmentLayout.create(writer.layout.asdict())
+    assert layout == writer.layout
+
+    reader = SharedEnvironmentReader(layout)
+
+    # The initial values were published.
+    assert reader.read()
+    assert not reader.read()
+    assert reader.values() == {"a": 0, "b": 0, "c": 0.0, "d": False}
+
+    env.set("a", 10)
+    env.set("b", -5)
+    env.set("c", 1.5)
+    env.set("d", True)
+
+    # Nothing is read until values are published.
+    assert not reader.read()
+    assert reader["a"] == 0
+
+    writer.publish(timestamp_ns=100)
+    assert reader.read()
+    assert reader.timestamp_ns == 100
+    assert reader.values() == {"a": 10, "b": -5, "c": 1.5, "d": True}
+
+    shared = reader.environment()
+    assert shared.value("b") == -5
+    assert shared.value("d") is True
+
+    reader.close()
+    writer.close()
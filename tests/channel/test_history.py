@@ -0,0 +1,64 @@
+"""
+Test the 'channel.history' module.
+"""
+
+# module under test
+from runtimepy.channel.history import DTYPE_CODES, HistoryRecorder
+from runtimepy.primitives import AnyPrimitive, Bool, Double, Int16, Uint32
+
+
+def test_channel_history_basic():
+    """Test basic channel-history recording."""
+
+    recorder = HistoryRecorder(capacity=4)
+
+    int16 = Int16(time_source=lambda: 0)
+    double = Double()
+    boolean = Bool()
+    values: dict[str, AnyPrimitive] = {
+        "int16": int16,
+        "uint32": Uint32(),
+        "double": double,
+        "bool": boolean,
+    }
+    for name, primitive in values.items():
+        recorder.track(name, primitive)
+
+    # Tracking again doesn't reset history.
+    history = recorder.track("int16", int16)
+    assert len(history) == 1
+
+    for idx in range(1, 7):
+        int16.set_value(-idx, timestamp_ns=idx * 10)
+    double.set_value(1.5, timestamp_ns=5)
+    boolean.set_value(True, timestamp_ns=7)
+
+    # The oldest points were overwritten.
+    assert list(history.ordered()[0]) == [30, 40, 50, 60]
+    assert list(history.ordered()[1]) == [-3, -4, -5, -6]
+
+    result = {x.name: x for x in recorder.select(start_ns=35, end_ns=50)}
+    assert list(result["int16"].timestamps) == [40, 50]
+    assert list(result["int16"].values) == [-4, -5]
+    assert result["int16"].dtype == "<i2"
+    assert len(result["uint32"]) == 0
+    assert result["uint32"].dtype == "<u4"
+
+    result = {x.name: x for x in recorder.select(names=["double", "bool"])}
+    assert list(result["double"].values) == [0.0, 1.5]
+    assert result["double"].dtype == "<f8"
+    assert list(result["bool"].values) == [0, 1]
+    assert result["bool"].dtype == "<b1"
+
+    for item in result.values():
+        assert item.dtype in DTYPE_CODES
+
+    # Stopped channels are no longer recorded.
+    recorder.untrack(["int16", "missing"])
+    int16.set_value(1, timestamp_ns=70)
+    assert len(history) == 4
+    assert "int16" not in recorder.channels
+
+    recorder.untrack()
+    assert not recorder.channels
+    assert not double.callbacks
@@ -2,6 +2,9 @@
 Test data-streaming capabilities of channel registries.
 """
 
+# built-in
+from io import BytesIO
+
 # third-party
 from vcorelib.paths.context import tempfile
 
@@ -48,3 +51,39 @@ def test_channel_registry_streams_basic():
             assert events[4].value == 2
             assert events[5].name == "c"
             assert events[5].value == 3
+
+
+class WriteRecorder(BytesIO):
+    """A stream that records individual writes."""
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+
+        super().__init__()
+        self.writes: list[bytes] = []
+
+    def write(self, data) -> int:
+        """Record a write."""
+
+        self.writes.append(bytes(data))
+        return super().write(data)
+
+
+def test_channel_registry_streams_atomic():
+    """Test that channel events are emitted with individual writes."""
+
+    env = ChannelEnvironment()
+    assert env.int_channel("a")
+    env.float_channel("b")
+
+    stream = WriteRecorder()
+    with env.channels.registered(stream, flush=True):
+        env.set("a", 1)
+        env.set("b", 2.0)
+
+    # One write per event (so partial events can't be read from pipes).
+    assert len(stream.writes) == 4
+
+    stream.seek(0)
+    events = list(env.parse_event_stream(stream))
+    assert [x.value for x in events] == [0, 0.0, 1, 2.0]
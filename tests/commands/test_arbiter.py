@@ -26,6 +26,25 @@ def test_arbiter_command_basic():
         == 0
     )
 
+    # Select and tune the event loop.
+    assert (
+        runtimepy_main(
+            base
+            + [
+                "-w",
+                "--init_only",
+                "--loop",
+                "asyncio",
+                "--slow-callback-s",
+                "0.05",
+                "--executor-workers",
+                "2",
+                str(resource("empty.yaml")),
+            ]
+        )
+        == 0
+    )
+
     for entry in ["basic", "http", "control", "tftp", "basic_telemetry"]:
         assert (
             runtimepy_main(
@@ -0,0 +1,40 @@
+"""
+Test the 'commands.benchmark' module.
+"""
+
+# module under test
+from runtimepy.entry import main as runtimepy_main
+
+# internal
+from tests.resources import base_args
+
+
+def test_benchmark_command_basic():
+    """Test basic usages of the 'benchmark' command."""
+
+    base = base_args("benchmark")
+    args = ["--iterations", "10", "--connections", "10"]
+
+    assert runtimepy_main(base + args) == 0
+    assert runtimepy_main(base + args + ["-s", "json"]) == 0
+    assert runtimepy_main(base + args + ["-s", "tabs", "--tabs", "20"]) == 0
+    assert (
+        runtimepy_main(
+            base
+            + args
+            + [
+                "--suite",
+                "loop",
+                "--loop",
+                "asyncio",
+                "--gc-freeze",
+                "--gc-thresholds",
+                "1000",
+                "20",
+                "20",
+                "--executor-workers",
+                "2",
+            ]
+        )
+        == 0
+    )
@@ -0,0 +1,78 @@
+"""
+Test the 'control.schedule' module.
+"""
+
+# built-in
+import asyncio
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.channel.environment.command import GLOBAL
+from runtimepy.control.schedule import StructSchedulerTask, is_consumed
+from runtimepy.net.arbiter import AppInfo, ConnectionArbiter
+from runtimepy.net.arbiter.info import TrigStruct
+from runtimepy.net.server.websocket.state import TabStates
+
+# internal
+from tests.resources import resource
+
+
+async def schedule_test_app(app: AppInfo) -> int:
+    """Test the struct scheduler."""
+
+    task = next(app.search_tasks(StructSchedulerTask))
+    assert sorted(x.ticks for x in task.groups) == [1, 5]
+
+    structs = {x.name: x for x in app.search_structs(TrigStruct)}
+
+    # Nothing consumes these structs (yet).
+    while task.skipped.value < 10:
+        await asyncio.sleep(0.01)
+    assert not is_consumed(structs["fast"])
+    assert structs["fast"].iterations.value == 0
+    assert structs["always"].iterations.value > 0
+
+    # Recording history consumes a struct.
+    GLOBAL.record_history("fast")
+    GLOBAL.record_history("fast")
+    assert is_consumed(structs["fast"])
+    while structs["fast"].iterations.value < 5:
+        await asyncio.sleep(0.01)
+    GLOBAL.stop_history("fast")
+    assert not is_consumed(structs["fast"])
+
+    # So does streaming events.
+    with GLOBAL.temporary() as env:
+        env["slow"] = GLOBAL["slow"]
+        with env.file_event_stream("slow"):
+            assert is_consumed(structs["slow"])
+            while structs["slow"].iterations.value < 2:
+                await asyncio.sleep(0.01)
+    assert not is_consumed(structs["slow"])
+
+    # So does showing a tab (until the connection closes).
+    tabs = TabStates()
+    tabs["fast"].shown = True
+    tabs.update("fast")
+    tabs.update("fast")
+    assert is_consumed(structs["fast"])
+    tabs.deactivate()
+    assert not is_consumed(structs["fast"])
+
+    # Structs without a configured period aren't scheduled.
+    assert structs["manual"].iterations.value == 0
+
+    return 0
+
+
+@mark.asyncio
+async def test_struct_scheduler():
+    """Test polling structs at configured rates."""
+
+    arbiter = ConnectionArbiter()
+    await arbiter.load_configs(
+        [resource("connection_arbiter", "schedule.yaml")]
+    )
+    assert await asyncio.wait_for(arbiter.app(), 30) == 0
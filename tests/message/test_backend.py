@@ -0,0 +1,143 @@
+"""
+Test the 'message.backend' module.
+"""
+
+# built-in
+from enum import Enum
+from io import BytesIO
+import math
+
+# third-party
+from pytest import raises
+
+# module under test
+from runtimepy.message import MessageProcessor
+from runtimepy.message.backend import (
+    BINARY_BACKENDS,
+    JSON_BACKENDS,
+    JsonData,
+    binary_backend,
+    is_json,
+    json_backend,
+)
+
+SAMPLE = {
+    "ui": {
+        "time": 1234.5,
+        "env": {"points": {"a.b.c": [[1.0, 1000], [2.0, 2000]]}},
+    },
+    "__id__": 5,
+    "name": "sample",
+    "flag": True,
+    "none": None,
+}
+
+
+def test_json_backends_basic():
+    """Test basic interactions with all available JSON backends."""
+
+    assert json_backend().name in JSON_BACKENDS
+
+    for name in JSON_BACKENDS:
+        backend = json_backend(name)
+        assert json_backend(name) is backend
+
+        encoded = backend.dumps(SAMPLE)
+        assert isinstance(encoded, bytes)
+        assert b" " not in encoded
+
+        samples: list[JsonData] = [
+            encoded,
+            encoded.decode(),
+            memoryview(encoded),
+        ]
+        for data in samples:
+            assert backend.loads(data) == SAMPLE
+
+        # Un-encodable objects fall back to strings.
+        assert backend.loads(backend.dumps({"a": object()}))["a"].startswith(
+            "<object"
+        )
+
+        # Non-string keys and very large integers.
+        assert backend.loads(backend.dumps({1: 2**70})) == {"1": 2**70}
+
+        with raises(backend.decode_errors):
+            backend.loads(b"{not json")
+
+        # Message processors can be configured with a specific backend.
+        processor = MessageProcessor(json=backend)
+        assert processor.json is backend
+
+    with raises(AssertionError):
+        json_backend("not_a_backend")
+
+
+class Color(Enum):
+    """A sample enumeration."""
+
+    RED = 1
+
+
+def test_json_backends_differences():
+    """Test (documented) payload differences between JSON backends."""
+
+    expected = {
+        "json": (math.isnan, "Color.RED", "b'ab'"),
+        "orjson": ((lambda x: x is None), 1, "b'ab'"),
+        "msgspec": ((lambda x: x is None), 1, "YWI="),
+    }
+
+    for name in JSON_BACKENDS:
+        backend = json_backend(name)
+        nan, color, data = expected[name]
+
+        result = backend.loads(
+            backend.dumps({"nan": math.nan, "color": Color.RED, "data": b"ab"})
+        )
+        assert nan(result["nan"]), (name, result)
+        assert result["color"] == color, (name, result)
+        assert result["data"] == data, (name, result)
+
+
+def test_message_processor_negotiate():
+    """Test message-encoding negotiation and mixed-encoding decoding."""
+
+    processor = MessageProcessor()
+    assert "json" in processor.encodings
+
+    assert processor.negotiate(["json"]) == "json"
+    assert processor.backend is processor.json
+
+    if not BINARY_BACKENDS:
+        return
+
+    assert processor.negotiate(processor.encodings) in BINARY_BACKENDS
+    assert processor.backend is not processor.json
+
+    with BytesIO() as stream:
+        processor.encode_message(stream, SAMPLE)
+
+        # Messages that can't be encoded in binary fall back to JSON.
+        processor.encode_message(stream, {"a": 2**70})
+
+        processor.encode_json(stream, SAMPLE)
+        data = stream.getvalue()
+
+    assert list(processor.messages(data)) == [SAMPLE, {"a": 2**70}, SAMPLE]
+
+    # Binary messages are decoded with the negotiated (or a registered)
+    # binary backend.
+    assert processor.binary is processor.backend
+    processor.negotiate(["json"])
+    assert processor.binary.name in BINARY_BACKENDS
+    assert list(processor.messages(data)) == [SAMPLE, {"a": 2**70}, SAMPLE]
+
+    for name in BINARY_BACKENDS:
+        backend = binary_backend(name)
+        assert not is_json(backend.dumps(SAMPLE))
+        assert backend.loads(backend.dumps(SAMPLE)) == SAMPLE
+        assert backend.loads(b'{"a": 1}') == {"a": 1}
+
+        with raises(processor.decode_errors):
+            processor.decode(b"\xc1")
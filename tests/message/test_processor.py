@@ -0,0 +1,53 @@
+"""
+Test the 'message' module's size-prefixed message processor.
+"""
+
+# built-in
+from io import BytesIO
+
+# module under test
+from runtimepy.message import MessageProcessor
+from runtimepy.primitives.byte_order import ByteOrder
+
+
+def test_message_processor_fragmented():
+    """Test that messages split across many reads are re-assembled."""
+
+    processor = MessageProcessor(byte_order=ByteOrder.LITTLE_ENDIAN)
+    expected = [b"a" * size for size in range(2000)]
+
+    with BytesIO() as stream:
+        for message in expected:
+            processor.encode(stream, message)
+        data = stream.getvalue()
+
+    result: list[bytes] = []
+    for idx in range(0, len(data), 7):
+        for view in processor.process(data[idx : idx + 7]):
+            assert isinstance(view, memoryview)
+            result.append(bytes(view))
+
+    assert result == expected
+    assert processor.size == 0
+
+    # Views from prior calls shouldn't prevent the buffer from growing.
+    views = list(processor.process(data))
+    assert len(views) == len(expected)
+    assert not list(processor.process(data[:3]))
+    assert processor.size == 3
+
+
+def test_message_processor_json():
+    """Test encoding and decoding JSON messages."""
+
+    processor = MessageProcessor()
+
+    with BytesIO() as stream:
+        processor.encode_json(stream, {"a": 1, "b": object()})
+        processor.encode_json(stream, {"c": [1, 2, 3]})
+        data = stream.getvalue()
+
+    messages = list(processor.messages(data))
+    assert messages[0]["a"] == 1
+    assert isinstance(messages[0]["b"], str)
+    assert messages[1] == {"c": [1, 2, 3]}
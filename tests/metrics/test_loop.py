@@ -0,0 +1,44 @@
+"""
+Test the 'metrics.loop' module.
+"""
+
+# built-in
+import asyncio
+from asyncio.events import Handle
+import time
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.metrics.loop import ORIGINAL_RUN, EventLoopMetrics
+
+
+@mark.asyncio
+async def test_event_loop_metrics_basic():
+    """Test measuring event-loop lag and slow callbacks."""
+
+    loop = asyncio.get_running_loop()
+    metrics = EventLoopMetrics(slow_callback_s=0.01)
+
+    with metrics.timing(loop), metrics.probing(loop, 0.001):
+        # Nested timing is a no-op.
+        with EventLoopMetrics().timing(loop):
+            pass
+        assert Handle._run is not ORIGINAL_RUN  # pylint: disable=W0212
+
+        loop.call_soon(time.sleep, 0.02)
+        await asyncio.sleep(0.05)
+
+        metrics.poll(loop)
+        assert metrics.slow_callbacks.value == 1
+        assert "sleep" in metrics.slow_callback
+        assert metrics.max_callback_s.value >= 0.02
+        assert metrics.max_lag_s.value > 0.0
+        assert metrics.tasks.value >= 1
+
+        # Maximums reset on each poll.
+        metrics.poll(loop)
+        assert metrics.max_callback_s.value < 0.02
+
+    assert Handle._run is ORIGINAL_RUN  # pylint: disable=W0212
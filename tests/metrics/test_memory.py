@@ -0,0 +1,94 @@
+"""
+Test the 'metrics.memory' module.
+"""
+
+# built-in
+import asyncio
+import gc
+import tracemalloc
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.metrics.memory import AllocationSnapshots, GcMetrics
+from runtimepy.net.arbiter import AppInfo, ConnectionArbiter
+from runtimepy.net.arbiter.housekeeping.memory import MemoryMonitor
+
+# internal
+from tests.resources import resource
+
+
+def test_gc_metrics_basic():
+    """Test measuring garbage-collector activity."""
+
+    metrics = GcMetrics()
+
+    with metrics.tracking():
+        garbage: list[list[int]] = [[] for _ in range(1000)]
+        del garbage
+        gc.collect()
+
+        # Collector events are published when polled.
+        assert metrics.collections.value == 0
+        metrics.poll()
+
+    assert metrics.collections.value >= 1
+    assert metrics.max_pause_s.value > 0.0
+    assert metrics.allocation_rate.value > 0.0
+
+    # Maximums reset on each poll.
+    metrics.poll()
+    assert metrics.max_pause_s.value == 0.0
+
+
+def test_allocation_snapshots_basic():
+    """Test finding allocation sites with the most growth."""
+
+    snapshots = AllocationSnapshots()
+    assert not snapshots.snapshot()
+    assert tracemalloc.is_tracing()
+
+    data = [bytes(1024) for _ in range(100)]
+    diffs = snapshots.snapshot(limit=5)
+    assert len(diffs) <= 5
+    assert diffs[0].traceback[0].filename == __file__
+    assert diffs[0].size_diff >= 100 * 1024
+    del data
+
+    snapshots.stop()
+    assert not tracemalloc.is_tracing()
+
+
+async def memory_test_app(app: AppInfo) -> int:
+    """Test the memory-monitor struct."""
+
+    monitor = next(app.search_structs(MemoryMonitor))
+
+    # Take a baseline snapshot.
+    assert monitor.command.command("set snapshot true").success
+    while monitor.snapshot:
+        await asyncio.sleep(0.01)
+
+    data = [bytes(1024) for _ in range(100)]
+
+    assert monitor.command.command("custom snapshot").success
+    while monitor.sites[0][0].value == 0.0:
+        await asyncio.sleep(0.01)
+    assert monitor.sites[0][0].value >= 100.0
+    del data
+
+    assert monitor.command.command("custom stop_tracing").success
+    while tracemalloc.is_tracing():
+        await asyncio.sleep(0.01)
+
+    return 0
+
+
+@mark.asyncio
+async def test_memory_monitor_struct():
+    """Test the memory-monitor struct in an application."""
+
+    arbiter = ConnectionArbiter()
+    await arbiter.load_configs([resource("connection_arbiter", "memory.yaml")])
+    assert await asyncio.wait_for(arbiter.app(), 30) == 0
@@ -0,0 +1,136 @@
+"""
+Test the 'metrics.profile' module.
+"""
+
+# built-in
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import time
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.metrics.profile import (
+    ATTRIBUTION,
+    CURRENT_ENTITY,
+    SamplingProfiler,
+    attribute,
+    attributed,
+)
+from runtimepy.net.arbiter import AppInfo, ConnectionArbiter
+from runtimepy.net.arbiter.housekeeping.profile import Profiler
+
+# internal
+from tests.resources import resource
+
+
+def busy(duration_s: float) -> None:
+    """Run the CPU for some amount of time."""
+
+    end = time.perf_counter() + duration_s
+    while time.perf_counter() < end:
+        pass
+
+
+async def busy_task(duration_s: float) -> str:
+    """A coroutine that runs the CPU without yielding."""
+
+    await asyncio.sleep(0)
+    busy(duration_s)
+    return str(CURRENT_ENTITY.get())
+
+
+@mark.asyncio
+async def test_sampling_profiler_basic():
+    """Test attributing samples to entities."""
+
+    # Attribution is a no-op unless a profiler is running.
+    coro = busy_task(0.0)
+    assert attributed("a", coro) is coro
+    assert await coro == "None"
+
+    profiler = SamplingProfiler(interval_s=0.001)
+    profiler.start()
+    profiler.start()
+    assert profiler.running
+
+    assert await attributed("a", busy_task(0.1)) == "a"
+    with attribute("b"):
+        with attribute("c"):
+            busy(0.05)
+        busy(0.05)
+
+    profiler.stop()
+    profiler.stop()
+    assert not ATTRIBUTION.frames and not ATTRIBUTION.threads
+
+    total, entities = profiler.snapshot()
+    assert total > 0
+    assert entities["a"] > 0 and entities["b"] > 0 and entities["c"] > 0
+
+    lines = list(profiler.folded(label=lambda x: str(x).upper()))
+    assert any(
+        x.startswith("A;") and "busy (test_profile.py" in x for x in lines
+    )
+    assert sum(int(x.rsplit(" ", 1)[1]) for x in lines) == total
+
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp, "out.folded")
+        assert profiler.write(path) == len(lines)
+        assert path.read_text(encoding="utf-8").count("\n") == len(lines)
+
+    profiler.reset()
+    assert profiler.snapshot() == (0, {})
+
+
+async def profiler_test_app(app: AppInfo) -> int:
+    """Test the profiler struct."""
+
+    profiler = next(app.search_structs(Profiler))
+    assert profiler.profiler.running
+
+    # Sample some work attributed to this struct (and an unknown entity).
+    with attribute(profiler):
+        busy(0.1)
+    with attribute("unknown"):
+        busy(0.05)
+    profiler.poll()
+
+    assert profiler.samples.value > 0
+    assert profiler.shares["profiler"].value > 0.0
+    assert profiler.shares["other"].value > 0.0
+    assert abs(sum(x.value for x in profiler.shares.values()) - 1.0) < 1e-3
+
+    with TemporaryDirectory() as tmp:
+        profiler.directory = Path(tmp)
+
+        # Files can't be written outside of the output directory.
+        assert profiler.dump("../out.folded") is None
+        assert profiler.dump(str(Path(tmp).parent / "out.folded")) is None
+
+        path = Path(tmp, "out.folded")
+        assert profiler.command.command("custom dump out.folded").success
+        while not path.is_file():
+            await asyncio.sleep(0.01)
+        assert "profiler;" in path.read_text(encoding="utf-8")
+
+    assert profiler.command.command("custom reset").success
+    assert profiler.command.command("set enabled false").success
+    while profiler.profiler.running:
+        await asyncio.sleep(0.01)
+    assert profiler.profiler.snapshot() == (0, {})
+
+    return 0
+
+
+@mark.asyncio
+async def test_profiler_struct():
+    """Test the profiler struct in an application."""
+
+    arbiter = ConnectionArbiter()
+    await arbiter.load_configs(
+        [resource("connection_arbiter", "profile.yaml")]
+    )
+    assert await asyncio.wait_for(arbiter.app(), 30) == 0
@@ -0,0 +1,91 @@
+"""
+Test the 'metrics.sequence' module.
+"""
+
+# module under test
+from runtimepy.metrics import ReorderBuffer, SequenceMetrics, SequenceTracker
+
+
+def test_sequence_tracker_basic():
+    """Test basic interactions with a sequence tracker."""
+
+    metrics = SequenceMetrics.create()
+    tracker = SequenceTracker(metrics)
+
+    # In order (across the wrap-around point).
+    for sequence in [65534, 65535, 0, 1]:
+        tracker(sequence)
+    assert metrics.received.value == 4
+    assert metrics.lost.value == 0
+
+    # Gap.
+    tracker(5)
+    assert metrics.lost.value == 3
+
+    # Late arrival of a message counted as lost.
+    tracker(3)
+    assert metrics.lost.value == 2
+    assert metrics.reordered.value == 1
+
+    # Duplicates.
+    tracker(3)
+    tracker(5)
+    assert metrics.duplicates.value == 2
+
+    # Large backwards jump (sender restart).
+    tracker(40000)
+    tracker(40001)
+    assert metrics.lost.value == 2
+    assert metrics.reordered.value == 1
+
+    # Jitter.
+    tracker.arrival(1000, 0)
+    assert metrics.jitter_ms.value == 0.0
+    tracker.arrival(2000 + 16 * 10**6, 1000)
+    assert metrics.jitter_ms.value == 1.0
+    tracker.arrival(3000 + 16 * 10**6, 2000)
+    assert metrics.jitter_ms.value < 1.0
+
+
+def test_reorder_buffer_basic():
+    """Test basic interactions with a re-ordering buffer."""
+
+    now = 0
+
+    def time_source() -> int:
+        """A simple time source."""
+        return now
+
+    buffer: ReorderBuffer[int] = ReorderBuffer(
+        100, depth=4, time_source=time_source
+    )
+
+    assert list(buffer.ingest(65535, 65535)) == [65535]
+    assert not list(buffer.ingest(1, 1))
+    assert not list(buffer.ingest(2, 2))
+    assert list(buffer.ingest(0, 0)) == [0, 1, 2]
+
+    # Duplicates and late items are dropped.
+    assert not list(buffer.ingest(2, 2))
+
+    # Missing items are skipped once the window elapses.
+    assert not list(buffer.ingest(5, 5))
+    assert not list(buffer.ingest(4, 4))
+    now = 50
+    assert not list(buffer.release())
+    now = 100
+    assert list(buffer.release()) == [4, 5]
+    assert not list(buffer.ingest(3, 3))
+
+    # Missing items are skipped when the buffer is full.
+    for sequence in range(7, 11):
+        assert not list(buffer.ingest(sequence, sequence))
+    assert list(buffer.ingest(11, 11)) == list(range(7, 12))
+
+    # Large backwards jumps are treated as restarts.
+    assert not list(buffer.ingest(15, 15))
+    assert list(buffer.ingest(1000 + 2**15, 0)) == [15, 0]
+    assert buffer.expected == 1001 + 2**15
+    assert not list(buffer.ingest(1002 + 2**15, 2))
+    assert list(buffer.flush()) == [2]
+    assert buffer.expected is None
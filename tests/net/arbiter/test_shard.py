@@ -0,0 +1,66 @@
+"""
+Test the 'net.arbiter.shard' module.
+"""
+
+# built-in
+import asyncio
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.channel.environment.command import GLOBAL
+from runtimepy.net.arbiter import AppInfo, ConnectionArbiter
+
+# internal
+from tests.resources import resource
+
+
+async def shard_test_app(app: AppInfo) -> int:
+    """Test that shard environments are updated."""
+
+    assert "worker.noise" in GLOBAL
+
+    env = GLOBAL["worker.wave"].env
+    while int(env.value("metrics.dispatches")) < 10:
+        await asyncio.sleep(0.01)
+
+    app.logger.info(
+        "Shard task dispatched %d times.", env.value("metrics.dispatches")
+    )
+    return 0
+
+
+@mark.asyncio
+async def test_connection_arbiter_shards():
+    """Test running part of an application in a worker process."""
+
+    arbiter = ConnectionArbiter()
+    await arbiter.load_configs([resource("connection_arbiter", "shards.yaml")])
+    assert await asyncio.wait_for(arbiter.app(), 60) == 0
+
+
+async def shard_worker_exit_app(app: AppInfo) -> int:
+    """A shard application that stops on its own."""
+
+    app.stop.set()
+    return 0
+
+
+async def shard_exit_test_app(app: AppInfo) -> int:
+    """Test that a shard exiting stops the application."""
+
+    await asyncio.wait_for(app.stop.wait(), 30)
+    assert "early.wave" not in GLOBAL
+    return 0
+
+
+@mark.asyncio
+async def test_connection_arbiter_shard_exit():
+    """Test handling a worker process exiting on its own."""
+
+    arbiter = ConnectionArbiter()
+    await arbiter.load_configs(
+        [resource("connection_arbiter", "shard_exit.yaml")]
+    )
+    assert await asyncio.wait_for(arbiter.app(), 60) == 0
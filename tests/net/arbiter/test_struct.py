@@ -0,0 +1,194 @@
+"""
+Test the 'net.arbiter.struct' module.
+"""
+
+# built-in
+import asyncio
+import socket
+
+# third-party
+from pytest import mark, raises
+
+# module under test
+from runtimepy.net import get_free_socket_name
+from runtimepy.telemetry.sample import (
+    SampleTelemetryStruct,
+    SampleTelemetryTransceiver,
+)
+
+
+def create_struct(name: str) -> SampleTelemetryStruct:
+    """Create a sample telemetry struct."""
+
+    result = SampleTelemetryStruct(name, {})
+    result.init_env()
+    result.update_byte_order(result.byte_order)
+    return result
+
+
+class ReorderingTransceiver(SampleTelemetryTransceiver):
+    """A sample transceiver that re-orders received structs."""
+
+    reorder_window_ns = 10**9
+
+
+async def transceiver_sequence(
+    kind: type[SampleTelemetryTransceiver], frames: list[bytes]
+) -> list[int]:
+    """
+    Send frames out of order (and with a duplicate) to a transceiver and
+    return the sequence numbers it handled.
+    """
+
+    conn1, conn2 = await kind.create_pair()
+
+    received: list[int] = []
+
+    def handle_update(timestamp_ns, instance, _) -> None:
+        """Record received sequence numbers."""
+
+        del timestamp_ns
+        received.append(instance.sequence.value)
+
+    conn1.handle_update = handle_update  # type: ignore
+    conn1.assign_rx(create_struct("rx"))
+
+    addr = ("127.0.0.1", 0)
+
+    # Multiple frames per datagram.
+    assert await conn1.process_datagram(frames[0] + frames[2], addr)
+    assert await conn1.process_datagram(frames[1], addr)
+    assert await conn1.process_datagram(frames[1] + frames[5], addr)
+    conn1.release_reordered()
+
+    metrics = conn1.sequence_metrics
+    assert metrics.received.value == 5
+    assert metrics.reordered.value == 1
+    assert metrics.duplicates.value == 1
+    assert metrics.lost.value == 2
+    assert metrics.sources.value == 1
+
+    # Release anything still held.
+    for buffer in conn1.reorder_buffers.values():
+        buffer.window_ns = 0
+    conn1.release_reordered()
+
+    for conn in [conn1, conn2]:
+        conn.disable("test complete")
+        await conn.close()
+
+    return received
+
+
+@mark.asyncio
+async def test_udp_struct_transceiver_sequence():
+    """Test sequence tracking for received structs."""
+
+    tx = create_struct("tx")
+    frames = []
+    for _ in range(6):
+        tx.poll()
+        frames.append(bytes(tx.array))
+
+    assert await transceiver_sequence(SampleTelemetryTransceiver, frames) == [
+        1,
+        3,
+        2,
+        2,
+        6,
+    ]
+    assert await transceiver_sequence(ReorderingTransceiver, frames) == [
+        1,
+        2,
+        3,
+        6,
+    ]
+
+
+async def receive_frames(
+    tx: SampleTelemetryTransceiver, *receivers: SampleTelemetryTransceiver
+) -> None:
+    """Send a frame and verify that each receiver gets an identical copy."""
+
+    tx.capture(flush=True)
+
+    expected = None
+    for conn in receivers:
+        queue = conn._protocol.queue  # pylint: disable=protected-access
+        data, _ = await asyncio.wait_for(queue.get(), 1.0)
+        if expected is None:
+            expected = data
+        assert data == expected
+
+    assert expected
+
+
+@mark.asyncio
+async def test_udp_struct_transceiver_fan_out():
+    """Test sending the same frame to multiple destinations."""
+
+    receivers = [
+        await SampleTelemetryTransceiver.create_connection(
+            local_addr=("127.0.0.1", 0)
+        )
+        for _ in range(3)
+    ]
+
+    tx = await SampleTelemetryTransceiver.create_connection(
+        local_addr=("127.0.0.1", 0),
+        destinations=[x.local_address for x in receivers[:2]],
+    )
+    assert tx.remote_address is None
+    tx.add_destination(receivers[2].local_address)
+    tx.add_destination(list(receivers[2].local_address))
+    assert len(tx.destinations) == 3
+
+    struct = create_struct("tx")
+    tx.assign_tx(struct)
+    assert struct.env.channels.consumers == 1
+    await receive_frames(tx, *receivers)
+    assert tx.metrics.tx.messages.value == 3
+
+    tx.remove_destination(receivers[2].local_address)
+    assert len(tx.destinations) == 2
+
+    # Connected sockets can't send to other destinations.
+    with raises(ValueError):
+        await SampleTelemetryTransceiver.create_connection(
+            remote_addr=receivers[0].local_address,
+            destinations=[receivers[1].local_address],
+        )
+
+    for conn in [tx, *receivers]:
+        await conn.close()
+
+    # Disabled connections no longer consume their transmit struct.
+    tx.disable("test")
+    assert struct.env.channels.consumers == 0
+
+
+@mark.asyncio
+async def test_udp_struct_transceiver_multicast():
+    """Test sending structs to a multicast group."""
+
+    group = "239.255.0.1"
+    port = get_free_socket_name(kind=socket.SOCK_DGRAM).port
+
+    receivers = [
+        await SampleTelemetryTransceiver.create_connection(
+            multicast={"group": group, "port": port}
+        )
+        for _ in range(2)
+    ]
+
+    tx = await SampleTelemetryTransceiver.create_connection(
+        multicast={"group": group, "port": port, "join": False, "ttl": 0}
+    )
+    assert tx.remote_address is not None
+    assert tx.remote_address.address_str == group
+
+    tx.assign_tx(create_struct("tx"))
+    await receive_frames(tx, *receivers)
+
+    for conn in [tx, *receivers]:
+        await conn.close()
@@ -0,0 +1,75 @@
+"""
+Test the 'net.arbiter.tuning' module.
+"""
+
+# built-in
+import asyncio
+import gc
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.net.arbiter import AppInfo, ConnectionArbiter
+from runtimepy.net.arbiter.tuning import LoopImplementation, LoopTuning
+
+# internal
+from tests.resources import resource
+
+
+def test_loop_tuning_basic():
+    """Test that only configured settings are applied."""
+
+    tuning = LoopTuning.create({"implementation": "asyncio", "debug": None})
+    assert tuning.implementation is LoopImplementation.ASYNCIO
+    assert tuning.asdict() == {
+        "implementation": "asyncio",
+        "executor_workers": 0,
+        "gc_freeze": False,
+    }
+
+    thresholds = gc.get_threshold()
+
+    loop = tuning.new_event_loop()
+    loop.set_debug(True)
+    loop.slow_callback_duration = 0.5
+    try:
+        tuning.apply(loop)
+        assert loop.get_debug()
+        assert loop.slow_callback_duration == 0.5
+
+        tuning = tuning.update(debug=False, gc_thresholds=[1000, 20, 20])
+        tuning.apply(loop)
+        assert not loop.get_debug()
+        assert gc.get_threshold() == (1000, 20, 20)
+    finally:
+        loop.close()
+        tuning.restore()
+
+    assert gc.get_threshold() == thresholds
+
+
+async def tuning_test_app(_: AppInfo) -> int:
+    """Test an application with event-loop settings."""
+
+    assert asyncio.get_running_loop().slow_callback_duration == 0.05
+    assert gc.get_threshold() == (1000, 20, 20)
+
+    return 0
+
+
+@mark.asyncio
+async def test_loop_tuning_config():
+    """Test applying event-loop settings from config."""
+
+    thresholds = gc.get_threshold()
+
+    arbiter = ConnectionArbiter()
+    await arbiter.load_configs(
+        [resource("connection_arbiter", "event_loop.yaml")]
+    )
+    assert arbiter.tuning.slow_callback_s == 0.05
+    assert await asyncio.wait_for(arbiter.app(), 30) == 0
+
+    # Garbage-collector settings are restored.
+    assert gc.get_threshold() == thresholds
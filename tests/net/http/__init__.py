@@ -0,0 +1,3 @@
+"""
+A module implementing HTTP-related tests.
+"""
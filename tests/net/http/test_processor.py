@@ -0,0 +1,133 @@
+"""
+Test the 'net.http' module.
+"""
+
+# built-in
+from typing import Optional
+
+# third-party
+from pytest import raises
+
+# module under test
+from runtimepy.net.http import (
+    HeaderTooLarge,
+    HttpMessageProcessor,
+    MalformedMessage,
+)
+from runtimepy.net.http.header import RequestHeader
+from runtimepy.net.http.response import ResponseHeader
+
+
+def test_http_message_processor_basic():
+    """Test basic HTTP message processing."""
+
+    request = RequestHeader(target="/a")
+    request["content-length"] = "5"
+    data = bytes(request) + b"hello"
+
+    response = ResponseHeader()
+    message = bytes(response)
+
+    processor = HttpMessageProcessor()
+
+    # Deliver a request one byte at a time.
+    results: list[tuple[RequestHeader, Optional[memoryview]]] = []
+    for idx in range(len(data)):
+        results.extend(processor.ingest(data[idx : idx + 1], RequestHeader))
+    assert len(results) == 1
+    header, payload = results[0]
+    assert str(header.target.path) == "/a"
+    assert isinstance(payload, memoryview)
+    assert payload == b"hello"
+    assert processor.size == 0
+
+    # Multiple (pipelined) messages in one frame, with leading empty lines.
+    results = list(processor.ingest(b"\r\n" + data + data, RequestHeader))
+    assert len(results) == 2
+    assert all(x[1] == b"hello" for x in results)
+
+    # Bare line feeds.
+    responses = list(
+        processor.ingest(message + message.replace(b"\r", b""), ResponseHeader)
+    )
+    assert len(responses) == 2
+    assert all(x[0].status == response.status for x in responses)
+    assert all(x[1] is None for x in responses)
+
+    # Payloads remain valid after more data is processed.
+    first = list(processor.ingest(data, RequestHeader))[0][1]
+    list(processor.ingest(data, RequestHeader))
+    assert first == b"hello"
+
+    # A large body split across many frames.
+    request["content-length"] = str(10 * 1024)
+    body = bytes(range(256)) * 40
+    chunks = [body[idx : idx + 1000] for idx in range(0, len(body), 1000)]
+
+    assert not list(processor.ingest(bytes(request), RequestHeader))
+    for chunk in chunks[:-1]:
+        assert not list(processor.ingest(chunk, RequestHeader))
+        assert processor.pending
+    results = list(processor.ingest(chunks[-1], RequestHeader))
+    assert results[0][1] == body
+    assert processor.size == 0
+
+
+def test_http_message_processor_chunked():
+    """Test processing bodies that use chunked transfer coding."""
+
+    request = RequestHeader(method="POST")
+    request["transfer-encoding"] = "chunked"
+
+    data = (
+        bytes(request)
+        + b"5\r\nhello\r\n"
+        + b"1;name=value\r\n \r\n"
+        + b"5\nworld\n"
+        + b"0\r\ntrailer: value\r\n\r\n"
+    )
+
+    processor = HttpMessageProcessor()
+
+    results: list[tuple[RequestHeader, Optional[memoryview]]] = []
+    for _ in range(2):
+        for idx in range(len(data)):
+            results.extend(
+                processor.ingest(data[idx : idx + 1], RequestHeader)
+            )
+    results.extend(processor.ingest(data + data, RequestHeader))
+
+    assert len(results) == 4
+    assert all(x[1] == b"hello world" for x in results)
+    assert processor.size == 0
+
+    # An empty body.
+    results = list(
+        processor.ingest(bytes(request) + b"0\r\n\r\n", RequestHeader)
+    )
+    assert len(results) == 1
+    assert results[0][1] is None
+
+    # An invalid chunk size.
+    with raises(MalformedMessage):
+        list(processor.ingest(bytes(request) + b"zz\r\n", RequestHeader))
+
+
+def test_http_message_processor_header_limit():
+    """Test that header sections are limited in size."""
+
+    processor = HttpMessageProcessor(max_header_size=64)
+
+    request = RequestHeader()
+    request["a"] = "a" * 32
+    assert list(processor.ingest(bytes(request), RequestHeader))
+
+    request["b"] = "b" * 32
+    with raises(HeaderTooLarge):
+        list(processor.ingest(bytes(request), RequestHeader))
+
+    # An unterminated header section.
+    processor = HttpMessageProcessor(max_header_size=64)
+    assert not list(processor.ingest(b"GET / HTTP/1.1\r\n", RequestHeader))
+    with raises(HeaderTooLarge):
+        list(processor.ingest(b"a: " + b"a" * 64, RequestHeader))
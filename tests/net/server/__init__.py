@@ -4,13 +4,18 @@ Test HTTP server interactions.
 
 # built-in
 import asyncio
+import http
+import json
 from typing import Any
 
 # module under test
 from runtimepy.net.arbiter.info import AppInfo
 from runtimepy.net.http.header import RequestHeader
 from runtimepy.net.server import RuntimepyServerConnection
-from runtimepy.net.server.websocket import RuntimepyWebsocketConnection
+from runtimepy.net.server.websocket import (
+    RuntimepyDataWebsocketConnection,
+    RuntimepyWebsocketConnection,
+)
 from runtimepy.net.tcp.http import HttpConnection
 
 # internal
@@ -26,9 +31,16 @@ def send_ui(
 
 async def runtimepy_websocket_client(
     client: RuntimepyWebsocketConnection,
+    data: RuntimepyDataWebsocketConnection = None,
 ) -> None:
     """Test client interactions via WebSocket."""
 
+    # Pair a data connection for receiving plot points.
+    if data is not None:
+        token = f"test-{id(data)}"
+        data.send_message_str(json.dumps({"token": token}))
+        client.send_json({"ui": {"data_stream": token}})
+
     send_ui(client, "test", {"a": 1, "b": 2, "c": 3})
 
     time = 0.0
@@ -44,6 +56,16 @@ async def runtimepy_websocket_client(
         # Trigger some telemetry sending.
         send_ui(client, f"wave{idx}", {"kind": "init"})
         send_ui(client, f"wave{idx}", {"kind": "tab.shown"})
+        send_ui(
+            client,
+            f"wave{idx}",
+            {"kind": "plot", "value": {"channel": "sin", "state": True}},
+        )
+        send_ui(
+            client,
+            f"wave{idx}",
+            {"kind": "plot.decimation", "width": 64, "method": "lttb"},
+        )
 
         # Drive the UI forward.
         for _ in range(5):
@@ -53,6 +75,10 @@ async def runtimepy_websocket_client(
 
         send_ui(client, f"wave{idx}", {"kind": "tab.hidden"})
 
+    if data is not None:
+        assert data.channels
+        assert sum(data.point_counts.values()) > 0
+
 
 async def runtimepy_http_query_peer(app: AppInfo) -> None:
     """Test querying a peer program's web application."""
@@ -159,3 +185,23 @@ async def runtimepy_http_client_server(
             ),
         )
     )
+
+    # Conditional and compressed static-file requests.
+    request = RequestHeader(target="/css/main.css")
+    request["accept-encoding"] = "gzip, deflate"
+    header, body = await client.request(request)
+    assert header["content-encoding"] == "gzip"
+    assert body
+
+    request["if-none-match"] = header["etag"]
+    header, body = await client.request(request)
+    assert header.status == http.HTTPStatus.NOT_MODIFIED
+    assert not body
+
+    # Rendered markdown is cached.
+    hits = server.render_cache.hits
+    for _ in range(2):
+        header, body = await client.request(RequestHeader(target="/README.md"))
+        assert header["content-type"].startswith("text/html")
+        assert body
+    assert server.render_cache.hits > hits
@@ -0,0 +1,158 @@
+"""
+Test the 'net.server.history' module.
+"""
+
+# built-in
+import asyncio
+import http
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.channel.environment.command import GLOBAL
+from runtimepy.net.arbiter import AppInfo, ConnectionArbiter
+from runtimepy.net.http.header import RequestHeader
+from runtimepy.net.server import RuntimepyServerConnection
+from runtimepy.net.server.history import (
+    HISTORY_CONTENT_TYPE,
+    decode_history,
+    parse_history_query,
+)
+
+# internal
+from tests.channel.environment.test_global import sample_env
+from tests.resources import resource
+
+
+def test_parse_history_query():
+    """Test parsing history-request query strings."""
+
+    assert parse_history_query(None) == (None, None, None)
+    assert parse_history_query("channels=a,b&channels=c&start=1&end=2") == (
+        ["a", "b", "c"],
+        1,
+        2,
+    )
+
+
+@mark.asyncio
+async def test_history_endpoint():
+    """Test requesting channel history from a server."""
+
+    name = "history_test"
+    GLOBAL.register(name, sample_env(name))
+    env = GLOBAL[name].env
+
+    try:
+        assert GLOBAL.record_history(name, pattern="null.*int32") == [
+            "null.uint32",
+            "null.int32",
+        ]
+        GLOBAL.record_history(name, pattern="null.double", exact=True)
+
+        for idx in range(10):
+            env.set("null.int32", -idx)
+            env.set("null.double", idx / 2)
+
+        async with RuntimepyServerConnection.create_pair(
+            peer=RuntimepyServerConnection
+        ) as (server, client):
+            async with server.process_then_disable():
+                async with client.process_then_disable():
+                    header, body = await client.request(
+                        RequestHeader(
+                            target=f"/history/{name}"
+                            "?channels=null.int32,null.double"
+                        )
+                    )
+                    assert header.status == http.HTTPStatus.OK
+                    assert header["content-type"] == HISTORY_CONTENT_TYPE
+                    assert header.chunked
+                    assert body is not None
+
+                    meta, columns = decode_history(bytes(body))
+                    assert meta["environment"] == name
+                    assert [x["name"] for x in meta["channels"]] == [
+                        "null.int32",
+                        "null.double",
+                    ]
+
+                    timestamps, values = columns["null.int32"]
+                    assert list(values) == [
+                        0,
+                        -1,
+                        -2,
+                        -3,
+                        -4,
+                        -5,
+                        -6,
+                        -7,
+                        -8,
+                        -9,
+                    ]
+                    assert list(timestamps) == sorted(timestamps)
+                    assert list(columns["null.double"][1])[-1] == 4.5
+
+                    # Select a time range.
+                    start = timestamps[3]
+                    end = timestamps[5]
+                    _, body = await client.request(
+                        RequestHeader(
+                            target=f"/history/{name}?start={start}&end={end}"
+                        )
+                    )
+                    assert body is not None
+                    _, columns = decode_history(bytes(body))
+                    assert list(columns["null.int32"][1]) == [-3, -4, -5]
+                    assert set(columns) == {
+                        "null.uint32",
+                        "null.int32",
+                        "null.double",
+                    }
+
+                    # Errors.
+                    for target in [
+                        "/history",
+                        "/history/not_an_env",
+                        f"/history/{name}?channels=null.bool",
+                        f"/history/{name}?start=abc",
+                    ]:
+                        header, _ = await client.request(
+                            RequestHeader(target=target)
+                        )
+                        assert header.status in {
+                            http.HTTPStatus.NOT_FOUND,
+                            http.HTTPStatus.BAD_REQUEST,
+                        }
+    finally:
+        GLOBAL.stop_history(name)
+        del GLOBAL[name]
+
+    assert not env.channels["null.int32"].raw.callbacks
+
+
+async def history_config_app(app: AppInfo) -> int:
+    """Test that configuration data starts recording history."""
+
+    recorder = GLOBAL.history["trig"]
+    assert list(recorder.channels) == ["iterations"]
+    assert recorder.channels["iterations"].capacity == 16
+
+    app.structs["trig"].poll()
+    assert len(recorder.channels["iterations"]) == 2
+
+    return 0
+
+
+@mark.asyncio
+async def test_history_config():
+    """Test recording history based on configuration data."""
+
+    arbiter = ConnectionArbiter()
+    await arbiter.load_configs(
+        [resource("connection_arbiter", "history.yaml")]
+    )
+    assert await asyncio.wait_for(arbiter.app(), 30) == 0
+
+    assert "trig" not in GLOBAL.history
@@ -0,0 +1,37 @@
+"""
+Test the 'net.server.render' module.
+"""
+
+# module under test
+from runtimepy.net.server.render import RenderCache
+
+
+def test_render_cache_basic():
+    """Test basic interactions with a render cache."""
+
+    cache: RenderCache[str] = RenderCache(capacity=2)
+
+    assert cache.get("a") is None
+    assert cache.put("a", "a1", validator=1) == "a1"
+    assert cache.get("a", 1) == "a1"
+
+    # Stale entries aren't used.
+    assert cache.get("a", 2) is None
+    cache.put("a", "a2", validator=2)
+    assert cache.get("a", 2) == "a2"
+
+    # The least-recently used entry is evicted.
+    cache.put("b", "b")
+    assert cache.get("a", 2) == "a2"
+    cache.put("c", "c")
+    assert cache.get("b") is None
+    assert cache.get("a", 2) == "a2"
+    assert cache.get("c") == "c"
+
+    assert cache.hits == 5
+    assert cache.misses == 3
+
+    cache.invalidate("a")
+    assert cache.get("a", 2) is None
+    cache.invalidate()
+    assert not cache.entries
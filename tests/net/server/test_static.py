@@ -0,0 +1,131 @@
+"""
+Test the 'net.server.static' module.
+"""
+
+# built-in
+import gzip
+import os
+from pathlib import Path
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.net.http.header import RequestHeader
+from runtimepy.net.server.static import (
+    COMPRESS_MAX_SIZE,
+    StaticFileCache,
+    accepted_codings,
+    compress,
+)
+
+
+def write_file(path: Path, data: str, mtime_ns: int) -> None:
+    """Write a file with a specific modification time."""
+
+    path.write_text(data, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@mark.asyncio
+async def test_static_file_cache_basic(tmp_path: Path):
+    """Test basic interactions with a static-file cache."""
+
+    path = tmp_path.joinpath("test.js")
+    write_file(path, "const a = 1;\n" * 100, 10**18)
+
+    cache = StaticFileCache(4096)
+    assert cache.preload(tmp_path) == 1
+    assert await cache.get(tmp_path) is None
+    assert await cache.get(tmp_path.joinpath("missing.js")) is None
+
+    entry = await cache.get(path)
+    assert entry is not None
+    assert cache.hits == 1 and cache.misses == 0
+    assert entry.mime == "text/javascript"
+    assert "gzip" in entry.variants
+
+    # Compressed variants.
+    request = RequestHeader()
+    assert entry.body(request) == (entry.data, None)
+    request["accept-encoding"] = "gzip;q=0.5, identity"
+    data, coding = entry.body(request)
+    assert coding == "gzip"
+    assert gzip.decompress(data) == entry.data
+
+    # Conditional requests.
+    request = RequestHeader()
+    assert not entry.not_modified(request)
+    request["if-none-match"] = f'"a", W/{entry.etag}'
+    assert entry.not_modified(request)
+    request["if-none-match"] = '"a"'
+    assert not entry.not_modified(request)
+
+    request = RequestHeader()
+    request["if-modified-since"] = entry.last_modified
+    assert entry.not_modified(request)
+    request["if-modified-since"] = "Thu, 01 Jan 1970 00:00:00 GMT"
+    assert not entry.not_modified(request)
+    request["if-modified-since"] = "not a date"
+    assert not entry.not_modified(request)
+
+    # Modified files are re-loaded.
+    write_file(path, "const b = 2;\n" * 100, 2 * 10**18)
+    new_entry = await cache.get(path)
+    assert new_entry is not None
+    assert new_entry.etag != entry.etag
+    assert cache.misses == 1
+
+    # Files are evicted when the cache is over budget.
+    other = tmp_path.joinpath("other.txt")
+    write_file(other, "a" * 4000, 10**18)
+    assert await cache.get(other) is not None
+    assert path not in cache.entries
+    assert cache.size <= cache.budget
+
+    # Removed files are discarded.
+    other.unlink()
+    assert await cache.get(other) is None
+    assert cache.size == 0
+
+
+@mark.asyncio
+async def test_static_file_cache_large(tmp_path: Path):
+    """Test caching files that are large relative to the cache's budget."""
+
+    cache = StaticFileCache(4096)
+
+    # Files larger than the budget aren't cached (or compressed).
+    large = tmp_path.joinpath("large.txt")
+    write_file(large, "a" * 8192, 10**18)
+    entry = await cache.get(large)
+    assert entry is not None and not entry.variants
+    assert large not in cache.entries
+
+    # Files that might not fit with their compressed variants are cached
+    # uncompressed.
+    medium = tmp_path.joinpath("medium.txt")
+    write_file(medium, "a" * 2048, 10**18)
+    entry = await cache.get(medium)
+    assert entry is not None and not entry.variants
+    assert medium in cache.entries
+    cache.discard(medium)
+
+
+def test_compress_limits():
+    """Test the size limits for compressing file data."""
+
+    assert not compress(b"a" * 16, "text/plain")
+    assert compress(b"a" * 1024, "text/plain")
+    assert not compress(b"a" * 1024, "image/png")
+    assert not compress(b"a" * (COMPRESS_MAX_SIZE + 1), "text/plain")
+
+
+def test_accepted_codings():
+    """Test parsing 'Accept-Encoding' header fields."""
+
+    request = RequestHeader()
+    assert not accepted_codings(request)
+
+    request["accept-encoding"] = "gzip, br;q=0, deflate;q=0.1"
+    assert accepted_codings(request) == {"gzip", "deflate"}
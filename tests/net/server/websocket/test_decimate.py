@@ -0,0 +1,94 @@
+"""
+Test the 'net.server.websocket.decimate' module.
+"""
+
+# built-in
+import math
+
+# module under test
+from runtimepy.net.server.websocket.decimate import (
+    Decimation,
+    Point,
+    lttb,
+    min_max,
+    stride,
+)
+from runtimepy.net.server.websocket.state import TabState
+
+
+def sine(count: int) -> list[Point]:
+    """Create some sample points."""
+    return [(math.sin(idx / 10.0), idx * 1000) for idx in range(count)]
+
+
+def test_decimate_methods():
+    """Test decimation methods."""
+
+    points = sine(1000)
+    points[123] = (5.0, points[123][1])
+    points[456] = (-5.0, points[456][1])
+
+    for method in [min_max, lttb, stride]:
+        # Small inputs are untouched.
+        assert method(points[:10], 16) == points[:10]
+
+        result = method(points, 64)
+        assert len(result) <= 64
+        assert result[-1] == points[-1]
+
+        # Points stay in time order.
+        times = [x[1] for x in result]
+        assert times == sorted(times)
+
+    # Extreme values are preserved.
+    for method in [min_max, lttb]:
+        result = method(points, 64)
+        assert points[123] in result
+        assert points[456] in result
+
+    assert lttb(points, 64)[0] == points[0]
+
+    # Non-numeric values fall back to striding.
+    names = [(f"value{idx}", idx) for idx in range(100)]
+    assert min_max(names, 10) == stride(names, 10)
+    assert lttb(names, 10) == stride(names, 10)
+
+
+def test_decimation_settings():
+    """Test negotiating decimation settings."""
+
+    decimation = Decimation()
+
+    decimation.update({"width": 100, "depth": 50, "method": "lttb"})
+    assert decimation.method == "lttb"
+    assert decimation.max_points == 50
+
+    decimation.update({"width": 1, "method": "unknown"})
+    assert decimation.method == "lttb"
+    assert decimation.max_points == 4
+
+    decimation.update({"width": 1000000})
+    assert decimation.max_points == 4096
+
+
+def test_tab_state_points_bounded():
+    """Test that buffered and delivered points are bounded."""
+
+    state = TabState.create()
+    state.decimation.update({"width": 32})
+
+    state.set_plotted("a", True)
+    state.set_plotted("b", True)
+    state.set_plotted("b", False)
+
+    for point in sine(10000):
+        state.add_point("a", point)
+        state.add_point("b", point)
+        assert len(state.points["a"]) < state.decimation.max_buffered
+        assert len(state.points["b"]) < state.decimation.max_buffered
+
+    result = state.frame(0.0)["points"]
+    assert len(result["a"]) <= 32
+    assert result["a"][-1] == (math.sin(9999 / 10.0), 9999 * 1000)
+    assert result["b"] == [result["a"][-1]]
+    assert not state.points
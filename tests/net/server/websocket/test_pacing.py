@@ -0,0 +1,48 @@
+"""
+Test the 'net.server.websocket.pacing' module.
+"""
+
+# module under test
+from runtimepy.net.server.websocket.pacing import FramePacer
+
+
+def test_frame_pacer_basic():
+    """Test basic frame-pacer behavior."""
+
+    pacer = FramePacer()
+
+    # Uncongested connections respond to every frame.
+    for idx in range(10):
+        pacer.update(0, 1.0)
+        assert pacer.ready(idx * 16.0)
+    assert pacer.period_ms == 0.0
+    assert pacer.merged == 0
+
+    # Back off when the send buffer is deep.
+    pacer.update(pacer.high_water + 1)
+    assert pacer.period_ms > 0.0
+    for _ in range(20):
+        pacer.update(pacer.high_water + 1)
+    assert pacer.period_ms == pacer.max_period_ms
+
+    assert pacer.ready(10000.0)
+    assert not pacer.ready(10001.0)
+    assert pacer.merged == 1
+
+    # Recover once the buffer drains.
+    for _ in range(100):
+        pacer.update(0)
+    assert pacer.period_ms == 0.0
+
+    # Back off when round-trip time is high.
+    for _ in range(10):
+        pacer.update(0, pacer.max_rtt_ms * 4)
+    assert pacer.period_ms > 0.0
+
+    # Never respond faster than the base period.
+    pacer = FramePacer(base_period_ms=50.0)
+    pacer.update(0)
+    assert pacer.period_ms == 50.0
+    assert pacer.ready(0.0)
+    assert not pacer.ready(10.0)
+    assert pacer.ready(50.0)
@@ -0,0 +1,82 @@
+"""
+Test the 'net.server.websocket.points' module.
+"""
+
+# module under test
+from runtimepy.channel.environment import ChannelEnvironment
+from runtimepy.net.server.websocket.points import (
+    PointStreamEncoder,
+    decode_points,
+)
+from runtimepy.net.server.websocket.state import TabState
+from runtimepy.primitives import Bool, Double, Int8, Uint16, Uint64
+
+
+def test_point_stream_encoder():
+    """Test encoding and decoding binary point messages."""
+
+    encoder = PointStreamEncoder()
+    assert not list(encoder.encode())
+
+    assert encoder.add("tab", "a", Int8.kind, [(-1, 10), (2, 20), (3, 30)])
+    assert encoder.add("tab", "b", Double.kind, [(1.5, 11)])
+    assert encoder.add("other", "c", Bool.kind, [(True, 12), (False, 13)])
+    assert encoder.add("tab", "d", Uint64.kind, [(2**64 - 1, 14)])
+    assert not encoder.add("tab", "e", Int8.kind, [("ENUM", 15)])
+    assert not encoder.add("tab", "e", Int8.kind, [])
+
+    definitions, message = encoder.encode()
+    assert definitions.startswith(b"{")
+    assert len(message) % 8 == 0
+
+    result = decode_points(message)
+    assert [x.identifier for x in result] == [0, 1, 2, 3]
+    assert list(result[0].values) == [-1, 2, 3]
+    assert list(result[0].timestamps) == [10, 20, 30]
+    assert list(result[1].values) == [1.5]
+    assert list(result[2].values) == [1, 0]
+    assert list(result[3].values) == [2**64 - 1]
+
+    # Definitions are only sent once.
+    encoder.add("tab", "a", Int8.kind, [(4, 40)])
+    (message,) = encoder.encode()
+    assert decode_points(message)[0].identifier == 0
+
+
+def test_point_stream_encoder_scaled():
+    """Test encoding points for a scaled integer channel."""
+
+    env = ChannelEnvironment()
+    env.channel("a", Uint16(scaling=[0.0, 0.5]))
+    env.set("a", 1.5)
+
+    value = env.value("a")
+    assert value == 1.5
+
+    encoder = PointStreamEncoder()
+    assert encoder.add("tab", "a", Uint16.kind, [(value, 1), (2.0, 2)])
+
+    _, message = encoder.encode()
+    assert list(decode_points(message)[0].values) == [1.5, 2.0]
+
+
+def test_tab_state_stream():
+    """Test that plotted channel points can be streamed."""
+
+    state = TabState.create()
+    stream = PointStreamEncoder()
+
+    state.primitives["a"] = Double()
+    state.primitives["b"] = Double()
+    state.set_plotted("a", True)
+
+    state.add_point("a", (1.0, 1))
+    state.add_point("a", (2.0, 2))
+    state.add_point("b", (3.0, 3))
+
+    result = state.frame(0.0, name="tab", stream=stream)
+    assert result["values"] == {"a": 2.0}
+    assert result["points"] == {"b": [(3.0, 3)]}
+
+    _, message = stream.encode()
+    assert list(decode_points(message)[0].values) == [1.0, 2.0]
@@ -0,0 +1,56 @@
+"""
+Test the 'net.server.websocket.state' module.
+"""
+
+# module under test
+from runtimepy.net.server.websocket.state import TabStates
+
+
+def test_tab_states_active():
+    """Test that only shown tabs are visited on frames."""
+
+    states = TabStates()
+
+    for idx in range(100):
+        states[f"env{idx}"].add_point("a", (idx, idx))
+    assert len(states) == 100
+    assert not states.active
+
+    # Hidden tabs don't respond to frames.
+    assert not states.frame(0.0)
+
+    states["env1"].shown = True
+    states.update("env1")
+    states.update("not_a_tab")
+    assert list(states.active) == ["env1"]
+
+    result = states.frame(0.0)
+    assert list(result) == ["env1"]
+    assert result["env1"]["points"] == {"a": [(1, 1)]}
+
+    states["env1"].shown = False
+    states.update("env1")
+    assert not states.active
+
+
+def test_tab_states_hidden_points():
+    """Test that hidden tabs keep (bounded) points until they're shown."""
+
+    states = TabStates()
+    state = states["env"]
+
+    for idx in range(10 * state.decimation.max_buffered):
+        state.add_point("a", (idx, idx))
+    states.update("env")
+    assert not states.frame(0.0)
+
+    # Only the latest value is kept for channels that aren't plotted.
+    assert len(state.points["a"]) < state.decimation.max_buffered
+
+    state.shown = True
+    states.update("env")
+    result = states.frame(1.0)
+    assert result["env"]["points"]["a"][-1] == (idx, idx)
+
+    # Points were drained.
+    assert not states.frame(2.0)
@@ -15,11 +15,15 @@ from vcorelib.dict.codec import BasicDictCodec
 from runtimepy import PKG_NAME
 from runtimepy.control.step import ToggleStepper
 from runtimepy.message import JsonMessage
+from runtimepy.message.backend import BINARY_BACKENDS
 from runtimepy.net.arbiter.info import AppInfo
 from runtimepy.net.http.header import RequestHeader
 from runtimepy.net.http.response import ResponseHeader
 from runtimepy.net.server import RuntimepyServerConnection
-from runtimepy.net.server.websocket import RuntimepyWebsocketConnection
+from runtimepy.net.server.websocket import (
+    RuntimepyDataWebsocketConnection,
+    RuntimepyWebsocketConnection,
+)
 from runtimepy.net.stream import StringMessageConnection
 from runtimepy.net.stream.json import JsonMessageConnection
 from runtimepy.net.tcp.http import HttpConnection
@@ -36,7 +40,7 @@ from tests.resources import SampleArbiterTask
 async def sample_handler(
     response: ResponseHeader,
     request: RequestHeader,
-    request_data: Optional[bytes],
+    request_data: Optional[memoryview],
 ) -> Optional[bytes]:
     """Sample handler."""
 
@@ -109,7 +113,10 @@ async def runtimepy_http_test(app: AppInfo) -> int:
     await runtimepy_http_client_server(app, client, server)
 
     await runtimepy_websocket_client(
-        app.single(pattern="client", kind=RuntimepyWebsocketConnection)
+        app.single(pattern="client", kind=RuntimepyWebsocketConnection),
+        data=app.single(
+            pattern="client", kind=RuntimepyDataWebsocketConnection
+        ),
     )
 
     # Find stepper struct, toggle 'simualte_time' twice.
@@ -190,6 +197,10 @@ async def json_client_channel_commands(client: JsonMessageConnection) -> None:
 async def json_client_test(client: JsonMessageConnection) -> int:
     """Test a single JSON client."""
 
+    # Connected clients negotiate a binary encoding when one is available.
+    if client.remote_meta is not None and BINARY_BACKENDS:
+        assert client.processor.backend.name in BINARY_BACKENDS
+
     await json_client_channel_commands(client)
 
     client.send_json({})
@@ -17,6 +17,7 @@ from runtimepy.net import (
     sockname,
 )
 from runtimepy.net.manager import ConnectionManager
+from runtimepy.net.tcp.connection import NullTcpConnection
 
 # internal
 from tests.resources import SampleTcpConnection, run_async_test
@@ -235,3 +236,43 @@ async def test_tcp_connection_app():
 
     # For code coverage.
     await SampleTcpConnection.app(sig, port=0)
+
+
+@mark.asyncio
+async def test_tcp_connection_churn():
+    """Test that managed connections are dropped when they close."""
+
+    manager = ConnectionManager()
+    stop_sig = asyncio.Event()
+    accepted: list[NullTcpConnection] = []
+
+    def callback(conn: NullTcpConnection) -> None:
+        """Enqueue a new connection."""
+
+        accepted.append(conn)
+        manager.queue.put_nowait(conn)
+
+    count = 50
+    async with NullTcpConnection.serve(
+        callback, host="127.0.0.1", port=0
+    ) as server:
+        port = server.sockets[0].getsockname()[1]
+        managing = asyncio.create_task(manager.manage(stop_sig))
+
+        clients = await asyncio.gather(
+            *(asyncio.open_connection("127.0.0.1", port) for _ in range(count))
+        )
+        for _, writer in clients:
+            writer.close()
+
+        async def drained() -> None:
+            """Wait for every connection to be managed and then dropped."""
+
+            while len(accepted) < count or manager.num_connections:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(drained(), 10.0)
+        assert all(x.disabled for x in accepted)
+
+        stop_sig.set()
+        await asyncio.wait_for(managing, 5.0)
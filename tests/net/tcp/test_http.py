@@ -0,0 +1,174 @@
+"""
+Test the 'net.tcp.http' module.
+"""
+
+# built-in
+import asyncio
+import http
+from typing import Any, AsyncIterator, Optional
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.net.http.header import RequestHeader
+from runtimepy.net.http.response import ResponseHeader
+from runtimepy.net.tcp.http import HttpBody, HttpConnection
+
+CHUNK = bytes(range(256)) * 16
+
+
+async def stream_chunks(count: int) -> AsyncIterator[bytes]:
+    """Produce a body in pieces."""
+
+    for _ in range(count):
+        yield CHUNK
+        await asyncio.sleep(0)
+
+
+class SampleHttp(HttpConnection):
+    """A sample HTTP connection."""
+
+    async def get_handler(
+        self,
+        response: ResponseHeader,
+        request: RequestHeader,
+        request_data: Optional[memoryview],
+    ) -> Optional[HttpBody]:
+        """Sample handler."""
+
+        if request.target.path == "/stream":
+            return stream_chunks(64)
+
+        # Take longer than the keep-alive timeout.
+        if request.target.path == "/slow":
+            await asyncio.sleep(0.3)
+
+        return request.target.path.encode()
+
+    async def post_handler(
+        self,
+        response: ResponseHeader,
+        request: RequestHeader,
+        request_data: Optional[memoryview],
+    ) -> Optional[HttpBody]:
+        """Sample handler."""
+
+        return bytes(request_data) if request_data else None
+
+
+class ShortKeepAliveHttp(SampleHttp):
+    """A connection that doesn't stay idle for long."""
+
+    keep_alive_timeout = 0.1
+
+
+@mark.asyncio
+async def test_http_connection_pipelining():
+    """Test pipelined requests and chunked transfer coding."""
+
+    async with SampleHttp.create_pair(peer=SampleHttp) as (
+        server,
+        client,
+    ):
+        async with server.process_then_disable():
+            async with client.process_then_disable():
+                targets = ["/a", "/stream", "/b", "/c"]
+                responses = await asyncio.gather(
+                    *(client.request(RequestHeader(target=x)) for x in targets)
+                )
+                assert not client.expecting_response
+
+                for target, (header, body) in zip(targets, responses):
+                    assert header.status == http.HTTPStatus.OK
+                    assert header["connection"] == "keep-alive"
+
+                    if target == "/stream":
+                        assert header.chunked
+                        assert body == CHUNK * 64
+                    else:
+                        # Response bodies are copies of received data.
+                        assert isinstance(body, bytes)
+                        assert body.decode() == target
+
+                # Send a chunked request body.
+                _, body = await client.request(
+                    RequestHeader(method="POST"), stream_chunks(3)
+                )
+                assert body == CHUNK * 3
+
+                # Ask the server to close the connection.
+                request = RequestHeader(target="/close")
+                request["connection"] = "close"
+                header, body = await client.request(request)
+                assert header["connection"] == "close"
+                assert body == b"/close"
+
+                await asyncio.wait_for(server.disabled_event.wait(), 1.0)
+                await asyncio.wait_for(client.disabled_event.wait(), 1.0)
+
+
+@mark.asyncio
+async def test_http_connection_keep_alive_timeout():
+    """Test that idle connections are closed."""
+
+    async with ShortKeepAliveHttp.create_pair(peer=ShortKeepAliveHttp) as (
+        server,
+        client,
+    ):
+        async with server.process_then_disable():
+            async with client.process_then_disable():
+                header, _ = await client.request(RequestHeader())
+                assert header["keep-alive"] == "timeout=1"
+
+                # Connections aren't idle while handling requests.
+                header, body = await client.request(
+                    RequestHeader(target="/slow")
+                )
+                assert header.status == http.HTTPStatus.OK
+                assert body == b"/slow"
+
+                await asyncio.wait_for(server.disabled_event.wait(), 1.0)
+
+
+@mark.asyncio
+async def test_http_connection_idle_timeout():
+    """Test that connections without any requests are closed."""
+
+    async with ShortKeepAliveHttp.create_pair(peer=ShortKeepAliveHttp) as (
+        server,
+        client,
+    ):
+        async with server.process_then_disable():
+            async with client.process_then_disable():
+                await asyncio.wait_for(server.disabled_event.wait(), 1.0)
+                assert server.keep_alive_task is not None
+
+                # Clients don't time out.
+                assert client.keep_alive_task is None
+
+
+@mark.asyncio
+async def test_http_connection_malformed_request():
+    """Test that malformed requests are rejected."""
+
+    async with SampleHttp.create_pair(peer=SampleHttp) as (
+        server,
+        client,
+    ):
+        async with server.process_then_disable():
+            async with client.process_then_disable():
+                request = RequestHeader(method="POST")
+                request["transfer-encoding"] = "chunked"
+
+                # Wait for a response without sending a valid request.
+                result: asyncio.Future[tuple[ResponseHeader, Any]] = (
+                    asyncio.get_running_loop().create_future()
+                )
+                client.pending_responses.append(result)
+                client.send_binary(bytes(request) + b"zz\r\nhello\r\n")
+
+                header, _ = await asyncio.wait_for(result, 1.0)
+                assert header.status == http.HTTPStatus.BAD_REQUEST
+
+                await asyncio.wait_for(server.disabled_event.wait(), 1.0)
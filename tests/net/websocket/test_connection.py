@@ -51,6 +51,7 @@ async def test_websocket_connected_pair():
         conn1.send_text("Hello, World!")
         conn2.send_text("Hello, World!")
         conn1.send_text("stop")
+        assert conn1.queued_bytes == len("Hello, World!stop")
 
         await asyncio.wait(
             [
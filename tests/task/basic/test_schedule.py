@@ -0,0 +1,104 @@
+"""
+Test the 'task.basic.schedule' module.
+"""
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.metrics.jitter import JITTER_OVERFLOW
+from runtimepy.task.basic.schedule import (
+    MAX_CATCH_UP,
+    DeadlineScheduler,
+    OverrunPolicy,
+)
+
+# internal
+from tests.resources import SampleTask
+
+
+def test_deadline_scheduler_advance():
+    """Test deadline advancement and overrun policies."""
+
+    scheduler = DeadlineScheduler()
+    scheduler.start(0)
+
+    # Deadlines don't drift.
+    assert scheduler.advance(100, 50) == 100
+    assert scheduler.advance(100, 199) == 200
+    assert not scheduler.metrics.skipped.value
+
+    # Late deadlines are still serviced.
+    assert scheduler.advance(100, 320) == 300
+    assert not scheduler.metrics.skipped.value
+
+    # Overruns skip deadlines that were fully missed.
+    assert scheduler.advance(100, 650) == 600
+    assert scheduler.metrics.skipped.value == 2
+    assert scheduler.advance(100, 650) == 700
+
+    scheduler = DeadlineScheduler(policy="catch_up")
+    assert scheduler.policy is OverrunPolicy.CATCH_UP
+    scheduler.start(0)
+
+    # Missed deadlines are serviced back-to-back.
+    assert scheduler.advance(100, 450) == 100
+    assert scheduler.advance(100, 450) == 200
+    assert not scheduler.metrics.skipped.value
+
+    # Unless too far behind.
+    assert scheduler.advance(100, 100 * (MAX_CATCH_UP + 5)) == 100 * (
+        MAX_CATCH_UP + 5
+    )
+    assert scheduler.metrics.skipped.value == MAX_CATCH_UP + 2
+
+
+def test_jitter_metrics():
+    """Test jitter-histogram metrics."""
+
+    scheduler = DeadlineScheduler()
+    metrics = scheduler.metrics
+
+    metrics.record(0.0)
+    metrics.record(5e-4)
+    metrics.record(1.0)
+
+    assert metrics.histogram["le_10us"].value == 1
+    assert metrics.histogram["le_1ms"].value == 1
+    assert metrics.histogram[JITTER_OVERFLOW].value == 1
+    assert metrics.max_jitter_s.value == 1.0
+
+    metrics.reset()
+    assert not any(x.value for x in metrics.histogram.values())
+
+
+@mark.asyncio
+async def test_deadline_scheduler_wait():
+    """Test waiting for deadlines (with a busy-wait tail)."""
+
+    scheduler = DeadlineScheduler(spin_s=0.001)
+    scheduler.start()
+
+    for _ in range(5):
+        await scheduler.wait(0.002)
+
+    assert sum(x.value for x in scheduler.metrics.histogram.values()) == 5
+
+
+@mark.asyncio
+async def test_periodic_task_jitter_channels():
+    """Test that periodic tasks expose jitter metrics as channels."""
+
+    # Schedulers can also be created from keyword arguments.
+    task = SampleTask("sample", overrun_policy="catch_up", spin_s=0.0005)
+    assert task.scheduler.policy is OverrunPolicy.CATCH_UP
+    assert task.scheduler.spin_ns
+
+    task = SampleTask("sample", scheduler=DeadlineScheduler(spin_s=0.0005))
+    assert task.env.value("metrics.histogram.le_10us") == 0
+
+    await task.task(period_s=0.005)
+    assert await task.wait_iterations(1.0, count=5)
+    await task.stop()
+
+    assert sum(x.value for x in task.scheduler.metrics.histogram.values())
@@ -0,0 +1,180 @@
+"""
+Test the 'task.basic.shared' module.
+"""
+
+# built-in
+import asyncio
+import logging
+from time import perf_counter
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.net.arbiter import AppInfo, ConnectionArbiter
+from runtimepy.task import PeriodicTask, PeriodicTaskManager
+from runtimepy.task.basic.schedule import DeadlineScheduler
+from runtimepy.task.basic.shared import SharedTaskScheduler, TaskGroup
+
+# internal
+from tests.resources import OverrunTask, SampleTask, resource
+
+# Waits return as soon as their condition is met, this only bounds failures.
+TIMEOUT = 10.0
+
+
+class CountTask(SampleTask):
+    """A task that counts iterations."""
+
+    count = 0
+
+    async def dispatch(self) -> bool:
+        """Dispatch an iteration of this task."""
+
+        self.count += 1
+        return True
+
+
+class FailTask(SampleTask):
+    """A task that raises an exception."""
+
+    async def dispatch(self) -> bool:
+        """Dispatch an iteration of this task."""
+        raise ValueError("Nominal failure.")
+
+
+@mark.asyncio
+async def test_shared_task_scheduler_basic():
+    """Test basic interactions with a shared task scheduler."""
+
+    manager: PeriodicTaskManager[PeriodicTask] = PeriodicTaskManager(
+        shared=True
+    )
+
+    fast = [CountTask(f"fast{idx}") for idx in range(10)]
+    slow = [CountTask(f"slow{idx}") for idx in range(10)]
+    for task in fast:
+        assert manager.register(task, period_s=0.01)
+    for task in slow:
+        assert manager.register(task, period_s=0.05)
+
+    overrun = OverrunTask("overrun")
+    assert manager.register(overrun, period_s=0.01)
+    assert manager.register(FailTask("fail"), period_s=0.01)
+
+    async with manager.running():
+        scheduler = manager.scheduler
+        assert scheduler is not None
+
+        # Tasks with the same period are dispatched together.
+        assert len(scheduler.groups) == 2
+
+        assert await fast[-1].wait_iterations(TIMEOUT, count=5)
+        assert await overrun.wait_iterations(TIMEOUT, count=2)
+
+        # Failing tasks are disabled.
+        assert await manager["fail"].wait_for_disable(TIMEOUT)
+
+        # Tasks move when their period changes.
+        fast[0].set_period(0.02)
+        assert await fast[0].wait_iterations(TIMEOUT, count=2)
+        assert len(scheduler.groups) == 3
+
+        # Paused tasks don't dispatch (dispatches of these tasks complete
+        # synchronously, so none are in progress).
+        slow[0].paused.set()
+        count = slow[0].count
+        assert await slow[1].wait_iterations(TIMEOUT, count=2)
+        assert slow[0].count == count
+
+    assert manager.scheduler is None
+    assert all(x.count for x in fast)
+    assert not any(x.enabled for x in manager.tasks)
+
+
+def test_task_group_skipped():
+    """Test that skipped group deadlines are counted by member tasks."""
+
+    group = TaskGroup(100, 0)
+    task = CountTask("task")
+    group.tasks[task.name] = task
+
+    assert group.advance(50) == 100
+    assert group.advance(450) == 400
+    assert task.scheduler.metrics.skipped.value == 2
+
+    # Per-task policies don't apply to shared scheduling.
+    scheduler = SharedTaskScheduler()
+    scheduler.add(
+        CountTask("other", scheduler=DeadlineScheduler(policy="catch_up")),
+        period_s=0.01,
+    )
+    assert len(scheduler) == 1
+
+
+@mark.asyncio
+async def test_shared_task_scheduler_stop_sig():
+    """Test that shared-scheduler tasks stop when signaled."""
+
+    stop_sig = asyncio.Event()
+    scheduler = SharedTaskScheduler(stop_sig=stop_sig)
+
+    tasks = [CountTask(f"task{idx}") for idx in range(5)]
+    for task in tasks:
+        scheduler.add(task, period_s=0.01)
+    assert len(scheduler) == 5
+
+    runner = scheduler.start()
+    assert await tasks[0].wait_iterations(1.0)
+
+    stop_sig.set()
+    await asyncio.wait_for(runner, 1.0)
+    assert len(scheduler) == 0
+
+    await scheduler.stop()
+
+
+@mark.asyncio
+async def test_shared_task_scheduler_benchmark():
+    """Report dispatch rates for thousands of tasks."""
+
+    logger = logging.getLogger(__name__)
+
+    scheduler = SharedTaskScheduler()
+    tasks = [CountTask(f"task{idx}") for idx in range(2000)]
+    for idx, task in enumerate(tasks):
+        scheduler.add(task, period_s=0.01 * (1 + idx % 4))
+    assert len(scheduler.groups) == 4
+
+    start = perf_counter()
+    scheduler.start()
+    await asyncio.sleep(0.25)
+    await scheduler.stop()
+    elapsed = perf_counter() - start
+
+    dispatches = sum(x.count for x in tasks)
+    assert dispatches >= len(tasks)
+    logger.info(
+        "%d tasks: %.1f dispatches/s.", len(tasks), dispatches / elapsed
+    )
+
+
+async def shared_tasks_test_app(app: AppInfo) -> int:
+    """Test an application with a shared task scheduler."""
+
+    for task in app.tasks.values():
+        assert await task.wait_iterations(1.0, count=3)
+
+    return 0
+
+
+@mark.asyncio
+async def test_shared_task_scheduler_app():
+    """Test enabling the shared task scheduler from config."""
+
+    arbiter = ConnectionArbiter()
+    await arbiter.load_configs(
+        [resource("connection_arbiter", "shared_tasks.yaml")]
+    )
+    assert arbiter.task_manager.shared
+    assert await asyncio.wait_for(arbiter.app(), 30) == 0
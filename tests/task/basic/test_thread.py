@@ -0,0 +1,120 @@
+"""
+Test the 'task.basic.thread' module.
+"""
+
+# built-in
+import asyncio
+import threading
+
+# third-party
+from pytest import mark, raises
+
+# module under test
+from runtimepy.net.arbiter import AppInfo, ConnectionArbiter
+from runtimepy.task import PeriodicTaskManager
+
+# internal
+from tests.resources import SampleTask, resource
+
+
+class ThreadTask(SampleTask):
+    """A task that records the thread it runs on."""
+
+    thread_id = 0
+
+    async def dispatch(self) -> bool:
+        """Dispatch an iteration of this task."""
+
+        self.thread_id = threading.get_ident()
+        self.env["counter"] = self.env.value("counter") + 1  # type: ignore
+        return True
+
+    def _init_state(self) -> None:
+        """Add channels to this instance's channel environment."""
+        self.env.int_channel("counter")
+
+
+class FailThreadTask(SampleTask):
+    """A task that raises an exception."""
+
+    async def dispatch(self) -> bool:
+        """Dispatch an iteration of this task."""
+        raise ValueError("Nominal failure.")
+
+
+async def thread_ident() -> int:
+    """Get the current thread's identifier."""
+    return threading.get_ident()
+
+
+@mark.asyncio
+async def test_task_thread_basic():
+    """Test running tasks on dedicated threads."""
+
+    manager: PeriodicTaskManager[ThreadTask] = PeriodicTaskManager(shared=True)
+
+    task = ThreadTask("thread", worker="thread")
+    assert task.thread is not None
+    assert manager.register(task, period_s=0.01)
+    assert manager.register(ThreadTask("loop"), period_s=0.01)
+
+    # Channel callbacks are serviced on this thread.
+    changes: list[int] = []
+    chan, _ = task.env["counter"]
+    chan.raw.register_callback(
+        lambda _, __: changes.append(threading.get_ident())
+    )
+
+    async with manager.running():
+        assert await task.wait_iterations(1.0, count=3)
+        assert await manager["loop"].wait_iterations(1.0, count=3)
+
+        # Coroutines can be run on the task's thread.
+        assert await task.thread.call(thread_ident()) == task.thread_id
+
+        # Callbacks can be scheduled on this thread (from the task's
+        # thread).
+        main: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+
+        async def schedule() -> None:
+            """Schedule a callback on the main event loop."""
+
+            assert task.thread is not None
+            task.thread.call_soon_main(
+                lambda: main.set_result(threading.get_ident())
+            )
+
+        await task.thread.call(schedule())
+        assert await main == threading.get_ident()
+
+    assert task.thread_id != threading.get_ident()
+    assert manager["loop"].thread_id == threading.get_ident()
+    assert changes and set(changes) == {threading.get_ident()}
+
+    # Exceptions propagate.
+    fail = FailThreadTask("fail", worker="thread")
+    with raises(ValueError):
+        await asyncio.wait_for(await fail.task(period_s=0.01), 1.0)
+
+
+async def thread_tasks_test_app(app: AppInfo) -> int:
+    """Test an application with a task on a dedicated thread."""
+
+    assert app.tasks["a"].thread is None
+    assert app.tasks["b"].thread is not None
+
+    for task in app.tasks.values():
+        assert await task.wait_iterations(1.0, count=3)
+
+    return 0
+
+
+@mark.asyncio
+async def test_task_thread_app():
+    """Test configuring a task to run on a dedicated thread."""
+
+    arbiter = ConnectionArbiter()
+    await arbiter.load_configs(
+        [resource("connection_arbiter", "thread_tasks.yaml")]
+    )
+    assert await asyncio.wait_for(arbiter.app(), 30) == 0